@@ -11,6 +11,7 @@ This script tests the enhanced memory cleanup features including:
 import sys
 import os
 import asyncio
+import time
 from pathlib import Path
 
 # Add src to path
@@ -68,23 +69,22 @@ async def test_memory_cleanup():
     print("5️⃣ Testing memory leak detection...")
     
     # Add some fake memory usage data to simulate a leak
-    from datetime import datetime, timedelta
     from monitoring.memory_manager import MemoryUsageSnapshot
     
-    base_time = datetime.utcnow() - timedelta(minutes=30)
+    base_time = time.time() - 30 * 60
     base_memory = 100.0
     
     # Simulate increasing memory usage (potential leak)
     for i in range(15):
         fake_snapshot = MemoryUsageSnapshot(
-            timestamp=base_time + timedelta(minutes=i*2),
+            timestamp=base_time + i * 2 * 60,
             used_mb=1000.0 + i * 10,  # System memory
             available_mb=60000.0,
             total_mb=64000.0,
             percent_used=2.0,
             process_memory_mb=base_memory + i * 8  # Process memory increasing
         )
-        memory_manager.usage_history.append(fake_snapshot)
+        memory_manager.record_snapshot(fake_snapshot)
     
     leak_detection = memory_manager.detect_memory_leak()
     if leak_detection:
@@ -109,7 +109,7 @@ async def test_memory_cleanup():
     print("7️⃣ Testing optimization history...")
     print(f"   Total optimizations: {len(memory_manager.optimization_history)}")
     for i, opt in enumerate(memory_manager.optimization_history[-3:], 1):  # Last 3
-        print(f"   {i}. {opt.timestamp.strftime('%H:%M:%S')}: {opt.recovered_mb:.1f}MB recovered, {len(opt.actions_taken)} actions")
+        print(f"   {i}. {time.strftime('%H:%M:%S', time.gmtime(opt.timestamp))}: {opt.recovered_mb:.1f}MB recovered, {len(opt.actions_taken)} actions")
     print()
     
     # Test 8: Memory statistics with cleanup history
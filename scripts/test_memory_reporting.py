@@ -12,8 +12,8 @@ This script tests the memory reporting system including:
 import sys
 import os
 import asyncio
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -49,20 +49,25 @@ async def test_memory_reporting():
     # Test 2: Add some fake historical data
     print("2️⃣ Testing report with historical data...")
     
+    # Histories are kept in time order, so drop the live samples taken above
+    # before back-filling older fake data
+    memory_manager._trim_usage_history(0)
+    memory_manager._trim_optimization_history(0)
+    
     # Add fake usage history
-    base_time = datetime.utcnow() - timedelta(hours=2)
+    base_time = time.time() - 2 * 3600
     base_memory = 1000.0
     
     for i in range(20):
         fake_snapshot = MemoryUsageSnapshot(
-            timestamp=base_time + timedelta(minutes=i*6),
+            timestamp=base_time + i * 6 * 60,
             used_mb=2000.0 + i * 50,  # System memory gradually increasing
             available_mb=60000.0 - i * 50,
             total_mb=64000.0,
             percent_used=3.0 + i * 0.1,
             process_memory_mb=base_memory + i * 5  # Process memory increasing
         )
-        memory_manager.usage_history.append(fake_snapshot)
+        memory_manager.record_snapshot(fake_snapshot)
     
     # Add fake optimization history
     for i in range(3):
@@ -72,9 +77,9 @@ async def test_memory_reporting():
             recovered_mb=10.0,
             actions_taken=[f"cleanup_action_{i}", "gc_collect"],
             success=True,
-            timestamp=base_time + timedelta(minutes=i*30)
+            timestamp=base_time + i * 30 * 60
         )
-        memory_manager.optimization_history.append(fake_optimization)
+        memory_manager.record_optimization(fake_optimization)
     
     historical_report = memory_reporter.generate_report(2.0)  # 2 hours
     print(f"   Report period: {historical_report.report_period_hours} hours")
@@ -102,7 +107,7 @@ async def test_memory_reporting():
     decreasing_snapshots = []
     for i in range(10):
         snapshot = MemoryUsageSnapshot(
-            timestamp=datetime.utcnow() - timedelta(minutes=i*5),
+            timestamp=time.time() - (10 - i) * 5 * 60,
             used_mb=3000.0 - i * 100,  # Decreasing
             available_mb=60000.0,
             total_mb=64000.0,
@@ -111,14 +116,16 @@ async def test_memory_reporting():
         )
         decreasing_snapshots.append(snapshot)
     
-    trend = memory_reporter._calculate_trend(decreasing_snapshots)
+    trend = memory_reporter._calculate_trend(
+        [s.timestamp for s in decreasing_snapshots], [s.used_mb for s in decreasing_snapshots]
+    )
     print(f"   Decreasing trend test: {trend}")
     
     # Create stable trend data
     stable_snapshots = []
     for i in range(10):
         snapshot = MemoryUsageSnapshot(
-            timestamp=datetime.utcnow() - timedelta(minutes=i*5),
+            timestamp=time.time() - (10 - i) * 5 * 60,
             used_mb=2000.0 + (i % 2) * 10,  # Stable with minor fluctuation
             available_mb=60000.0,
             total_mb=64000.0,
@@ -127,7 +134,9 @@ async def test_memory_reporting():
         )
         stable_snapshots.append(snapshot)
     
-    trend = memory_reporter._calculate_trend(stable_snapshots)
+    trend = memory_reporter._calculate_trend(
+        [s.timestamp for s in stable_snapshots], [s.used_mb for s in stable_snapshots]
+    )
     print(f"   Stable trend test: {trend}")
     print()
     
@@ -155,8 +164,8 @@ async def test_memory_reporting():
     # Test 7: Test optimization analysis
     print("7️⃣ Testing optimization analysis...")
     opt_analysis = memory_reporter._analyze_optimization_history(
-        datetime.utcnow() - timedelta(hours=2),
-        datetime.utcnow()
+        time.time() - 2 * 3600,
+        time.time()
     )
     print(f"   Optimizations found: {opt_analysis['count']}")
     print(f"   Total recovered: {opt_analysis['total_recovered_mb']:.1f}MB")
@@ -1,3 +1,5 @@
+import asyncio
+import gc
 import logging
 import time
 import os
@@ -140,6 +142,7 @@ def create_app() -> FastAPI:
             # Initialize performance degradation detector
             from src.monitoring.metrics import get_performance_degradation_detector
             degradation_detector = get_performance_degradation_detector()
+            degradation_detector.start_background_analysis()
             structured_logger.info("Performance degradation detector initialized")
             
             # Initialize intelligent alerting engine
@@ -211,6 +214,12 @@ def create_app() -> FastAPI:
             )
             # Don't fail startup if monitoring fails
         
+        # Objects created during startup (modules, routers, singletons) live for
+        # the whole process; move them out of the collector's reach so later
+        # collections do not keep rescanning them.
+        gc.collect()
+        gc.freeze()
+
         # Запуск планировщика
         init_scheduler(app)
 
@@ -233,6 +242,12 @@ def create_app() -> FastAPI:
                 if structured_logger:
                     structured_logger.info("Configuration hot reloader stopped")
             
+            # Stop background degradation analysis; joining the thread and
+            # the final flush block, so keep them off the event loop
+            degradation_detector = getattr(app.state, "degradation_detector", None)
+            if degradation_detector:
+                await asyncio.to_thread(degradation_detector.stop_background_analysis)
+            
             # Cleanup alert manager
             from src.monitoring.alert_manager import get_alert_manager
             alert_manager = get_alert_manager()
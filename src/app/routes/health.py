@@ -7,6 +7,7 @@ including scheduler, resources, APIs, and overall system health.
 
 import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
@@ -610,17 +611,20 @@ async def get_system_alerts(
     """
     try:
         system_health = await health_monitor.get_comprehensive_health_async()
-        alerts = system_health.get_all_alerts()
         
-        # Apply filters
-        if level:
-            alerts = [alert for alert in alerts if alert.level.value == level.lower()]
-        
-        if component:
-            alerts = [alert for alert in alerts if component.lower() in alert.component.lower()]
+        # Apply filters while selecting the newest alerts, so only the
+        # matching ones are ranked
+        predicate = None
+        if level or component:
+            level_value = level.lower() if level else None
+            component_value = component.lower() if component else None
+            
+            def predicate(alert):
+                if level_value and alert.level.value != level_value:
+                    return False
+                return not component_value or component_value in alert.component.lower()
         
-        # Limit results
-        alerts = alerts[:limit]
+        alerts = system_health.get_recent_alerts(limit, predicate)
         
         # Format response
         formatted_alerts = [
@@ -635,14 +639,15 @@ async def get_system_alerts(
             for alert in alerts
         ]
         
+        level_counts = Counter(alert["level"] for alert in formatted_alerts)
         return {
             "alerts": formatted_alerts,
             "summary": {
                 "total_alerts": len(formatted_alerts),
-                "critical_alerts": len([a for a in formatted_alerts if a["level"] == "critical"]),
-                "error_alerts": len([a for a in formatted_alerts if a["level"] == "error"]),
-                "warning_alerts": len([a for a in formatted_alerts if a["level"] == "warning"]),
-                "info_alerts": len([a for a in formatted_alerts if a["level"] == "info"])
+                "critical_alerts": level_counts["critical"],
+                "error_alerts": level_counts["error"],
+                "warning_alerts": level_counts["warning"],
+                "info_alerts": level_counts["info"]
             },
             "filters_applied": {
                 "level": level,
@@ -701,13 +706,11 @@ async def get_health_status_summary():
     try:
         system_health = await health_monitor.get_comprehensive_health_async()
         
-        # Count alerts by level
-        all_alerts = system_health.get_all_alerts()
+        # Count alerts by level in a single pass
+        level_counts = Counter(a.level.value for a in system_health.get_all_alerts())
         alert_counts = {
-            "critical": len([a for a in all_alerts if a.level.value == "critical"]),
-            "error": len([a for a in all_alerts if a.level.value == "error"]),
-            "warning": len([a for a in all_alerts if a.level.value == "warning"]),
-            "info": len([a for a in all_alerts if a.level.value == "info"])
+            level: level_counts[level]
+            for level in ("critical", "error", "warning", "info")
         }
         
         # Get component status summary
@@ -1419,7 +1422,7 @@ async def trigger_memory_optimization(component: Optional[str] = Query(None, des
     Can target specific components or perform comprehensive cleanup.
     """
     try:
-        from src.monitoring.memory_manager import get_memory_manager
+        from src.monitoring.memory_manager import format_timestamp, get_memory_manager
         
         memory_manager = get_memory_manager()
         
@@ -1427,8 +1430,8 @@ async def trigger_memory_optimization(component: Optional[str] = Query(None, des
             # Use targeted cleanup
             optimization_result = memory_manager.perform_targeted_cleanup(component)
         else:
-            # Use basic garbage collection
-            optimization_result = memory_manager.perform_garbage_collection()
+            # Use basic garbage collection (full sweep on explicit request)
+            optimization_result = memory_manager.perform_garbage_collection(full=True)
         
         return {
             "success": optimization_result.success,
@@ -1437,7 +1440,7 @@ async def trigger_memory_optimization(component: Optional[str] = Query(None, des
             "recovered_mb": optimization_result.recovered_mb,
             "actions_taken": optimization_result.actions_taken,
             "component": component or "basic_gc",
-            "timestamp": optimization_result.timestamp.isoformat()
+            "timestamp": format_timestamp(optimization_result.timestamp)
         }
         
     except Exception as e:
@@ -1552,10 +1555,16 @@ async def trigger_memory_report_logging(hours: float = Query(1.0, description="N
         from src.monitoring.memory_reporter import get_memory_reporter
         
         memory_reporter = get_memory_reporter()
-        memory_reporter.log_memory_report(hours)
+        logged = memory_reporter.log_memory_report(hours)
+        
+        if logged:
+            message = f"Memory report logged for {hours} hours period"
+        else:
+            message = f"Memory report for {hours} hours period not logged (unchanged since the last one, or generation failed)"
         
         return {
-            "message": f"Memory report logged for {hours} hours period",
+            "message": message,
+            "logged": logged,
             "timestamp": datetime.utcnow().isoformat()
         }
         
@@ -41,6 +41,7 @@ class MonitoringSettings(BaseSettings):
     resource_check_interval: int = Field(default=60, description="Resource check interval in seconds")
     performance_check_interval: int = Field(default=120, description="Performance check interval in seconds")
     alert_cooldown: int = Field(default=300, description="Alert cooldown period in seconds")
+    min_resource_interval: float = Field(default=1.0, description="Minimum interval between fresh resource samples in seconds")
     
     # Resource thresholds
     memory_warning_threshold: float = Field(default=1400.0, description="Memory warning threshold in MB")
@@ -133,6 +134,7 @@ class ConfigurationManager:
             resource_check_interval=config_dict["resource_check_interval"],
             performance_check_interval=config_dict["performance_check_interval"],
             alert_cooldown=config_dict["alert_cooldown"],
+            min_resource_interval=config_dict["min_resource_interval"],
             memory_warning_threshold=config_dict["memory_warning_threshold"],
             memory_critical_threshold=config_dict["memory_critical_threshold"],
             cpu_warning_threshold=config_dict["cpu_warning_threshold"],
@@ -98,9 +98,11 @@ class HealthMonitor:
         performance_tracker = get_performance_tracker()
         performance_tracker.record_api_call(service, response_time, success, error)
     
-    async def monitor_scheduler_health(self) -> SchedulerHealth:
+    async def monitor_scheduler_health(self, now: Optional[datetime] = None) -> SchedulerHealth:
         """Monitor scheduler component health."""
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
+        checked_at = now
         alerts = []
         
         # Import scheduler health monitor
@@ -273,16 +275,18 @@ class HealthMonitor:
             error_rate=error_rate,
             active_jobs=active_jobs,
             failed_jobs_last_hour=failed_jobs,
-            alerts=alerts
+            alerts=alerts,
+            last_check=checked_at
         )
     
     async def monitor_resource_usage(self) -> ResourceHealth:
         """Monitor system resource usage."""
         return self.metrics_collector.collect_resource_metrics()
     
-    async def monitor_api_health(self, service: str = "dexscreener") -> APIHealth:
+    async def monitor_api_health(self, service: str = "dexscreener", now: Optional[datetime] = None) -> APIHealth:
         """Monitor external API health."""
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
         history = self._api_call_history.get(service, [])
         
         if not history:
@@ -296,7 +300,8 @@ class HealthMonitor:
                 cache_hit_rate=0.0,
                 requests_per_minute=0.0,
                 last_successful_call=None,
-                consecutive_failures=0
+                consecutive_failures=0,
+                last_check=now
             )
         
         # Analyze recent calls (last 10 minutes)
@@ -314,7 +319,8 @@ class HealthMonitor:
                 cache_hit_rate=0.0,
                 requests_per_minute=0.0,
                 last_successful_call=None,
-                consecutive_failures=0
+                consecutive_failures=0,
+                last_check=now
             )
         
         # Calculate metrics
@@ -431,7 +437,8 @@ class HealthMonitor:
             requests_per_minute=requests_per_minute,
             last_successful_call=last_successful_call,
             consecutive_failures=consecutive_failures,
-            alerts=alerts
+            alerts=alerts,
+            last_check=now
         )
     
     def get_comprehensive_health(self) -> SystemHealth:
@@ -446,10 +453,13 @@ class HealthMonitor:
     
     async def _get_comprehensive_health_async(self) -> SystemHealth:
         """Internal async method for getting comprehensive health."""
+        # One clock reading stamps the snapshot and every check in it
+        now = datetime.utcnow()
+        
         # Gather all health checks concurrently
-        scheduler_health_task = self.monitor_scheduler_health()
+        scheduler_health_task = self.monitor_scheduler_health(now)
         resource_health_task = self.monitor_resource_usage()
-        api_health_task = self.monitor_api_health("dexscreener")
+        api_health_task = self.monitor_api_health("dexscreener", now)
         
         scheduler_health, resource_health, api_health = await asyncio.gather(
             scheduler_health_task, resource_health_task, api_health_task
@@ -472,7 +482,8 @@ class HealthMonitor:
             resources=resource_health,
             apis={"dexscreener": api_health},
             uptime_seconds=uptime_seconds,
-            last_restart=self._last_restart
+            last_restart=self._last_restart,
+            timestamp=now
         )
     
     def _calculate_avg_processing_time(self, group: str) -> float:
@@ -8,27 +8,43 @@ and memory leak detection to prevent false alerts and optimize memory usage.
 import gc
 import logging
 import psutil
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import deque
+from statistics import fmean
 
 from .models import HealthAlert, AlertLevel
 from .config import get_monitoring_config_manager
+from .rolling_stats import RingBuffer, RollingStats
 
 log = logging.getLogger("memory_manager")
 
 
+def format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """Format a unix timestamp as a naive UTC ISO-8601 string."""
+    if timestamp is None:
+        return None
+    return datetime.utcfromtimestamp(timestamp).isoformat()
+
+
 @dataclass
 class MemoryUsageSnapshot:
-    """Snapshot of memory usage at a specific time."""
-    timestamp: datetime
+    """Snapshot of memory usage at a specific time (unix timestamp)."""
+    timestamp: float
     used_mb: float
     available_mb: float
     total_mb: float
     percent_used: float
     process_memory_mb: float
+    # Derived once at creation; note this is used/total, while percent_used is
+    # psutil's (total - available)/total
+    used_percent: float = field(init=False)
+    
+    def __post_init__(self):
+        self.used_percent = (self.used_mb / self.total_mb) * 100 if self.total_mb else 0.0
 
 
 @dataclass
@@ -39,7 +55,41 @@ class MemoryOptimizationResult:
     recovered_mb: float
     actions_taken: List[str]
     success: bool
-    timestamp: datetime
+    timestamp: float  # unix timestamp
+    # Timestamp formatting is the costly part of serializing, so do it once;
+    # results are never modified after they are recorded
+    formatted_timestamp: Optional[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.formatted_timestamp = format_timestamp(self.timestamp)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result for memory statistics."""
+        return {
+            "timestamp": self.formatted_timestamp,
+            "recovered_mb": self.recovered_mb,
+            "success": self.success,
+            "actions": list(self.actions_taken)
+        }
+    
+    def to_report_entry(self) -> Dict[str, Any]:
+        """Summarize the result for a memory report's optimization history."""
+        return {
+            "timestamp": self.formatted_timestamp,
+            "recovered_mb": self.recovered_mb,
+            "success": self.success,
+            "actions_count": len(self.actions_taken)
+        }
+
+
+@dataclass
+class UsageBucket:
+    """Aggregate of the used-memory samples recorded within one minute."""
+    minute: float  # unix timestamp of the start of the minute
+    count: int
+    total_mb: float
+    min_mb: float
+    max_mb: float
 
 
 class IntelligentMemoryManager:
@@ -56,14 +106,45 @@ class IntelligentMemoryManager:
     def __init__(self):
         self.config_manager = get_monitoring_config_manager()
         
-        # Memory usage history for pattern analysis
-        self.usage_history: deque = deque(maxlen=100)
+        # Memory usage history for pattern analysis, stored column-wise: one
+        # typed ring buffer per field instead of one object per sample.
+        # Samples are append-only in time order, so time windows can be
+        # located by bisecting usage_timestamps. Readings are quantized to
+        # 0.1 MB / 0.01 % in unsigned ints (4 / 2 bytes per sample instead of
+        # 8); threshold checks always use a fresh snapshot, never these.
+        self.usage_history_size = 100
+        self.usage_timestamps = RingBuffer(self.usage_history_size)
+        self.usage_used_mb = RingBuffer(self.usage_history_size, "I", scale=0.1)
+        self.usage_available_mb = RingBuffer(self.usage_history_size, "I", scale=0.1)
+        self.usage_total_mb = RingBuffer(self.usage_history_size, "I", scale=0.1)
+        self.usage_percent_used = RingBuffer(self.usage_history_size, "H", scale=0.01)
+        self.usage_process_mb = RingBuffer(self.usage_history_size, "I", scale=0.1)
+        # Running aggregates of used_mb over exactly the retained samples
+        self.usage_stats = RollingStats(window=self.usage_history_size)
+        # Same over the last 5 samples, for the statistics usage trend
+        self.recent_usage_stats = RollingStats(window=5)
+        # Per-minute aggregates so long report windows walk buckets instead of
+        # samples. A bucket is dropped once all of its samples have been evicted.
+        self.usage_minute_buckets: deque = deque()
+        
         self.optimization_history: List[MemoryOptimizationResult] = []
+        self.optimization_timestamps: List[float] = []
+        # Running aggregates over optimization_history: total positive recovery
+        # and the result that recovered the most
+        self.optimization_recovered_mb = 0.0
+        self.best_optimization: Optional[MemoryOptimizationResult] = None
+        # Bumped whenever optimization history changes or history is trimmed,
+        # so cached reports built from the old state can be recognised as stale
+        self.generation = 0
         
         # System memory info
         self.total_system_memory_gb = psutil.virtual_memory().total / (1024**3)
         self.total_system_memory_mb = psutil.virtual_memory().total / (1024**2)
         
+        # Threshold percentages only change when thresholds or total memory do:
+        # (warning_mb, critical_mb, total_mb) -> (warning_percent, critical_percent)
+        self._threshold_percent_cache: Optional[Tuple[Tuple[float, float, float], Tuple[float, float]]] = None
+        
         # Dynamic thresholds
         self._current_warning_threshold_mb = None
         self._current_critical_threshold_mb = None
@@ -74,7 +155,7 @@ class IntelligentMemoryManager:
         self._leak_detection_samples = deque(maxlen=20)
         
         # Optimization state
-        self._last_gc_time = None
+        self._last_gc_time = None  # unix timestamp of the last GC run
         self._gc_cooldown_seconds = 60  # Don't run GC more than once per minute
         
         log.info(
@@ -97,7 +178,7 @@ class IntelligentMemoryManager:
             process_memory_mb = 0.0
         
         snapshot = MemoryUsageSnapshot(
-            timestamp=datetime.utcnow(),
+            timestamp=time.time(),
             used_mb=system_memory.used / (1024**2),
             available_mb=system_memory.available / (1024**2),
             total_mb=system_memory.total / (1024**2),
@@ -105,11 +186,108 @@ class IntelligentMemoryManager:
             process_memory_mb=process_memory_mb
         )
         
-        # Add to history
-        self.usage_history.append(snapshot)
+        self.record_snapshot(snapshot)
         
         return snapshot
     
+    @property
+    def usage_history(self) -> List[MemoryUsageSnapshot]:
+        """Retained usage samples as snapshot objects, oldest first.
+        
+        Snapshots are rebuilt from the column store on every access; analysis
+        code should read the columns directly.
+        """
+        return [
+            MemoryUsageSnapshot(*fields)
+            for fields in zip(
+                self.usage_timestamps,
+                self.usage_used_mb,
+                self.usage_available_mb,
+                self.usage_total_mb,
+                self.usage_percent_used,
+                self.usage_process_mb,
+            )
+        ]
+    
+    def record_snapshot(self, snapshot: MemoryUsageSnapshot):
+        """Append a snapshot to the usage history and its running aggregates."""
+        self.usage_timestamps.append(snapshot.timestamp)
+        self.usage_used_mb.append(snapshot.used_mb)
+        self.usage_available_mb.append(snapshot.available_mb)
+        self.usage_total_mb.append(snapshot.total_mb)
+        self.usage_percent_used.append(snapshot.percent_used)
+        self.usage_process_mb.append(snapshot.process_memory_mb)
+        self.usage_stats.push(snapshot.used_mb)
+        self.recent_usage_stats.push(snapshot.used_mb)
+        self._update_minute_bucket(snapshot.timestamp, snapshot.used_mb)
+        self._prune_minute_buckets()
+    
+    def _update_minute_bucket(self, timestamp: float, used_mb: float):
+        """Fold a sample into the bucket for its minute."""
+        minute = timestamp - timestamp % 60
+        buckets = self.usage_minute_buckets
+        if buckets and buckets[-1].minute == minute:
+            bucket = buckets[-1]
+            bucket.count += 1
+            bucket.total_mb += used_mb
+            if used_mb < bucket.min_mb:
+                bucket.min_mb = used_mb
+            if used_mb > bucket.max_mb:
+                bucket.max_mb = used_mb
+        else:
+            buckets.append(UsageBucket(minute, 1, used_mb, used_mb, used_mb))
+    
+    def _prune_minute_buckets(self):
+        """Drop buckets whose samples have all left the usage history."""
+        buckets = self.usage_minute_buckets
+        if not self.usage_timestamps:
+            buckets.clear()
+            return
+        oldest = self.usage_timestamps[0]
+        oldest_minute = oldest - oldest % 60
+        while buckets and buckets[0].minute < oldest_minute:
+            buckets.popleft()
+    
+    def _trim_usage_history(self, keep: int):
+        """Drop the oldest usage samples until at most ``keep`` remain."""
+        while len(self.usage_timestamps) > keep:
+            self.usage_timestamps.popleft()
+            self.usage_used_mb.popleft()
+            self.usage_available_mb.popleft()
+            self.usage_total_mb.popleft()
+            self.usage_percent_used.popleft()
+            self.usage_process_mb.popleft()
+        self.usage_stats.trim(keep)
+        self.recent_usage_stats.trim(keep)
+        self._prune_minute_buckets()
+        self.generation += 1
+    
+    def record_optimization(self, result: MemoryOptimizationResult):
+        """Append an optimization result to the optimization history."""
+        self.optimization_history.append(result)
+        self.optimization_timestamps.append(result.timestamp)
+        self._add_optimization_aggregates(result)
+        self.generation += 1
+    
+    def _add_optimization_aggregates(self, result: MemoryOptimizationResult):
+        if result.recovered_mb > 0:
+            self.optimization_recovered_mb += result.recovered_mb
+            if self.best_optimization is None or result.recovered_mb > self.best_optimization.recovered_mb:
+                self.best_optimization = result
+    
+    def _trim_optimization_history(self, keep: int):
+        """Keep only the ``keep`` most recent optimization results."""
+        drop = max(len(self.optimization_history) - keep, 0)
+        del self.optimization_history[:drop]
+        del self.optimization_timestamps[:drop]
+        
+        # Trimming is rare, so rebuild the aggregates rather than un-applying them
+        self.optimization_recovered_mb = 0.0
+        self.best_optimization = None
+        for result in self.optimization_history:
+            self._add_optimization_aggregates(result)
+        self.generation += 1
+    
     def calculate_dynamic_thresholds(self) -> Tuple[float, float]:
         """
         Calculate dynamic memory thresholds based on system capacity and usage patterns.
@@ -138,9 +316,9 @@ class IntelligentMemoryManager:
         base_critical_mb = (self.total_system_memory_mb * critical_percent) / 100
         
         # Adjust based on usage patterns if we have enough history
-        if len(self.usage_history) >= 10:
-            recent_usage = [s.used_mb for s in list(self.usage_history)[-10:]]
-            avg_usage = sum(recent_usage) / len(recent_usage)
+        if len(self.usage_used_mb) >= 10:
+            recent_usage = self.usage_used_mb.tail(10)
+            avg_usage = fmean(recent_usage)
             max_usage = max(recent_usage)
             
             # If average usage is much lower than thresholds, we can be more conservative
@@ -248,18 +426,22 @@ class IntelligentMemoryManager:
         
         return False
     
-    def perform_garbage_collection(self) -> MemoryOptimizationResult:
+    def perform_garbage_collection(self, full: bool = False) -> MemoryOptimizationResult:
         """
         Perform garbage collection and return optimization results.
         
+        Args:
+            full: Run a full (generation 2) collection. Routine runs only sweep
+                the young generations, which avoids long pauses on a large heap.
+        
         Returns:
             MemoryOptimizationResult with details of the optimization
         """
-        now = datetime.utcnow()
+        now = time.time()
         
         # Check cooldown
         if (self._last_gc_time and 
-            now - self._last_gc_time < timedelta(seconds=self._gc_cooldown_seconds)):
+            now - self._last_gc_time < self._gc_cooldown_seconds):
             return MemoryOptimizationResult(
                 before_mb=0,
                 after_mb=0,
@@ -277,8 +459,9 @@ class IntelligentMemoryManager:
         
         try:
             # Force garbage collection
-            collected_objects = gc.collect()
-            actions_taken.append(f"gc_collect_freed_{collected_objects}_objects")
+            generation = 2 if full else 1
+            collected_objects = gc.collect(generation)
+            actions_taken.append(f"gc_collect_gen{generation}_freed_{collected_objects}_objects")
             
             # Clear any internal caches if available
             try:
@@ -302,17 +485,16 @@ class IntelligentMemoryManager:
             
             # Clear monitoring history if it's getting too large
             try:
-                if len(self.usage_history) > 50:
-                    old_size = len(self.usage_history)
+                if len(self.usage_timestamps) > 50:
+                    old_size = len(self.usage_timestamps)
                     # Keep only last 25 entries
-                    while len(self.usage_history) > 25:
-                        self.usage_history.popleft()
-                    actions_taken.append(f"trimmed_usage_history_{old_size}_to_{len(self.usage_history)}")
+                    self._trim_usage_history(25)
+                    actions_taken.append(f"trimmed_usage_history_{old_size}_to_{len(self.usage_timestamps)}")
                 
                 if len(self.optimization_history) > 20:
                     old_size = len(self.optimization_history)
                     # Keep only last 10 entries
-                    self.optimization_history = self.optimization_history[-10:]
+                    self._trim_optimization_history(10)
                     actions_taken.append(f"trimmed_optimization_history_{old_size}_to_{len(self.optimization_history)}")
             except Exception as e:
                 actions_taken.append(f"history_trim_error_{str(e)[:50]}")
@@ -348,7 +530,7 @@ class IntelligentMemoryManager:
                 timestamp=now
             )
             
-            self.optimization_history.append(result)
+            self.record_optimization(result)
             
             log.info(
                 "garbage_collection_completed",
@@ -386,42 +568,46 @@ class IntelligentMemoryManager:
         Returns:
             Dictionary with leak detection results or None if no leak detected
         """
-        if len(self.usage_history) < 10:
+        usage_process_mb = self.usage_process_mb
+        if len(usage_process_mb) < 10:
             return None
         
         # Analyze recent memory usage trend
-        recent_snapshots = list(self.usage_history)[-10:]
-        memory_values = [s.process_memory_mb for s in recent_snapshots]
-        
-        # Calculate trend
-        if len(memory_values) >= 5:
-            # Simple linear trend calculation
-            x_values = list(range(len(memory_values)))
-            n = len(memory_values)
-            
-            sum_x = sum(x_values)
-            sum_y = sum(memory_values)
-            sum_xy = sum(x * y for x, y in zip(x_values, memory_values))
-            sum_x2 = sum(x * x for x in x_values)
-            
-            # Calculate slope (trend)
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-            
-            # If slope is positive and significant, might indicate a leak
-            if slope > 5:  # More than 5MB increase per measurement
-                min_memory = min(memory_values)
-                max_memory = max(memory_values)
-                increase_percent = ((max_memory - min_memory) / min_memory) * 100
-                
-                if increase_percent > 20:  # More than 20% increase
-                    return {
-                        "detected": True,
-                        "slope_mb_per_measurement": slope,
-                        "total_increase_mb": max_memory - min_memory,
-                        "increase_percent": increase_percent,
-                        "timespan_minutes": (recent_snapshots[-1].timestamp - recent_snapshots[0].timestamp).total_seconds() / 60,
-                        "recommendation": "investigate_memory_usage"
-                    }
+        memory_values = usage_process_mb.tail(10)
+        n = len(memory_values)
+        
+        # Simple linear trend calculation in a single pass
+        sum_y = 0.0
+        sum_xy = 0.0
+        min_memory = max_memory = memory_values[0]
+        for x, y in enumerate(memory_values):
+            sum_y += y
+            sum_xy += x * y
+            if y < min_memory:
+                min_memory = y
+            elif y > max_memory:
+                max_memory = y
+        
+        # x takes the values 0..n-1, so its sums are closed-form
+        sum_x = n * (n - 1) / 2
+        sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+        
+        # Calculate slope (trend)
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+        
+        # If slope is positive and significant, might indicate a leak
+        if slope > 5:  # More than 5MB increase per measurement
+            increase_percent = ((max_memory - min_memory) / min_memory) * 100
+            
+            if increase_percent > 20:  # More than 20% increase
+                return {
+                    "detected": True,
+                    "slope_mb_per_measurement": slope,
+                    "total_increase_mb": max_memory - min_memory,
+                    "increase_percent": increase_percent,
+                    "timespan_minutes": (self.usage_timestamps[-1] - self.usage_timestamps[-n]) / 60,
+                    "recommendation": "investigate_memory_usage"
+                }
         
         return None
     
@@ -435,7 +621,7 @@ class IntelligentMemoryManager:
         Returns:
             MemoryOptimizationResult with cleanup details
         """
-        now = datetime.utcnow()
+        now = time.time()
         before_snapshot = self.get_current_memory_snapshot()
         before_mb = before_snapshot.process_memory_mb
         
@@ -468,8 +654,8 @@ class IntelligentMemoryManager:
                 self._cleanup_monitoring_history()
                 actions_taken.append("cleaned_monitoring_history")
                 
-                # 4. Force garbage collection
-                collected = gc.collect()
+                # 4. Force full garbage collection
+                collected = gc.collect(2)
                 actions_taken.append(f"gc_collected_{collected}_objects")
                 
                 # 5. Try to release memory to OS
@@ -515,7 +701,7 @@ class IntelligentMemoryManager:
                 timestamp=now
             )
             
-            self.optimization_history.append(result)
+            self.record_optimization(result)
             
             log.info(
                 "targeted_cleanup_completed",
@@ -549,13 +735,12 @@ class IntelligentMemoryManager:
     def _cleanup_monitoring_history(self):
         """Clean up monitoring history to free memory."""
         # Trim usage history
-        if len(self.usage_history) > 25:
-            while len(self.usage_history) > 25:
-                self.usage_history.popleft()
+        if len(self.usage_timestamps) > 25:
+            self._trim_usage_history(25)
         
         # Trim optimization history
         if len(self.optimization_history) > 10:
-            self.optimization_history = self.optimization_history[-10:]
+            self._trim_optimization_history(10)
         
         # Clear leak detection samples
         if len(self._leak_detection_samples) > 10:
@@ -705,20 +890,32 @@ class IntelligentMemoryManager:
         
         return len(alerts) > 0, alerts
     
+    def _threshold_percents(self, warning_mb: float, critical_mb: float, total_mb: float) -> Tuple[float, float]:
+        """Warning/critical thresholds as percentages of total memory, memoized."""
+        key = (warning_mb, critical_mb, total_mb)
+        cached = self._threshold_percent_cache
+        if cached is None or cached[0] != key:
+            cached = (key, ((warning_mb / total_mb) * 100, (critical_mb / total_mb) * 100))
+            self._threshold_percent_cache = cached
+        return cached[1]
+    
     def get_memory_statistics(self) -> Dict[str, Any]:
         """Get comprehensive memory statistics and optimization history."""
         snapshot = self.get_current_memory_snapshot()
         config = self.config_manager.get_monitoring_config()
+        warning_percent, critical_percent = self._threshold_percents(
+            config.memory_warning_threshold, config.memory_critical_threshold, snapshot.total_mb
+        )
         
         # Calculate usage trends if we have history
         usage_trend = None
-        if len(self.usage_history) >= 5:
-            recent_usage = [s.used_mb for s in list(self.usage_history)[-5:]]
+        recent = self.recent_usage_stats
+        if recent.count >= 5:
             usage_trend = {
-                "average_mb": sum(recent_usage) / len(recent_usage),
-                "min_mb": min(recent_usage),
-                "max_mb": max(recent_usage),
-                "trend_direction": "increasing" if recent_usage[-1] > recent_usage[0] else "decreasing"
+                "average_mb": recent.average(),
+                "min_mb": recent.minimum(),
+                "max_mb": recent.peak(),
+                "trend_direction": "increasing" if recent.newest() > recent.oldest() else "decreasing"
             }
         
         return {
@@ -727,40 +924,39 @@ class IntelligentMemoryManager:
                 "available_mb": snapshot.available_mb,
                 "total_mb": snapshot.total_mb,
                 "percent_used": snapshot.percent_used,
+                "used_percent": snapshot.used_percent,
                 "process_memory_mb": snapshot.process_memory_mb
             },
             "thresholds": {
                 "warning_mb": config.memory_warning_threshold,
                 "critical_mb": config.memory_critical_threshold,
-                "warning_percent": (config.memory_warning_threshold / snapshot.total_mb) * 100,
-                "critical_percent": (config.memory_critical_threshold / snapshot.total_mb) * 100
+                "warning_percent": warning_percent,
+                "critical_percent": critical_percent
             },
             "optimization_history": [
-                {
-                    "timestamp": result.timestamp.isoformat(),
-                    "recovered_mb": result.recovered_mb,
-                    "success": result.success,
-                    "actions": result.actions_taken
-                }
-                for result in self.optimization_history[-10:]  # Last 10 optimizations
+                result.to_dict() for result in self.optimization_history[-10:]  # Last 10 optimizations
             ],
             "usage_trend": usage_trend,
             "leak_detection": self.detect_memory_leak(),
             "system_info": {
                 "total_system_memory_gb": self.total_system_memory_gb,
                 "last_threshold_update": self._last_threshold_update.isoformat() if self._last_threshold_update else None,
-                "last_gc_time": self._last_gc_time.isoformat() if self._last_gc_time else None
+                "last_gc_time": format_timestamp(self._last_gc_time)
             }
         }
 
 
 # Global memory manager instance
 _memory_manager = None
+_memory_manager_lock = threading.Lock()
 
 
 def get_memory_manager() -> IntelligentMemoryManager:
     """Get the global memory manager instance."""
     global _memory_manager
+    # Double-checked locking: the lock is only taken until the instance exists
     if _memory_manager is None:
-        _memory_manager = IntelligentMemoryManager()
+        with _memory_manager_lock:
+            if _memory_manager is None:
+                _memory_manager = IntelligentMemoryManager()
     return _memory_manager
@@ -5,13 +5,16 @@ This module provides detailed memory usage reporting, trend analysis,
 and automated reporting for memory management.
 """
 
+import bisect
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 
-from .memory_manager import get_memory_manager, MemoryUsageSnapshot, MemoryOptimizationResult
+from .memory_manager import get_memory_manager
 
 log = logging.getLogger("memory_reporter")
 
@@ -55,32 +58,107 @@ class MemoryReport:
     optimization_history: List[Dict[str, Any]]
 
 
+# Recommendation rules, evaluated in order over the context built by
+# MemoryReporter._generate_recommendations: (predicate, message template)
+RECOMMENDATION_RULES: List[Tuple[Callable[[Dict[str, Any]], bool], str]] = [
+    # Current usage
+    (lambda c: c['used_pct'] > 80,
+     "System memory usage is high (>80%). Consider adding more RAM or optimizing memory-intensive processes."),
+    (lambda c: c['used_pct'] < 10,
+     "System memory usage is very low (<10%). Memory thresholds could be increased for better resource utilization."),
+    # Thresholds
+    (lambda c: c['warn_pct'] < 30,
+     "Warning threshold is low ({warn_pct:.1f}% of total memory). Consider increasing for better early warning."),
+    (lambda c: c['crit_pct'] < 40,
+     "Critical threshold is low ({crit_pct:.1f}% of total memory). Consider increasing to prevent false alarms."),
+    # Trend
+    (lambda c: c['trend'] == 'increasing',
+     "Memory usage is trending upward. Monitor for potential memory leaks and consider proactive cleanup."),
+    (lambda c: c['trend'] == 'decreasing',
+     "Memory usage is trending downward. Recent optimizations may be effective."),
+    # Optimizations
+    (lambda c: c['opt_count'] == 0,
+     "No memory optimizations performed recently. Consider running periodic cleanup."),
+    (lambda c: c['opt_count'] > 0 and c['opt_total'] > 100,
+     "Memory optimizations recovered {opt_total:.1f}MB. Consider more frequent cleanup."),
+    # Peak usage
+    (lambda c: c['peak_mb'] > c['critical_mb'],
+     "Peak memory usage exceeded critical threshold. Investigate high-memory periods."),
+]
+
+HEALTHY_RECOMMENDATION = "Memory usage appears healthy. Continue current monitoring practices."
+
+
 class MemoryReporter:
     """
     Memory usage reporter with trend analysis and recommendations.
     """
     
-    def __init__(self):
+    # Periods at least this long (seconds) are analyzed from per-minute buckets
+    BUCKET_PERIOD = 60.0
+    
+    def __init__(self, cache_ttl_seconds: float = 30.0):
         self.memory_manager = get_memory_manager()
         
+        # Report cache: hours -> (built_at, history_state, report)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._report_cache: Dict[float, Tuple[float, Tuple[int, Any], MemoryReport]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # (hours, history state, logged_at) of the last logged report
+        self._last_logged: Optional[Tuple[float, Tuple[int, Any], float]] = None
+    
+    def _history_state(self) -> Tuple[int, Any]:
+        """Identify the state of the manager's history for cache validation."""
+        usage_timestamps = self.memory_manager.usage_timestamps
+        last_sample_ts = usage_timestamps[-1] if usage_timestamps else None
+        return self.memory_manager.generation, last_sample_ts
+    
     def generate_report(self, hours: float = 24.0) -> MemoryReport:
         """
         Generate comprehensive memory usage report for the specified period.
         
+        Reports are cached for ``cache_ttl_seconds`` and reused as long as no
+        new usage sample or optimization has been recorded since.
+        
         Args:
             hours: Number of hours to analyze (default: 24 hours)
             
         Returns:
             MemoryReport with detailed analysis
         """
-        now = datetime.utcnow()
-        start_time = now - timedelta(hours=hours)
-        
-        # Get current memory statistics
+        cache_key = round(hours, 3)
+        with self._cache_lock:
+            cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            built_at, state, report = cached
+            if time.monotonic() - built_at < self.cache_ttl_seconds and state == self._history_state():
+                return report
+        
+        report = self._build_report(hours)
+        
+        # Building the report takes a fresh sample, so capture the state afterwards
+        built_at = time.monotonic()
+        state = self._history_state()
+        with self._cache_lock:
+            # Drop expired entries so arbitrary ``hours`` values cannot grow the cache
+            for key in [k for k, v in self._report_cache.items() if built_at - v[0] >= self.cache_ttl_seconds]:
+                del self._report_cache[key]
+            self._report_cache[cache_key] = (built_at, state, report)
+        
+        return report
+    
+    def _build_report(self, hours: float) -> MemoryReport:
+        """Build a memory report from scratch."""
+        # Get current memory statistics. This records a fresh sample, so the
+        # period is anchored after it and the report includes current usage.
         stats = self.memory_manager.get_memory_statistics()
         current_usage = stats['current_usage']
         thresholds = stats['thresholds']
         
+        now = time.time()
+        start_time = now - hours * 3600
+        
         # Analyze usage history
         usage_analysis = self._analyze_usage_history(start_time, now)
         
@@ -98,7 +176,7 @@ class MemoryReporter:
         auto_adjustments = self._count_auto_adjustments(start_time, now)
         
         return MemoryReport(
-            timestamp=now,
+            timestamp=datetime.utcfromtimestamp(now),
             report_period_hours=hours,
             
             # Current status
@@ -134,52 +212,128 @@ class MemoryReporter:
             optimization_history=optimization_analysis['history']
         )
     
-    def _analyze_usage_history(self, start_time: datetime, end_time: datetime) -> Dict[str, Any]:
+    def _analyze_usage_history(self, start_time: float, end_time: float) -> Dict[str, Any]:
         """Analyze memory usage history for the specified period."""
-        usage_history = list(self.memory_manager.usage_history)
+        usage_timestamps = self.memory_manager.usage_timestamps
         
-        # Filter by time period
-        period_usage = [
-            snapshot for snapshot in usage_history
-            if start_time <= snapshot.timestamp <= end_time
-        ]
+        # Locate the period in the time-ordered history
+        lo = bisect.bisect_left(usage_timestamps, start_time)
+        hi = bisect.bisect_right(usage_timestamps, end_time)
+        
+        if lo >= hi:
+            return self._empty_usage_analysis()
+        
+        covers_history = lo == 0 and hi == len(usage_timestamps)
+        if not covers_history and end_time - start_time >= self.BUCKET_PERIOD:
+            return self._analyze_usage_buckets(start_time, end_time)
         
-        if not period_usage:
+        usage_values = self.memory_manager.usage_used_mb.slice(lo, hi)
+        timestamps = usage_timestamps.slice(lo, hi)
+        
+        if covers_history:
+            # The whole retained history falls inside the period, so the running
+            # aggregates maintained by the memory manager already describe it.
+            usage_stats = self.memory_manager.usage_stats
             return {
-                'samples': 0,
-                'average_mb': 0.0,
-                'peak_mb': 0.0,
-                'min_mb': 0.0,
-                'trend': 'unknown'
+                'samples': usage_stats.count,
+                'average_mb': usage_stats.average(),
+                'peak_mb': usage_stats.peak(),
+                'min_mb': usage_stats.minimum(),
+                'trend': self._calculate_trend(timestamps, usage_values)
             }
         
-        usage_values = [s.used_mb for s in period_usage]
+        # Single pass: count, total, extremes and regression sums together
+        origin = timestamps[0]
+        n = 0
+        total_mb = sum_x = sum_xx = sum_xy = 0.0
+        min_mb = peak_mb = usage_values[0]
+        for ts, used_mb in zip(timestamps, usage_values):
+            n += 1
+            total_mb += used_mb
+            if used_mb < min_mb:
+                min_mb = used_mb
+            elif used_mb > peak_mb:
+                peak_mb = used_mb
+            x = ts - origin
+            sum_x += x
+            sum_xx += x * x
+            sum_xy += x * used_mb
         
-        # Calculate statistics
-        average_mb = sum(usage_values) / len(usage_values)
-        peak_mb = max(usage_values)
-        min_mb = min(usage_values)
+        return {
+            'samples': n,
+            'average_mb': total_mb / n,
+            'peak_mb': peak_mb,
+            'min_mb': min_mb,
+            'trend': self._classify_trend(n, sum_x, total_mb, sum_xx, sum_xy, timestamps[-1] - origin)
+        }
+    
+    def _analyze_usage_buckets(self, start_time: float, end_time: float) -> Dict[str, Any]:
+        """Analyze usage from the manager's per-minute buckets.
         
-        # Determine trend
-        trend = self._calculate_trend(period_usage)
+        Buckets are selected by the minute they start in, so the period edges
+        are resolved to whole minutes. The trend is fitted to bucket means.
+        """
+        # Periods end at (or near) the present, so walk the time-ordered buckets
+        # from the newest end and stop at the first one before the period,
+        # folding every statistic in the same pass.
+        buckets = samples = 0
+        total_mb = sum_x = sum_y = sum_xx = sum_xy = 0.0
+        min_mb = peak_mb = 0.0
+        newest = oldest = 0.0
+        for bucket in reversed(self.memory_manager.usage_minute_buckets):
+            minute = bucket.minute
+            if minute > end_time:
+                continue
+            if minute < start_time:
+                break
+            if not buckets:
+                newest = minute
+                min_mb, peak_mb = bucket.min_mb, bucket.max_mb
+            oldest = minute
+            buckets += 1
+            samples += bucket.count
+            total_mb += bucket.total_mb
+            if bucket.min_mb < min_mb:
+                min_mb = bucket.min_mb
+            if bucket.max_mb > peak_mb:
+                peak_mb = bucket.max_mb
+            # x is measured back from the newest bucket; the slope is unaffected
+            x = minute - newest
+            y = bucket.total_mb / bucket.count
+            sum_x += x
+            sum_y += y
+            sum_xx += x * x
+            sum_xy += x * y
+        
+        if not buckets:
+            return self._empty_usage_analysis()
         
         return {
-            'samples': len(period_usage),
-            'average_mb': average_mb,
+            'samples': samples,
+            'average_mb': total_mb / samples,
             'peak_mb': peak_mb,
             'min_mb': min_mb,
-            'trend': trend
+            'trend': self._classify_trend(buckets, sum_x, sum_y, sum_xx, sum_xy, newest - oldest)
         }
     
-    def _analyze_optimization_history(self, start_time: datetime, end_time: datetime) -> Dict[str, Any]:
+    @staticmethod
+    def _empty_usage_analysis() -> Dict[str, Any]:
+        return {
+            'samples': 0,
+            'average_mb': 0.0,
+            'peak_mb': 0.0,
+            'min_mb': 0.0,
+            'trend': 'unknown'
+        }
+    
+    def _analyze_optimization_history(self, start_time: float, end_time: float) -> Dict[str, Any]:
         """Analyze memory optimization history for the specified period."""
-        optimization_history = self.memory_manager.optimization_history
+        optimization_timestamps = self.memory_manager.optimization_timestamps
         
-        # Filter by time period
-        period_optimizations = [
-            opt for opt in optimization_history
-            if start_time <= opt.timestamp <= end_time
-        ]
+        # Locate the period in the time-ordered history
+        lo = bisect.bisect_left(optimization_timestamps, start_time)
+        hi = bisect.bisect_right(optimization_timestamps, end_time)
+        period_optimizations = self.memory_manager.optimization_history[lo:hi]
         
         if not period_optimizations:
             return {
@@ -189,26 +343,28 @@ class MemoryReporter:
                 'history': []
             }
         
-        # Calculate total recovery
-        total_recovered = sum(opt.recovered_mb for opt in period_optimizations if opt.recovered_mb > 0)
-        
-        # Find most effective optimization
+        # Convert to serializable format, aggregating in the same pass unless
+        # the whole history is in the period and the running aggregates apply
+        covers_history = lo == 0 and hi == len(optimization_timestamps)
+        total_recovered = 0.0
+        best_opt = None
+        history = []
+        for opt in period_optimizations:
+            recovered_mb = opt.recovered_mb
+            if not covers_history and recovered_mb > 0:
+                total_recovered += recovered_mb
+                if best_opt is None or recovered_mb > best_opt.recovered_mb:
+                    best_opt = opt
+            history.append(opt.to_report_entry())
+        
+        if covers_history:
+            total_recovered = self.memory_manager.optimization_recovered_mb
+            best_opt = self.memory_manager.best_optimization
+        
+        # Describe the most effective optimization
         most_effective = None
-        if period_optimizations:
-            best_opt = max(period_optimizations, key=lambda x: x.recovered_mb if x.recovered_mb > 0 else 0)
-            if best_opt.recovered_mb > 0:
-                most_effective = f"{best_opt.recovered_mb:.1f}MB recovered via {', '.join(best_opt.actions_taken[:2])}"
-        
-        # Convert to serializable format
-        history = [
-            {
-                'timestamp': opt.timestamp.isoformat(),
-                'recovered_mb': opt.recovered_mb,
-                'success': opt.success,
-                'actions_count': len(opt.actions_taken)
-            }
-            for opt in period_optimizations
-        ]
+        if best_opt is not None:
+            most_effective = f"{best_opt.recovered_mb:.1f}MB recovered via {', '.join(best_opt.actions_taken[:2])}"
         
         return {
             'count': len(period_optimizations),
@@ -217,24 +373,37 @@ class MemoryReporter:
             'history': history
         }
     
-    def _calculate_trend(self, usage_snapshots: List[MemoryUsageSnapshot]) -> str:
-        """Calculate memory usage trend from snapshots."""
-        if len(usage_snapshots) < 3:
+    def _calculate_trend(self, timestamps: List[float], usage_values: List[float]) -> str:
+        """Calculate memory usage trend from the least-squares slope of used memory."""
+        n = len(usage_values)
+        if n < 3:
             return "insufficient_data"
         
-        # Use first and last third of samples to determine trend
-        third = len(usage_snapshots) // 3
-        if third < 1:
-            return "insufficient_data"
+        origin = timestamps[0]
+        sum_x = sum_y = sum_xx = sum_xy = 0.0
+        for ts, used_mb in zip(timestamps, usage_values):
+            x = ts - origin
+            sum_x += x
+            sum_y += used_mb
+            sum_xx += x * x
+            sum_xy += x * used_mb
         
-        early_samples = usage_snapshots[:third]
-        late_samples = usage_snapshots[-third:]
+        return self._classify_trend(n, sum_x, sum_y, sum_xx, sum_xy, timestamps[-1] - origin)
+    
+    @staticmethod
+    def _classify_trend(n: int, sum_x: float, sum_y: float, sum_xx: float, sum_xy: float, span: float) -> str:
+        """Classify a trend from least-squares sums over ``n`` points spanning ``span`` seconds."""
+        if n < 3 or span <= 0:
+            return "insufficient_data"
         
-        early_avg = sum(s.used_mb for s in early_samples) / len(early_samples)
-        late_avg = sum(s.used_mb for s in late_samples) / len(late_samples)
+        denominator = n * sum_xx - sum_x * sum_x
+        mean_usage = sum_y / n
+        if denominator <= 0 or mean_usage <= 0:
+            return "insufficient_data"
+        slope = (n * sum_xy - sum_x * sum_y) / denominator
         
-        # Calculate percentage change
-        change_percent = ((late_avg - early_avg) / early_avg) * 100
+        # Fitted change across the whole period, relative to the mean usage
+        change_percent = (slope * span / mean_usage) * 100
         
         if change_percent > 5:
             return "increasing"
@@ -243,19 +412,19 @@ class MemoryReporter:
         else:
             return "stable"
     
-    def _count_leak_detections(self, start_time: datetime, end_time: datetime) -> int:
+    def _count_leak_detections(self, start_time: float, end_time: float) -> int:
         """Count memory leak detections in the period."""
         # This would need to be implemented based on how leak detection alerts are stored
         # For now, return 0 as we don't have persistent alert storage
         return 0
     
-    def _count_threshold_violations(self, start_time: datetime, end_time: datetime) -> int:
+    def _count_threshold_violations(self, start_time: float, end_time: float) -> int:
         """Count threshold violations in the period."""
         # This would need to be implemented based on alert history
         # For now, return 0 as we don't have persistent alert storage
         return 0
     
-    def _count_auto_adjustments(self, start_time: datetime, end_time: datetime) -> int:
+    def _count_auto_adjustments(self, start_time: float, end_time: float) -> int:
         """Count automatic threshold adjustments in the period."""
         # This would need to be implemented based on adjustment history
         # For now, return 0 as we don't have persistent adjustment storage
@@ -269,51 +438,52 @@ class MemoryReporter:
         optimization_analysis: Dict[str, Any]
     ) -> List[str]:
         """Generate memory management recommendations based on analysis."""
-        recommendations = []
-        
-        # Current usage recommendations
-        usage_percent = (current_usage['used_mb'] / current_usage['total_mb']) * 100
-        
-        if usage_percent > 80:
-            recommendations.append("System memory usage is high (>80%). Consider adding more RAM or optimizing memory-intensive processes.")
-        elif usage_percent < 10:
-            recommendations.append("System memory usage is very low (<10%). Memory thresholds could be increased for better resource utilization.")
-        
-        # Threshold recommendations
-        warning_percent = (thresholds['warning_mb'] / current_usage['total_mb']) * 100
-        critical_percent = (thresholds['critical_mb'] / current_usage['total_mb']) * 100
-        
-        if warning_percent < 30:
-            recommendations.append(f"Warning threshold is low ({warning_percent:.1f}% of total memory). Consider increasing for better early warning.")
-        
-        if critical_percent < 40:
-            recommendations.append(f"Critical threshold is low ({critical_percent:.1f}% of total memory). Consider increasing to prevent false alarms.")
+        ctx = {
+            'used_pct': current_usage['used_percent'],
+            'warn_pct': thresholds['warning_percent'],
+            'crit_pct': thresholds['critical_percent'],
+            'critical_mb': thresholds['critical_mb'],
+            'trend': usage_analysis['trend'],
+            'peak_mb': usage_analysis['peak_mb'],
+            'opt_count': optimization_analysis['count'],
+            'opt_total': optimization_analysis['total_recovered_mb'],
+        }
         
-        # Trend recommendations
-        if usage_analysis['trend'] == 'increasing':
-            recommendations.append("Memory usage is trending upward. Monitor for potential memory leaks and consider proactive cleanup.")
-        elif usage_analysis['trend'] == 'decreasing':
-            recommendations.append("Memory usage is trending downward. Recent optimizations may be effective.")
+        recommendations = [
+            template.format(**ctx)
+            for predicate, template in RECOMMENDATION_RULES
+            if predicate(ctx)
+        ]
         
-        # Optimization recommendations
-        if optimization_analysis['count'] == 0:
-            recommendations.append("No memory optimizations performed recently. Consider running periodic cleanup.")
-        elif optimization_analysis['total_recovered_mb'] > 100:
-            recommendations.append(f"Memory optimizations recovered {optimization_analysis['total_recovered_mb']:.1f}MB. Consider more frequent cleanup.")
+        return recommendations or [HEALTHY_RECOMMENDATION]
+    
+    def log_memory_report(self, hours: float = 1.0) -> bool:
+        """Generate and log a memory report.
         
-        # Peak usage recommendations
-        if usage_analysis['peak_mb'] > thresholds['critical_mb']:
-            recommendations.append("Peak memory usage exceeded critical threshold. Investigate high-memory periods.")
+        Skipped (with a debug heartbeat) when the previous report for the same
+        period was logged less than ``cache_ttl_seconds`` ago and nothing has
+        been recorded since. Generating a report takes a sample itself, so the
+        skip expires with the TTL rather than waiting for other activity.
         
-        if not recommendations:
-            recommendations.append("Memory usage appears healthy. Continue current monitoring practices.")
+        Returns:
+            True if a report was logged, False if it was skipped as unchanged
+            or could not be generated
+        """
+        last_logged = self._last_logged
+        if last_logged is not None:
+            logged_hours, logged_state, logged_at = last_logged
+            if (
+                logged_hours == hours
+                and time.monotonic() - logged_at < self.cache_ttl_seconds
+                and logged_state == self._history_state()
+            ):
+                log.debug("memory_report_unchanged", extra={"report_period_hours": hours})
+                return False
         
-        return recommendations
-    
-    def log_memory_report(self, hours: float = 1.0):
-        """Generate and log a memory report."""
         try:
             report = self.generate_report(hours)
+            # Generating the report records a sample, so remember the state after it
+            self._last_logged = (hours, self._history_state(), time.monotonic())
             
             log.info(
                 "memory_usage_report",
@@ -344,15 +514,22 @@ class MemoryReporter:
                 extra={"error": str(e)},
                 exc_info=True
             )
+            return False
+        
+        return True
 
 
 # Global memory reporter instance
 _memory_reporter = None
+_memory_reporter_lock = threading.Lock()
 
 
 def get_memory_reporter() -> MemoryReporter:
     """Get the global memory reporter instance."""
     global _memory_reporter
+    # Double-checked locking: the lock is only taken until the instance exists
     if _memory_reporter is None:
-        _memory_reporter = MemoryReporter()
+        with _memory_reporter_lock:
+            if _memory_reporter is None:
+                _memory_reporter = MemoryReporter()
     return _memory_reporter
\ No newline at end of file
@@ -5,17 +5,47 @@ This module provides helper functions and classes for collecting,
 aggregating, and analyzing system health metrics.
 """
 
+import bisect
+import gc
+import logging
 import psutil
+import secrets
+import sys
+import threading
 import time
 import math
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, NamedTuple, Optional, Tuple, Any
 from collections import defaultdict, deque
+from operator import ge, gt, itemgetter
 
 from .models import (
     HealthStatus, AlertLevel, HealthAlert, ResourceHealth,
     PerformanceMetrics, PerformanceAlert, MonitoringConfig
 )
+from .rolling_stats import RingBuffer, RollingStats, SlidingTrend
+
+
+# Threshold severities, ordered so the worst of several is their max()
+SEVERITY_OK = 0
+SEVERITY_WARNING = 1
+SEVERITY_CRITICAL = 2
+
+_STATUS_BY_SEVERITY = (HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.CRITICAL)
+_ALERT_LEVEL_BY_SEVERITY = (None, AlertLevel.WARNING, AlertLevel.CRITICAL)
+
+# Timestamp accessor for the record dicts kept in histories, run in C
+_timestamp_of = itemgetter("timestamp")
+
+
+def _threshold_severity(value: float, warning: float, critical: float) -> int:
+    """Classify a value against its warning and critical thresholds."""
+    if value >= critical:
+        return SEVERITY_CRITICAL
+    if value >= warning:
+        return SEVERITY_WARNING
+    return SEVERITY_OK
 
 
 class MetricsCollector:
@@ -24,9 +54,45 @@ class MetricsCollector:
     def __init__(self, config: MonitoringConfig):
         self.config = config
         self._start_time = time.time()
+        # Disk usage and open descriptor counts change slowly, so they are
+        # refreshed at most every _slow_metrics_ttl seconds.
+        # Each cache is a (fetched_at, value) pair.
+        self._slow_metrics_ttl = 30.0
+        self._disk_cache: Tuple[float, float] = (0.0, 0.0)
+        self._fds_cache: Tuple[float, int] = (0.0, 0)
+        try:
+            self._process = psutil.Process()
+        except Exception:
+            self._process = None
+        # Last (monotonic time, result) pair, copied to callers polling more
+        # often than config.min_resource_interval
+        self._last_resource: Tuple[float, Optional[ResourceHealth]] = (0.0, None)
+        
+        # Alert messages with the thresholds already filled in, as
+        # (component, templates indexed by severity) per resource
+        self._memory_alert_templates = ("system.memory", (
+            None,
+            f"Memory usage high: {{:.1f}}MB (threshold: {config.memory_warning_threshold}MB)",
+            f"Memory usage critical: {{:.1f}}MB (threshold: {config.memory_critical_threshold}MB)",
+        ))
+        self._cpu_alert_templates = ("system.cpu", (
+            None,
+            f"CPU usage high: {{:.1f}}% (threshold: {config.cpu_warning_threshold}%)",
+            f"CPU usage critical: {{:.1f}}% (threshold: {config.cpu_critical_threshold}%)",
+        ))
+        self._disk_alert_templates = ("system.disk", (
+            None,
+            f"Disk usage high: {{:.1f}}% (threshold: {config.disk_warning_threshold}%)",
+            f"Disk usage critical: {{:.1f}}% (threshold: {config.disk_critical_threshold}%)",
+        ))
     
     def collect_resource_metrics(self) -> ResourceHealth:
         """Collect current system resource metrics."""
+        sampled_at, last_resource = self._last_resource
+        monotonic_now = time.monotonic()
+        if last_resource is not None and monotonic_now - sampled_at < self.config.min_resource_interval:
+            return replace(last_resource, alerts=list(last_resource.alerts))
+        
         memory = psutil.virtual_memory()
         memory_mb = memory.used / (1024 * 1024)
         memory_percent = memory.percent
@@ -34,27 +100,56 @@ class MetricsCollector:
         # CPU metrics (non-blocking)
         cpu_percent = psutil.cpu_percent(interval=0)
 
+        now = time.time()
+
         # Disk metrics
-        disk = psutil.disk_usage('/')
-        disk_percent = (disk.used / disk.total) * 100
+        fetched_at, disk_percent = self._disk_cache
+        if now - fetched_at > self._slow_metrics_ttl:
+            disk = psutil.disk_usage('/')
+            disk_percent = (disk.used / disk.total) * 100
+            self._disk_cache = (now, disk_percent)
 
         # Process metrics
-        try:
-            process = psutil.Process()
-            open_fds = process.num_fds() if hasattr(process, 'num_fds') else 0
-            max_fds = 1024  # Default, could be read from system limits
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            open_fds = 0
-            max_fds = 1024
+        max_fds = 1024  # Default, could be read from system limits
+        fetched_at, open_fds = self._fds_cache
+        if now - fetched_at > self._slow_metrics_ttl:
+            process = self._process
+            try:
+                if process is not None and hasattr(process, 'num_fds'):
+                    # Per-process reads go inside oneshot() so any added
+                    # alongside num_fds share one /proc parse
+                    with process.oneshot():
+                        open_fds = process.num_fds()
+                else:
+                    open_fds = 0
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                open_fds = 0
+            self._fds_cache = (now, open_fds)
 
         # Database connections (placeholder - would need actual DB pool)
         db_connections = 0
         max_db_connections = 100
 
-        status = self._determine_resource_status(memory_mb, cpu_percent, disk_percent)
-        all_alerts = self._generate_resource_alerts(memory_mb, cpu_percent, disk_percent)
+        # Classify each resource against its thresholds once; status and
+        # alerts are both derived from these severities
+        config = self.config
+        memory_severity = _threshold_severity(
+            memory_mb, config.memory_warning_threshold, config.memory_critical_threshold
+        )
+        cpu_severity = _threshold_severity(
+            cpu_percent, config.cpu_warning_threshold, config.cpu_critical_threshold
+        )
+        disk_severity = _threshold_severity(
+            disk_percent, config.disk_warning_threshold, config.disk_critical_threshold
+        )
+        
+        status = _STATUS_BY_SEVERITY[max(memory_severity, cpu_severity, disk_severity)]
+        all_alerts = self._generate_resource_alerts(
+            memory_mb, cpu_percent, disk_percent,
+            memory_severity, cpu_severity, disk_severity
+        )
         
-        return ResourceHealth(
+        resource_health = ResourceHealth(
             memory_usage_mb=memory_mb,
             memory_usage_percent=memory_percent,
             cpu_usage_percent=cpu_percent,
@@ -66,77 +161,33 @@ class MetricsCollector:
             status=status,
             alerts=all_alerts
         )
-    
-    def _determine_resource_status(
-        self, memory_mb: float, cpu_percent: float, disk_percent: float
-    ) -> HealthStatus:
-        """Determine overall resource health status (legacy method)."""
-        if (memory_mb >= self.config.memory_critical_threshold or
-            cpu_percent >= self.config.cpu_critical_threshold or
-            disk_percent >= self.config.disk_critical_threshold):
-            return HealthStatus.CRITICAL
-        
-        if (memory_mb >= self.config.memory_warning_threshold or
-            cpu_percent >= self.config.cpu_warning_threshold or
-            disk_percent >= self.config.disk_warning_threshold):
-            return HealthStatus.DEGRADED
-        
-        return HealthStatus.HEALTHY
+        self._last_resource = (monotonic_now, resource_health)
+        # Callers own the result they get, so keep the cached one apart
+        return replace(resource_health, alerts=list(all_alerts))
     
     def _generate_resource_alerts(
-        self, memory_mb: float, cpu_percent: float, disk_percent: float
+        self, memory_mb: float, cpu_percent: float, disk_percent: float,
+        memory_severity: int, cpu_severity: int, disk_severity: int
     ) -> List[HealthAlert]:
-        """Generate alerts for memory, CPU, and disk usage."""
+        """Generate alerts for memory, CPU, and disk usage from their threshold severities."""
         alerts = []
+        if not (memory_severity or cpu_severity or disk_severity):
+            return alerts
+        
         now = datetime.utcnow()
-
-        # Memory alerts
-        if memory_mb >= self.config.memory_critical_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.CRITICAL,
-                message=f"Memory usage critical: {memory_mb:.1f}MB (threshold: {self.config.memory_critical_threshold}MB)",
-                component="system.memory",
-                timestamp=now
-            ))
-        elif memory_mb >= self.config.memory_warning_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.WARNING,
-                message=f"Memory usage high: {memory_mb:.1f}MB (threshold: {self.config.memory_warning_threshold}MB)",
-                component="system.memory",
-                timestamp=now
-            ))
-        
-        # CPU alerts
-        if cpu_percent >= self.config.cpu_critical_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.CRITICAL,
-                message=f"CPU usage critical: {cpu_percent:.1f}% (threshold: {self.config.cpu_critical_threshold}%)",
-                component="system.cpu",
-                timestamp=now
-            ))
-        elif cpu_percent >= self.config.cpu_warning_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.WARNING,
-                message=f"CPU usage high: {cpu_percent:.1f}% (threshold: {self.config.cpu_warning_threshold}%)",
-                component="system.cpu",
-                timestamp=now
-            ))
-        
-        # Disk alerts
-        if disk_percent >= self.config.disk_critical_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.CRITICAL,
-                message=f"Disk usage critical: {disk_percent:.1f}% (threshold: {self.config.disk_critical_threshold}%)",
-                component="system.disk",
-                timestamp=now
-            ))
-        elif disk_percent >= self.config.disk_warning_threshold:
-            alerts.append(HealthAlert(
-                level=AlertLevel.WARNING,
-                message=f"Disk usage high: {disk_percent:.1f}% (threshold: {self.config.disk_warning_threshold}%)",
-                component="system.disk",
-                timestamp=now
-            ))
+        readings = (
+            (memory_mb, memory_severity, self._memory_alert_templates),
+            (cpu_percent, cpu_severity, self._cpu_alert_templates),
+            (disk_percent, disk_severity, self._disk_alert_templates),
+        )
+        for value, severity, (component, templates) in readings:
+            if severity:
+                alerts.append(HealthAlert(
+                    level=_ALERT_LEVEL_BY_SEVERITY[severity],
+                    message=templates[severity].format(value),
+                    component=component,
+                    timestamp=now
+                ))
         
         return alerts
     
@@ -148,37 +199,48 @@ class MetricsCollector:
 class PerformanceAnalyzer:
     """Analyzes performance metrics and detects issues."""
     
+    # Number of most recent values the trend is fitted over
+    TREND_WINDOW = 5
+    
     def __init__(self, config: MonitoringConfig):
         self.config = config
+        # Only the values analyze_trends reads are retained: the last
+        # TREND_WINDOW floats per metric, not a long history of records
         self._metrics_history: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=100)
+            lambda: deque(maxlen=self.TREND_WINDOW)
         )
+        # (component, metric_name) -> interned "component.metric_name" key
+        self._key_cache: Dict[Tuple[str, str], str] = {}
+    
+    def _key(self, component: str, metric_name: str) -> str:
+        """Return the history key for a metric, building it only once."""
+        key = self._key_cache.get((component, metric_name))
+        if key is None:
+            key = self._key_cache[(component, metric_name)] = sys.intern(f"{component}.{metric_name}")
+        return key
     
     def add_metric(self, component: str, metric_name: str, value: float):
         """Add a metric value to the history."""
-        key = f"{component}.{metric_name}"
-        self._metrics_history[key].append({
-            'value': value,
-            'timestamp': datetime.utcnow()
-        })
+        self._metrics_history[self._key(component, metric_name)].append(value)
     
     def analyze_trends(self, component: str, metric_name: str) -> Tuple[str, float]:
         """Analyze trend for a specific metric."""
-        key = f"{component}.{metric_name}"
-        history = self._metrics_history[key]
+        history = self._metrics_history[self._key(component, metric_name)]
         
         if len(history) < 3:
             return "stable", 0.0
         
-        # Calculate trend over last 5 data points
-        recent_values = [item['value'] for item in list(history)[-5:]]
+        # Calculate trend over the retained (last TREND_WINDOW) data points
+        n = len(history)
         
-        # Simple linear trend calculation
-        n = len(recent_values)
-        x_sum = sum(range(n))
-        y_sum = sum(recent_values)
-        xy_sum = sum(i * v for i, v in enumerate(recent_values))
-        x2_sum = sum(i * i for i in range(n))
+        # Simple linear trend calculation; x is 0..n-1, so its sums are closed-form
+        x_sum = n * (n - 1) // 2
+        x2_sum = (n - 1) * n * (2 * n - 1) // 6
+        y_sum = 0.0
+        xy_sum = 0.0
+        for i, value in enumerate(history):
+            y_sum += value
+            xy_sum += i * value
         
         if n * x2_sum - x_sum * x_sum == 0:
             return "stable", 0.0
@@ -198,7 +260,6 @@ class PerformanceAnalyzer:
     ) -> List[PerformanceAlert]:
         """Detect performance issues from metrics."""
         alerts = []
-        now = datetime.utcnow()
         
         # API response time analysis
         avg_response_time = metrics.get_avg_api_response_time()
@@ -277,8 +338,7 @@ class PerformanceAnalyzer:
 
 def create_correlation_id() -> str:
     """Create a unique correlation ID for tracking related events."""
-    import uuid
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 
 def aggregate_health_status(statuses: List[HealthStatus]) -> HealthStatus:
@@ -286,14 +346,172 @@ def aggregate_health_status(statuses: List[HealthStatus]) -> HealthStatus:
     if not statuses:
         return HealthStatus.UNKNOWN
     
-    if HealthStatus.CRITICAL in statuses:
-        return HealthStatus.CRITICAL
-    elif HealthStatus.DEGRADED in statuses:
+    # Single pass, returning as soon as a critical status is seen. Enum
+    # members are singletons, so identity checks suffice.
+    has_degraded = False
+    all_healthy = True
+    for status in statuses:
+        if status is HealthStatus.CRITICAL:
+            return HealthStatus.CRITICAL
+        if status is HealthStatus.DEGRADED:
+            has_degraded = True
+        elif status is not HealthStatus.HEALTHY:
+            all_healthy = False
+    
+    if has_degraded:
         return HealthStatus.DEGRADED
-    elif all(status == HealthStatus.HEALTHY for status in statuses):
-        return HealthStatus.HEALTHY
-    else:
-        return HealthStatus.UNKNOWN
+    return HealthStatus.HEALTHY if all_healthy else HealthStatus.UNKNOWN
+
+
+class ApiCallHistory:
+    """
+    One service's retained API calls, stored column-wise, with running aggregates.
+    
+    Timestamps, response times and success flags live in typed ring buffers
+    rather than one dict per call; errors and endpoints (usually None) in
+    bounded deques. Aggregates are kept in step as calls are recorded and
+    evicted, so refreshing statistics is O(1) instead of a rescan of the
+    history. The last-hour and last-minute windows are suffixes of the
+    history, tracked by their length.
+    """
+    
+    def __init__(self, max_history_size: int):
+        self.timestamps = RingBuffer(max_history_size)
+        self.response_times = RingBuffer(max_history_size)
+        self.successes = RingBuffer(max_history_size, "B")
+        self.errors: deque = deque(maxlen=max_history_size)
+        self.endpoints: deque = deque(maxlen=max_history_size)
+        
+        self.response_stats = RollingStats(window=max_history_size)
+        self.success_count = 0
+        self.hour_count = 0
+        self.hour_response_total = 0.0
+        self.hour_success_count = 0
+        self.minute_count = 0
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Return the call at ``index`` as a record dict."""
+        return {
+            'timestamp': self.timestamps[index],
+            'response_time': self.response_times[index],
+            'success': bool(self.successes[index]),
+            'error': self.errors[index],
+            'endpoint': self.endpoints[index]
+        }
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, timestamp: float, response_time: float, success: bool,
+               error: Optional[str] = None, endpoint: Optional[str] = None):
+        """Record a call, evicting the oldest one when the history is full."""
+        if len(self.timestamps) == self.timestamps.capacity:
+            self._drop_oldest_from_aggregates()
+        
+        self.timestamps.append(timestamp)
+        self.response_times.append(response_time)
+        self.successes.append(success)
+        self.errors.append(error)
+        self.endpoints.append(endpoint)
+        
+        self.response_stats.push(response_time)
+        self.success_count += success
+        self.hour_count += 1
+        self.hour_response_total += response_time
+        self.hour_success_count += success
+        self.minute_count += 1
+    
+    def popleft(self):
+        """Remove the oldest call."""
+        self._drop_oldest_from_aggregates()
+        self.timestamps.popleft()
+        self.response_times.popleft()
+        self.successes.popleft()
+        self.errors.popleft()
+        self.endpoints.popleft()
+        self.response_stats.pop_oldest()
+    
+    def _drop_oldest_from_aggregates(self):
+        """Remove the oldest call's contribution to the success and window aggregates."""
+        retained = len(self.timestamps)
+        success = self.successes[0]
+        self.success_count -= success
+        if self.hour_count == retained:
+            self.hour_count -= 1
+            self.hour_response_total -= self.response_times[0]
+            self.hour_success_count -= success
+        if self.minute_count == retained:
+            self.minute_count -= 1
+    
+    def evict_windows(self, now: float):
+        """Shrink the last-hour/last-minute windows to calls that are still recent."""
+        retained = len(self.timestamps)
+        timestamps = self.timestamps
+        while self.hour_count and now - timestamps[retained - self.hour_count] > 3600:
+            index = retained - self.hour_count
+            self.hour_count -= 1
+            self.hour_response_total -= self.response_times[index]
+            self.hour_success_count -= self.successes[index]
+        if not self.hour_count:
+            # Reset instead of subtracting so float error cannot accumulate
+            self.hour_response_total = 0.0
+        
+        while self.minute_count and now - timestamps[retained - self.minute_count] > 60:
+            self.minute_count -= 1
+
+
+class SystemMetricsHistory:
+    """
+    Retained system-level samples, stored column-wise in typed ring buffers.
+    
+    Indexing or iterating yields record dicts, but aggregations read the
+    columns directly.
+    """
+    
+    def __init__(self, max_history_size: int):
+        self.timestamps = RingBuffer(max_history_size)
+        self.cpu_percent = RingBuffer(max_history_size)
+        self.memory_percent = RingBuffer(max_history_size)
+        self.disk_percent = RingBuffer(max_history_size)
+        self.active_connections = RingBuffer(max_history_size, "q")
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Return the sample at ``index`` as a record dict."""
+        return {
+            'timestamp': self.timestamps[index],
+            'cpu_percent': self.cpu_percent[index],
+            'memory_percent': self.memory_percent[index],
+            'disk_percent': self.disk_percent[index],
+            'active_connections': self.active_connections[index]
+        }
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, timestamp: float, cpu_percent: float, memory_percent: float,
+               disk_percent: float, active_connections: int):
+        """Record a sample, evicting the oldest one when the history is full."""
+        self.timestamps.append(timestamp)
+        self.cpu_percent.append(cpu_percent)
+        self.memory_percent.append(memory_percent)
+        self.disk_percent.append(disk_percent)
+        self.active_connections.append(active_connections)
+    
+    def popleft(self):
+        """Remove the oldest sample."""
+        self.timestamps.popleft()
+        self.cpu_percent.popleft()
+        self.memory_percent.popleft()
+        self.disk_percent.popleft()
+        self.active_connections.popleft()
 
 
 class PerformanceTracker:
@@ -308,15 +526,20 @@ class PerformanceTracker:
         self.max_history_size = max_history_size
         
         # API call tracking
-        self._api_calls: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history_size))
+        self._api_calls: Dict[str, ApiCallHistory] = defaultdict(lambda: ApiCallHistory(max_history_size))
         self._api_stats: Dict[str, Dict] = defaultdict(dict)
+        self._api_dirty: Dict[str, bool] = {}
         
         # Scheduler group tracking
         self._scheduler_executions: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history_size))
+        # Execution timestamps in a parallel ring buffer, so time windows can be
+        # located by bisection (executions are recorded in time order)
+        self._scheduler_timestamps: Dict[str, RingBuffer] = defaultdict(lambda: RingBuffer(max_history_size))
         self._scheduler_stats: Dict[str, Dict] = defaultdict(dict)
+        self._scheduler_dirty: Dict[str, bool] = {}
         
         # System performance tracking
-        self._system_metrics: deque = deque(maxlen=max_history_size)
+        self._system_metrics = SystemMetricsHistory(max_history_size)
         
         # Performance baselines
         self._baselines: Dict[str, float] = {}
@@ -327,18 +550,8 @@ class PerformanceTracker:
     def record_api_call(self, service: str, response_time: float, success: bool, 
                        error: Optional[str] = None, endpoint: Optional[str] = None):
         """Record an API call for performance tracking."""
-        timestamp = time.time()
-        
-        call_record = {
-            'timestamp': timestamp,
-            'response_time': response_time,
-            'success': success,
-            'error': error,
-            'endpoint': endpoint
-        }
-        
-        self._api_calls[service].append(call_record)
-        self._update_api_stats(service)
+        self._api_calls[service].append(time.time(), response_time, success, error, endpoint)
+        self._api_dirty[service] = True
     
     def record_scheduler_execution(self, group: str, processing_time: float, 
                                  tokens_processed: int, tokens_updated: int,
@@ -356,107 +569,134 @@ class PerformanceTracker:
         }
         
         self._scheduler_executions[group].append(execution_record)
-        self._update_scheduler_stats(group)
+        self._scheduler_timestamps[group].append(timestamp)
+        self._scheduler_dirty[group] = True
     
     def record_system_metrics(self, cpu_percent: float, memory_percent: float, 
                             disk_percent: float, active_connections: int):
         """Record system-level performance metrics."""
-        timestamp = time.time()
-        
-        metrics_record = {
-            'timestamp': timestamp,
-            'cpu_percent': cpu_percent,
-            'memory_percent': memory_percent,
-            'disk_percent': disk_percent,
-            'active_connections': active_connections
-        }
-        
-        self._system_metrics.append(metrics_record)
+        self._system_metrics.append(time.time(), cpu_percent, memory_percent, disk_percent, active_connections)
+    
+    def _refresh_api_stats(self, service: str):
+        """Recompute cached API statistics if calls were recorded since the last read."""
+        if self._api_dirty.get(service):
+            self._update_api_stats(service)
+            self._api_dirty[service] = False
+    
+    def _refresh_scheduler_stats(self, group: str):
+        """Recompute cached scheduler statistics if executions were recorded since the last read."""
+        if self._scheduler_dirty.get(group):
+            self._update_scheduler_stats(group)
+            self._scheduler_dirty[group] = False
     
     def _update_api_stats(self, service: str):
-        """Update cached statistics for an API service."""
-        calls = list(self._api_calls[service])
+        """Update cached statistics for an API service from its running aggregates."""
+        calls = self._api_calls.get(service)
         if not calls:
             return
         
         # Calculate time-based metrics
-        now = time.time()
-        last_hour = [c for c in calls if now - c['timestamp'] <= 3600]
-        last_minute = [c for c in calls if now - c['timestamp'] <= 60]
-        
-        # Response time statistics
-        response_times = [c['response_time'] for c in calls]
-        recent_response_times = [c['response_time'] for c in last_hour]
+        calls.evict_windows(time.time())
+        hour_count = calls.hour_count
+        response_stats = calls.response_stats
         
         # Success rate statistics
         total_calls = len(calls)
-        successful_calls = len([c for c in calls if c['success']])
+        successful_calls = calls.success_count
         failed_calls = total_calls - successful_calls
-        recent_successful = len([c for c in last_hour if c['success']])
+        recent_successful = calls.hour_success_count
         # Include small penalty for failed calls to keep averages comparable across unstable periods.
         failed_response_penalty_ms = 1000.0
-        weighted_response_total = sum(response_times) + (failed_calls * failed_response_penalty_ms)
-        recent_failed_calls = len(last_hour) - recent_successful
-        recent_weighted_response_total = sum(recent_response_times) + (recent_failed_calls * failed_response_penalty_ms)
+        weighted_response_total = response_stats.total + (failed_calls * failed_response_penalty_ms)
+        recent_failed_calls = hour_count - recent_successful
+        recent_weighted_response_total = calls.hour_response_total + (recent_failed_calls * failed_response_penalty_ms)
+        
+        # Percentiles need the full distribution; this runs only when calls
+        # were recorded since the last read, so one sort serves every read
+        # until the next call
+        p95_response_time, p99_response_time = self._calculate_percentiles(
+            calls.response_times.slice(0, total_calls), (95, 99)
+        )
         
         self._api_stats[service] = {
             'total_calls': total_calls,
             'success_rate': (successful_calls / total_calls) * 100 if total_calls > 0 else 0,
             'average_response_time': weighted_response_total / total_calls if total_calls > 0 else 0,
-            'p95_response_time': self._calculate_percentile(response_times, 95),
-            'p99_response_time': self._calculate_percentile(response_times, 99),
-            'min_response_time': min(response_times) if response_times else 0,
-            'max_response_time': max(response_times) if response_times else 0,
-            'calls_per_minute': len(last_minute),
-            'calls_per_hour': len(last_hour),
-            'recent_success_rate': (recent_successful / len(last_hour)) * 100 if last_hour else 0,
-            'recent_avg_response_time': recent_weighted_response_total / len(last_hour) if last_hour else 0,
-            'last_call_time': calls[-1]['timestamp'] if calls else 0,
+            'p95_response_time': p95_response_time,
+            'p99_response_time': p99_response_time,
+            'min_response_time': response_stats.minimum(),
+            'max_response_time': response_stats.peak(),
+            'calls_per_minute': calls.minute_count,
+            'calls_per_hour': hour_count,
+            'recent_success_rate': (recent_successful / hour_count) * 100 if hour_count else 0,
+            'recent_avg_response_time': recent_weighted_response_total / hour_count if hour_count else 0,
+            'last_call_time': calls.timestamps[-1],
             'error_rate': ((total_calls - successful_calls) / total_calls) * 100 if total_calls > 0 else 0
         }
     
     def _update_scheduler_stats(self, group: str):
         """Update cached statistics for a scheduler group."""
-        executions = list(self._scheduler_executions[group])
+        executions = self._scheduler_executions[group]
         if not executions:
             return
         
         # Calculate time-based metrics
         now = time.time()
-        last_hour = [e for e in executions if now - e['timestamp'] <= 3600]
-        
-        # Processing time statistics
-        processing_times = [e['processing_time'] for e in executions]
-        tokens_processed = [e['tokens_processed'] for e in executions]
-        tokens_updated = [e['tokens_updated'] for e in executions]
-        error_counts = [e['error_count'] for e in executions]
-        
-        total_tokens_processed = sum(tokens_processed)
-        total_tokens_updated = sum(tokens_updated)
-        total_errors = sum(error_counts)
+        hour_start = bisect.bisect_left(self._scheduler_timestamps[group], now - 3600)
+        
+        # Accumulate all aggregates in a single pass over the executions
+        processing_times = []
+        total_processing_time = 0.0
+        total_tokens_processed = 0
+        total_tokens_updated = 0
+        total_errors = 0
+        hour_tokens_processed = 0
+        for index, execution in enumerate(executions):
+            processing_time = execution['processing_time']
+            processing_times.append(processing_time)
+            total_processing_time += processing_time
+            total_tokens_processed += execution['tokens_processed']
+            total_tokens_updated += execution['tokens_updated']
+            total_errors += execution['error_count']
+            if index >= hour_start:
+                hour_tokens_processed += execution['tokens_processed']
+        
+        # One sort serves min, max and p95
+        processing_times.sort()
+        execution_count = len(executions)
+        hour_count = execution_count - hour_start
         
         self._scheduler_stats[group] = {
-            'total_executions': len(executions),
-            'average_processing_time': sum(processing_times) / len(processing_times) if processing_times else 0,
-            'p95_processing_time': self._calculate_percentile(processing_times, 95),
-            'min_processing_time': min(processing_times) if processing_times else 0,
-            'max_processing_time': max(processing_times) if processing_times else 0,
+            'total_executions': execution_count,
+            'average_processing_time': total_processing_time / execution_count,
+            'p95_processing_time': self._percentile_of_sorted(processing_times, 95),
+            'min_processing_time': processing_times[0],
+            'max_processing_time': processing_times[-1],
             'total_tokens_processed': total_tokens_processed,
             'total_tokens_updated': total_tokens_updated,
             'overall_success_rate': (total_tokens_updated / total_tokens_processed) * 100 if total_tokens_processed > 0 else 0,
             'total_errors': total_errors,
-            'error_rate': (total_errors / len(executions)) * 100 if executions else 0,
-            'executions_per_hour': len(last_hour),
-            'tokens_per_minute': (sum(e['tokens_processed'] for e in last_hour) / 60) if last_hour else 0,
-            'last_execution_time': executions[-1]['timestamp'] if executions else 0
+            'error_rate': (total_errors / execution_count) * 100,
+            'executions_per_hour': hour_count,
+            'tokens_per_minute': (hour_tokens_processed / 60) if hour_count else 0,
+            'last_execution_time': executions[-1]['timestamp']
         }
     
     def _calculate_percentile(self, values: List[float], percentile: int) -> float:
         """Calculate percentile value from a list of numbers."""
+        return self._calculate_percentiles(values, (percentile,))[0]
+    
+    def _calculate_percentiles(self, values: List[float], percentiles: Tuple[int, ...]) -> List[float]:
+        """Calculate several percentiles of a list of numbers with a single sort."""
         if not values:
-            return 0.0
+            return [0.0] * len(percentiles)
         
         sorted_values = sorted(values)
+        return [self._percentile_of_sorted(sorted_values, percentile) for percentile in percentiles]
+    
+    @staticmethod
+    def _percentile_of_sorted(sorted_values: List[float], percentile: int) -> float:
+        """Interpolate a percentile from already sorted values."""
         if len(sorted_values) == 1:
             return sorted_values[0]
 
@@ -482,19 +722,21 @@ class PerformanceTracker:
     
     def get_api_performance(self, service: str) -> Dict:
         """Get performance statistics for an API service."""
+        self._refresh_api_stats(service)
         if service not in self._api_stats:
             return {}
         
         stats = self._api_stats[service].copy()
+        response_times = self._api_calls[service].response_times
+        call_count = len(response_times)
         
         # Add trend analysis
-        calls = list(self._api_calls[service])
-        if len(calls) >= 10:
-            recent_calls = calls[-10:]
-            older_calls = calls[-20:-10] if len(calls) >= 20 else calls[:-10]
+        if call_count >= 10:
+            recent_times = response_times.tail(10)
+            older_times = response_times.slice(call_count - 20, call_count - 10)
             
-            recent_avg = sum(c['response_time'] for c in recent_calls) / len(recent_calls)
-            older_avg = sum(c['response_time'] for c in older_calls) / len(older_calls) if older_calls else recent_avg
+            recent_avg = sum(recent_times) / len(recent_times)
+            older_avg = sum(older_times) / len(older_times) if older_times else recent_avg
             
             stats['response_time_trend'] = 'improving' if recent_avg < older_avg else 'degrading' if recent_avg > older_avg else 'stable'
             stats['response_time_change_percent'] = ((recent_avg - older_avg) / older_avg) * 100 if older_avg > 0 else 0
@@ -506,6 +748,7 @@ class PerformanceTracker:
     
     def get_scheduler_performance(self, group: str) -> Dict:
         """Get performance statistics for a scheduler group."""
+        self._refresh_scheduler_stats(group)
         if group not in self._scheduler_stats:
             return {}
         
@@ -530,27 +773,34 @@ class PerformanceTracker:
     
     def get_system_performance(self) -> Dict:
         """Get system-level performance statistics."""
-        if not self._system_metrics:
+        metrics = self._system_metrics
+        metrics_count = len(metrics)
+        if not metrics_count:
             return {}
         
-        metrics = list(self._system_metrics)
-        now = time.time()
-        recent_metrics = [m for m in metrics if now - m['timestamp'] <= 3600]  # Last hour
+        # Last hour, as a suffix of the time-ordered samples
+        recent_start = bisect.bisect_left(metrics.timestamps, time.time() - 3600)
+        if recent_start == metrics_count:
+            recent_start = 0
+        recent_count = metrics_count - recent_start
         
-        if not recent_metrics:
-            recent_metrics = metrics
+        # Read each column once; sum() and max() run over plain float lists
+        cpu = metrics.cpu_percent.slice(recent_start, metrics_count)
+        memory = metrics.memory_percent.slice(recent_start, metrics_count)
+        disk = metrics.disk_percent.slice(recent_start, metrics_count)
+        connections = metrics.active_connections.slice(recent_start, metrics_count)
         
         # Calculate averages
-        avg_cpu = sum(m['cpu_percent'] for m in recent_metrics) / len(recent_metrics)
-        avg_memory = sum(m['memory_percent'] for m in recent_metrics) / len(recent_metrics)
-        avg_disk = sum(m['disk_percent'] for m in recent_metrics) / len(recent_metrics)
-        avg_connections = sum(m['active_connections'] for m in recent_metrics) / len(recent_metrics)
+        avg_cpu = sum(cpu) / recent_count
+        avg_memory = sum(memory) / recent_count
+        avg_disk = sum(disk) / recent_count
+        avg_connections = sum(connections) / recent_count
         
         # Calculate peaks
-        max_cpu = max(m['cpu_percent'] for m in recent_metrics)
-        max_memory = max(m['memory_percent'] for m in recent_metrics)
-        max_disk = max(m['disk_percent'] for m in recent_metrics)
-        max_connections = max(m['active_connections'] for m in recent_metrics)
+        max_cpu = max(cpu)
+        max_memory = max(memory)
+        max_disk = max(disk)
+        max_connections = max(connections)
         
         return {
             'uptime_seconds': time.time() - self._start_time,
@@ -562,8 +812,8 @@ class PerformanceTracker:
             'peak_memory_percent': max_memory,
             'peak_disk_percent': max_disk,
             'peak_connections': max_connections,
-            'metrics_collected': len(metrics),
-            'recent_metrics_count': len(recent_metrics)
+            'metrics_collected': metrics_count,
+            'recent_metrics_count': recent_count
         }
     
     def get_performance_summary(self) -> Dict:
@@ -575,13 +825,18 @@ class PerformanceTracker:
             'overall_health': 'healthy'
         }
         
-        # Add API performance
-        for service in self._api_stats.keys():
-            summary['apis'][service] = self.get_api_performance(service)
+        # Add API performance (stats are computed lazily, so walk every
+        # recorded service rather than the stats computed so far)
+        for service in self._api_dirty.keys():
+            api_stats = self.get_api_performance(service)
+            if api_stats:
+                summary['apis'][service] = api_stats
         
         # Add scheduler performance
-        for group in self._scheduler_stats.keys():
-            summary['scheduler_groups'][group] = self.get_scheduler_performance(group)
+        for group in self._scheduler_dirty.keys():
+            scheduler_stats = self.get_scheduler_performance(group)
+            if scheduler_stats:
+                summary['scheduler_groups'][group] = scheduler_stats
         
         # Determine overall health based on performance metrics
         health_issues = []
@@ -625,6 +880,11 @@ class PerformanceTracker:
         """Detect performance anomalies based on historical data."""
         anomalies = []
         
+        if service:
+            self._refresh_api_stats(service)
+        if group:
+            self._refresh_scheduler_stats(group)
+        
         if service and service in self._api_stats:
             api_stats = self.get_api_performance(service)
             
@@ -681,39 +941,37 @@ class PerformanceTracker:
         cutoff_time = now - (max_age_hours * seconds_per_hour)
         cleaned_count = 0
         
-        # Clean API call data
-        for service in self._api_calls:
-            original_size = len(self._api_calls[service])
-            self._api_calls[service] = deque(
-                [call for call in self._api_calls[service] if call['timestamp'] > cutoff_time],
-                maxlen=self.max_history_size
-            )
-            cleaned_count += original_size - len(self._api_calls[service])
+        # Clean API call data (calls are time-ordered, so old ones are at the head)
+        for service, calls in self._api_calls.items():
+            timestamps = calls.timestamps
+            original_size = len(calls)
+            while calls and timestamps[0] <= cutoff_time:
+                calls.popleft()
+            cleaned_count += original_size - len(calls)
             
-            # Update stats after cleanup
-            if self._api_calls[service]:
-                self._update_api_stats(service)
-        
-        # Clean scheduler execution data
-        for group in self._scheduler_executions:
-            original_size = len(self._scheduler_executions[group])
-            self._scheduler_executions[group] = deque(
-                [exec for exec in self._scheduler_executions[group] if exec['timestamp'] > cutoff_time],
-                maxlen=self.max_history_size
-            )
-            cleaned_count += original_size - len(self._scheduler_executions[group])
+            # Refresh stats on next read
+            if calls:
+                self._api_dirty[service] = True
+        
+        # Clean scheduler execution data (time-ordered, so old ones are at the head)
+        for group, executions in self._scheduler_executions.items():
+            timestamps = self._scheduler_timestamps[group]
+            original_size = len(executions)
+            while executions and executions[0]['timestamp'] <= cutoff_time:
+                executions.popleft()
+                timestamps.popleft()
+            cleaned_count += original_size - len(executions)
             
-            # Update stats after cleanup
-            if self._scheduler_executions[group]:
-                self._update_scheduler_stats(group)
-        
-        # Clean system metrics
-        original_size = len(self._system_metrics)
-        self._system_metrics = deque(
-            [metric for metric in self._system_metrics if metric['timestamp'] > cutoff_time],
-            maxlen=self.max_history_size
-        )
-        cleaned_count += original_size - len(self._system_metrics)
+            # Refresh stats on next read
+            if executions:
+                self._scheduler_dirty[group] = True
+        
+        # Clean system metrics (time-ordered, so old ones are at the head)
+        system_metrics = self._system_metrics
+        original_size = len(system_metrics)
+        while system_metrics and system_metrics.timestamps[0] <= cutoff_time:
+            system_metrics.popleft()
+        cleaned_count += original_size - len(system_metrics)
         
         return cleaned_count
 
@@ -727,6 +985,59 @@ def get_performance_tracker() -> PerformanceTracker:
     return performance_tracker
 
 
+class LoadHistory:
+    """
+    Recent system load assessments, stored column-wise in typed ring buffers.
+    
+    Indexing or iterating yields load metric dicts, but trend checks and
+    statistics read the numeric columns directly.
+    """
+    
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.timestamps = RingBuffer(maxlen)
+        self.cpu_percent = RingBuffer(maxlen)
+        self.memory_percent = RingBuffer(maxlen)
+        self.disk_percent = RingBuffer(maxlen)
+        self.connections = RingBuffer(maxlen, "q")
+        self.load_score = RingBuffer(maxlen)
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index: int) -> Dict[str, float]:
+        """Return the assessment at ``index`` as a load metrics dict."""
+        return {
+            "cpu_percent": self.cpu_percent[index],
+            "memory_percent": self.memory_percent[index],
+            "disk_percent": self.disk_percent[index],
+            "connections": self.connections[index],
+            "load_score": self.load_score[index],
+            "timestamp": self.timestamps[index]
+        }
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, load_metrics: Dict[str, float]):
+        """Record an assessment, evicting the oldest one when the history is full."""
+        self.timestamps.append(load_metrics.get("timestamp", 0.0))
+        self.cpu_percent.append(load_metrics["cpu_percent"])
+        self.memory_percent.append(load_metrics["memory_percent"])
+        self.disk_percent.append(load_metrics.get("disk_percent", 0.0))
+        self.connections.append(load_metrics.get("connections", 0))
+        self.load_score.append(load_metrics.get("load_score", 0.0))
+    
+    def clear(self):
+        self.timestamps.clear()
+        self.cpu_percent.clear()
+        self.memory_percent.clear()
+        self.disk_percent.clear()
+        self.connections.clear()
+        self.load_score.clear()
+
+
 class LoadBasedProcessor:
     """
     Load-based processing adjustment system.
@@ -736,7 +1047,6 @@ class LoadBasedProcessor:
     """
     
     def __init__(self, initial_processing_factor: float = 1.0):
-        import logging
         self.log = logging.getLogger("load_processor")
         self.initial_processing_factor = initial_processing_factor
         
@@ -752,12 +1062,23 @@ class LoadBasedProcessor:
         
         # Current state
         self.current_load_level = "normal"  # normal, reduced, minimal
-        # Initialize processing factor from config or use normal factor
-        self.current_processing_factor = getattr(self, 'initial_processing_factor', self.normal_processing_factor)
-        self.disabled_features = set()
+        # Initialize processing factor from config
+        self.current_processing_factor = self.initial_processing_factor
+        # Replaced wholesale (never mutated) on each adjustment
+        self.disabled_features: frozenset = frozenset()
+        # disabled_features in a fixed order for result payloads, rebuilt only
+        # when _adjust_features installs a different set
+        self._disabled_list_source: Optional[frozenset] = None
+        self._disabled_list: Tuple[str, ...] = ()
+        
+        # Disk usage changes slowly and barely weighs in the load score, so it
+        # is refreshed at most every _disk_usage_ttl seconds.
+        # The cache is a (fetched_at, disk_percent) pair.
+        self._disk_usage_ttl = 30.0
+        self._disk_cache: Tuple[float, float] = (0.0, 0.0)
         
         # Load history for trend analysis
-        self.load_history = deque(maxlen=60)  # Last 60 measurements
+        self.load_history = LoadHistory(maxlen=60)  # Last 60 measurements
         
         # Hysteresis to prevent oscillation
         self.hysteresis_margin = 5.0  # 5% margin for state changes
@@ -775,6 +1096,17 @@ class LoadBasedProcessor:
             "statistics_calculation": 1  # Least important
         }
         
+        # Priorities are fixed, so resolve which features each load level
+        # disables once instead of rescanning them on every adjustment
+        self._features_disabled_at_minimal = frozenset(
+            feature for feature, priority in self.feature_priorities.items()
+            if priority <= 5  # Disable features with priority 5 or lower
+        )
+        self._features_disabled_at_reduced = frozenset(
+            feature for feature, priority in self.feature_priorities.items()
+            if priority <= 3  # Disable features with priority 3 or lower
+        )
+        
         self.log.info("LoadBasedProcessor initialized")
     
     def assess_system_load(self) -> Dict[str, float]:
@@ -788,8 +1120,15 @@ class LoadBasedProcessor:
             memory_percent = memory.percent
             
             # Get disk usage for main partition
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
+            now = time.time()
+            fetched_at, disk_percent = self._disk_cache
+            if now - fetched_at > self._disk_usage_ttl:
+                try:
+                    disk = psutil.disk_usage('/')
+                    disk_percent = (disk.used / disk.total) * 100
+                except Exception:
+                    pass  # Keep the last known value
+                self._disk_cache = (now, disk_percent)
             
             # Network connections
             try:
@@ -808,7 +1147,7 @@ class LoadBasedProcessor:
                 "disk_percent": disk_percent,
                 "connections": connections,
                 "load_score": load_score,
-                "timestamp": time.time()
+                "timestamp": now
             }
             
             # Add to history
@@ -832,17 +1171,19 @@ class LoadBasedProcessor:
         cpu_percent = load_metrics["cpu_percent"]
         memory_percent = load_metrics["memory_percent"]
         
+        # Common case first: below both warning thresholds (and so below the
+        # critical ones) settles the level in two comparisons
+        if (cpu_percent < self.cpu_threshold_warning and
+            memory_percent < self.memory_threshold_warning):
+            return "normal"
+        
         # Check for critical load
         if (cpu_percent >= self.cpu_threshold_critical or 
             memory_percent >= self.memory_threshold_critical):
             return "minimal"
         
-        # Check for warning load
-        if (cpu_percent >= self.cpu_threshold_warning or 
-            memory_percent >= self.memory_threshold_warning):
-            return "reduced"
-        
-        return "normal"
+        # At or above a warning threshold
+        return "reduced"
     
     def should_change_load_level(self, new_level: str) -> bool:
         """Determine if load level should change, considering hysteresis."""
@@ -853,34 +1194,36 @@ class LoadBasedProcessor:
         if len(self.load_history) < 3:
             return True  # Not enough history, allow change
         
-        recent_metrics = list(self.load_history)[-3:]
+        recent_cpu = self.load_history.cpu_percent.tail(3)
+        recent_memory = self.load_history.memory_percent.tail(3)
         
         # Check if the trend is consistent
         if new_level == "minimal":
             # Moving to minimal - check if consistently high
-            high_load_count = sum(1 for m in recent_metrics 
-                                if m["cpu_percent"] >= self.cpu_threshold_critical - self.hysteresis_margin
-                                or m["memory_percent"] >= self.memory_threshold_critical - self.hysteresis_margin)
+            cpu_limit = self.cpu_threshold_critical - self.hysteresis_margin
+            memory_limit = self.memory_threshold_critical - self.hysteresis_margin
+            high_load_count = sum(1 for cpu, memory in zip(recent_cpu, recent_memory)
+                                if cpu >= cpu_limit or memory >= memory_limit)
             return high_load_count >= 2
         
         elif new_level == "reduced":
             if self.current_load_level == "minimal":
                 # Moving from minimal to reduced - check if load decreased
-                avg_cpu = sum(m["cpu_percent"] for m in recent_metrics) / len(recent_metrics)
-                avg_memory = sum(m["memory_percent"] for m in recent_metrics) / len(recent_metrics)
+                avg_cpu = sum(recent_cpu) / len(recent_cpu)
+                avg_memory = sum(recent_memory) / len(recent_memory)
                 return (avg_cpu < self.cpu_threshold_critical - self.hysteresis_margin and
                        avg_memory < self.memory_threshold_critical - self.hysteresis_margin)
             else:
                 # Moving from normal to reduced - check if consistently elevated
-                elevated_count = sum(1 for m in recent_metrics 
-                                   if m["cpu_percent"] >= self.cpu_threshold_warning
-                                   or m["memory_percent"] >= self.memory_threshold_warning)
+                elevated_count = sum(1 for cpu, memory in zip(recent_cpu, recent_memory)
+                                   if cpu >= self.cpu_threshold_warning
+                                   or memory >= self.memory_threshold_warning)
                 return elevated_count >= 2
         
         elif new_level == "normal":
             # Moving to normal - check if load consistently decreased
-            avg_cpu = sum(m["cpu_percent"] for m in recent_metrics) / len(recent_metrics)
-            avg_memory = sum(m["memory_percent"] for m in recent_metrics) / len(recent_metrics)
+            avg_cpu = sum(recent_cpu) / len(recent_cpu)
+            avg_memory = sum(recent_memory) / len(recent_memory)
             return (avg_cpu < self.cpu_threshold_warning - self.hysteresis_margin and
                    avg_memory < self.memory_threshold_warning - self.hysteresis_margin)
         
@@ -901,15 +1244,17 @@ class LoadBasedProcessor:
         else:
             self.current_processing_factor = self.normal_processing_factor
         
-        # Adjust feature availability
-        self._adjust_features(load_level)
+        # Adjust feature availability; the disabled set already matches the
+        # level when it is unchanged
+        if load_level != previous_level:
+            self._adjust_features(load_level)
         
         adjustments = {
             "previous_level": previous_level,
             "new_level": load_level,
             "previous_factor": previous_factor,
             "new_factor": self.current_processing_factor,
-            "disabled_features": list(self.disabled_features),
+            "disabled_features": self._get_disabled_list(),
             "timestamp": time.time()
         }
         
@@ -921,7 +1266,7 @@ class LoadBasedProcessor:
                         "previous_level": previous_level,
                         "new_level": load_level,
                         "processing_factor": self.current_processing_factor,
-                        "disabled_features": list(self.disabled_features)
+                        "disabled_features": self._get_disabled_list()
                     }
                 }
             )
@@ -932,23 +1277,23 @@ class LoadBasedProcessor:
         """Adjust feature availability based on load level."""
         if load_level == "minimal":
             # Disable non-essential features
-            features_to_disable = [
-                feature for feature, priority in self.feature_priorities.items()
-                if priority <= 5  # Disable features with priority 5 or lower
-            ]
-            self.disabled_features.update(features_to_disable)
+            self.disabled_features = self._features_disabled_at_minimal
             
         elif load_level == "reduced":
             # Disable only least important features
-            features_to_disable = [
-                feature for feature, priority in self.feature_priorities.items()
-                if priority <= 3  # Disable features with priority 3 or lower
-            ]
-            self.disabled_features.update(features_to_disable)
+            self.disabled_features = self._features_disabled_at_reduced
             
         else:  # normal
             # Enable all features
-            self.disabled_features.clear()
+            self.disabled_features = frozenset()
+    
+    def _get_disabled_list(self) -> List[str]:
+        """Return the disabled features as a new list, from a cached tuple while they are unchanged."""
+        if self._disabled_list_source is not self.disabled_features:
+            self._disabled_list = tuple(self.disabled_features)
+            self._disabled_list_source = self.disabled_features
+        # Callers own the list they get, so hand out a copy of the shared tuple
+        return list(self._disabled_list)
     
     def is_feature_enabled(self, feature_name: str) -> bool:
         """Check if a feature is currently enabled."""
@@ -960,20 +1305,21 @@ class LoadBasedProcessor:
     
     def get_adjusted_interval(self, base_interval: float) -> float:
         """Get adjusted interval based on current processing factor."""
-        if self.current_processing_factor >= 1.0:
+        factor = self.current_processing_factor
+        if factor >= 1.0:
             return base_interval
         
         # Increase interval when processing factor is reduced
-        return base_interval / self.current_processing_factor
+        return base_interval / factor
     
     def get_adjusted_batch_size(self, base_batch_size: int) -> int:
         """Get adjusted batch size based on current processing factor."""
         adjusted_size = int(base_batch_size * self.current_processing_factor)
-        return max(1, adjusted_size)  # Ensure at least 1
+        return adjusted_size if adjusted_size >= 1 else 1  # Ensure at least 1
     
     def should_skip_processing(self, feature_name: str) -> bool:
         """Check if processing should be skipped for a feature."""
-        return not self.is_feature_enabled(feature_name)
+        return feature_name in self.disabled_features
     
     def process_load_adjustment(self) -> Dict[str, Any]:
         """Main method to assess load and adjust processing."""
@@ -993,7 +1339,7 @@ class LoadBasedProcessor:
                     "new_level": self.current_load_level,
                     "previous_factor": self.current_processing_factor,
                     "new_factor": self.current_processing_factor,
-                    "disabled_features": list(self.disabled_features),
+                    "disabled_features": self._get_disabled_list(),
                     "timestamp": time.time(),
                     "no_change": True
                 }
@@ -1017,29 +1363,48 @@ class LoadBasedProcessor:
         if not self.load_history:
             return {"error": "No load history available"}
         
-        recent_metrics = list(self.load_history)
+        history = self.load_history
+        history_size = len(history)
+        cpu_values = history.cpu_percent.tail(history_size)
+        memory_values = history.memory_percent.tail(history_size)
+        load_scores = history.load_score.tail(history_size)
         
         # Calculate averages
-        avg_cpu = sum(m["cpu_percent"] for m in recent_metrics) / len(recent_metrics)
-        avg_memory = sum(m["memory_percent"] for m in recent_metrics) / len(recent_metrics)
-        avg_load_score = sum(m["load_score"] for m in recent_metrics) / len(recent_metrics)
+        avg_cpu = sum(cpu_values) / history_size
+        avg_memory = sum(memory_values) / history_size
+        avg_load_score = sum(load_scores) / history_size
         
         # Calculate peaks
-        max_cpu = max(m["cpu_percent"] for m in recent_metrics)
-        max_memory = max(m["memory_percent"] for m in recent_metrics)
-        max_load_score = max(m["load_score"] for m in recent_metrics)
-        
-        # Calculate load level distribution
-        level_counts = {"normal": 0, "reduced": 0, "minimal": 0}
-        for metrics in recent_metrics:
-            level = self.determine_load_level(metrics)
-            level_counts[level] += 1
+        max_cpu = max(cpu_values)
+        max_memory = max(memory_values)
+        max_load_score = max(load_scores)
+        
+        # Calculate load level distribution, with determine_load_level's
+        # threshold checks inlined in the same order so no per-sample dict
+        # or call is needed
+        cpu_critical = self.cpu_threshold_critical
+        memory_critical = self.memory_threshold_critical
+        cpu_warning = self.cpu_threshold_warning
+        memory_warning = self.memory_threshold_warning
+        minimal_count = reduced_count = 0
+        for cpu, memory in zip(cpu_values, memory_values):
+            if cpu < cpu_warning and memory < memory_warning:
+                continue
+            if cpu >= cpu_critical or memory >= memory_critical:
+                minimal_count += 1
+            else:
+                reduced_count += 1
+        level_counts = {
+            "normal": history_size - minimal_count - reduced_count,
+            "reduced": reduced_count,
+            "minimal": minimal_count
+        }
         
         return {
             "current_state": {
                 "load_level": self.current_load_level,
                 "processing_factor": self.current_processing_factor,
-                "disabled_features": list(self.disabled_features),
+                "disabled_features": self._get_disabled_list(),
                 "enabled_features": [f for f in self.feature_priorities.keys() 
                                    if f not in self.disabled_features]
             },
@@ -1060,7 +1425,7 @@ class LoadBasedProcessor:
                 "memory_warning": self.memory_threshold_warning,
                 "memory_critical": self.memory_threshold_critical
             },
-            "history_size": len(recent_metrics),
+            "history_size": history_size,
             "timestamp": time.time()
         }
     
@@ -1102,6 +1467,16 @@ def get_load_processor() -> LoadBasedProcessor:
     """Get the global load-based processor instance."""
     return load_processor
 
+class PerformanceSnapshot(NamedTuple):
+    """Current system and service performance read by the optimizer."""
+    cpu_usage: float = 0
+    memory_usage: float = 0
+    response_time: float = 0
+    throughput: float = 0
+    error_rate: float = 0
+    queue_length: float = 0
+
+
 class PerformanceOptimizer:
     """
     Automatic performance optimization system.
@@ -1111,9 +1486,6 @@ class PerformanceOptimizer:
     """
     
     def __init__(self):
-        import threading
-        import time
-        
         # Avoid circular import - initialize logger later
         self.logger = None
         self.performance_tracker = get_performance_tracker()
@@ -1127,6 +1499,9 @@ class PerformanceOptimizer:
         # Performance history for trend analysis
         self.performance_history = {}
         self.optimization_history = {}
+        # Timestamps of performance_history entries, in a parallel list per
+        # service so time cutoffs can be found by bisection
+        self._performance_timestamps: Dict[str, List[float]] = {}
         
         # Optimization settings
         self.min_batch_size = 10
@@ -1148,6 +1523,25 @@ class PerformanceOptimizer:
         self.optimization_interval = 60  # seconds
         self.last_optimization = {}
         
+        # Running sums over each service's recent metrics (the last
+        # recent_metrics_limit recorded within recent_metrics_minutes), as
+        # (timestamps, response time, CPU usage, memory usage stats)
+        self.recent_metrics_minutes = 5
+        self.recent_metrics_limit = 20
+        self._recent_windows: Dict[str, Tuple[deque, RollingStats, RollingStats, RollingStats]] = {}
+        
+        # System load reading shared by every service's performance snapshot,
+        # as a (monotonic time, load metrics) pair reused for
+        # system_load_ttl seconds
+        self.system_load_ttl = 2.0
+        self._system_load_cache: Tuple[float, Optional[Dict[str, float]]] = (0.0, None)
+        
+        # Optimization counts kept as history changes: the total across
+        # services, and per service the timestamps of its history entries
+        # from the last hour (always a suffix of that history)
+        self._total_optimizations = 0
+        self._recent_optimization_times: Dict[str, deque] = defaultdict(deque)
+        
         # Thread safety
         self._lock = threading.Lock()
         
@@ -1168,13 +1562,12 @@ class PerformanceOptimizer:
             self.parallelism_levels[service] = self.default_parallelism
             self.memory_thresholds[service] = self.memory_threshold_high
             self.performance_history[service] = []
+            self._performance_timestamps[service] = []
             self.optimization_history[service] = []
             self.last_optimization[service] = 0
     
     def should_optimize(self, service: str) -> bool:
         """Check if optimization should be performed for a service."""
-        import time
-        
         current_time = time.time()
         last_opt = self.last_optimization.get(service, 0)
         
@@ -1183,14 +1576,12 @@ class PerformanceOptimizer:
             return False
         
         # Check if performance metrics indicate need for optimization
-        recent_metrics = self._get_recent_performance_metrics(service)
-        if not recent_metrics:
+        recent_averages = self._get_recent_performance_averages(service, current_time)
+        if recent_averages is None:
             return False
         
         # Check for performance degradation
-        avg_response_time = sum(m.get("response_time", 0) for m in recent_metrics) / len(recent_metrics)
-        avg_cpu_usage = sum(m.get("cpu_usage", 0) for m in recent_metrics) / len(recent_metrics)
-        avg_memory_usage = sum(m.get("memory_usage", 0) for m in recent_metrics) / len(recent_metrics)
+        avg_response_time, avg_cpu_usage, avg_memory_usage = recent_averages
         
         needs_optimization = (
             avg_response_time > self.response_time_threshold or
@@ -1210,27 +1601,88 @@ class PerformanceOptimizer:
         
         return needs_optimization
     
-    def _get_recent_performance_metrics(self, service: str, minutes: int = 5) -> List[Dict]:
+    def record_performance_metrics(self, service: str, metrics: Dict[str, float]):
+        """
+        Append a performance sample to a service's history.
+        
+        Samples must be recorded in timestamp order. Each one also updates the
+        running sums behind the recent averages checked by should_optimize.
+        """
+        if "timestamp" not in metrics:
+            metrics = dict(metrics, timestamp=time.time())
+        self.performance_history.setdefault(service, []).append(metrics)
+        self._performance_timestamps.setdefault(service, []).append(metrics["timestamp"])
+        
+        window = self._recent_windows.get(service)
+        if window is None:
+            limit = self.recent_metrics_limit
+            window = (deque(maxlen=limit), RollingStats(limit), RollingStats(limit), RollingStats(limit))
+            self._recent_windows[service] = window
+        timestamps, response_stats, cpu_stats, memory_stats = window
+        timestamps.append(metrics["timestamp"])
+        response_stats.push(metrics.get("response_time", 0))
+        cpu_stats.push(metrics.get("cpu_usage", 0))
+        memory_stats.push(metrics.get("memory_usage", 0))
+    
+    def record_current_performance(self, services: Optional[List[str]] = None) -> List[str]:
+        """
+        Record a sample of each service's current performance.
+        
+        This is what feeds the history behind should_optimize. History older
+        than a day is dropped as samples are added. Defaults to every service
+        with optimization settings; returns the services sampled.
+        """
+        self._initialize_logger()
+        with self._lock:
+            if services is None:
+                services = list(self.batch_sizes)
+            for service in services:
+                current_performance = self._get_current_performance(service)
+                self.record_performance_metrics(service, current_performance._asdict())
+                self._cleanup_old_metrics(service)
+        return services
+    
+    def _evict_recent_metrics(self, service: str, cutoff_time: float):
+        """Subtract samples stamped at or before ``cutoff_time`` from the running sums."""
+        window = self._recent_windows.get(service)
+        if window is None:
+            return
+        timestamps, response_stats, cpu_stats, memory_stats = window
+        while timestamps and timestamps[0] <= cutoff_time:
+            timestamps.popleft()
+            response_stats.pop_oldest()
+            cpu_stats.pop_oldest()
+            memory_stats.pop_oldest()
+    
+    def _get_recent_performance_averages(self, service: str,
+                                         current_time: float) -> Optional[Tuple[float, float, float]]:
+        """Average response time, CPU and memory usage over recent metrics."""
+        self._evict_recent_metrics(service, current_time - self.recent_metrics_minutes * 60)
+        
+        window = self._recent_windows.get(service)
+        if window is None or not window[0]:
+            return None
+        _, response_stats, cpu_stats, memory_stats = window
+        return response_stats.average(), cpu_stats.average(), memory_stats.average()
+    
+    def _get_recent_performance_metrics(self, service: str, minutes: int = 5,
+                                        current_time: Optional[float] = None) -> List[Dict]:
         """Get recent performance metrics for a service."""
-        import time
-        
-        cutoff_time = time.time() - (minutes * 60)
-        recent_metrics = []
+        if current_time is None:
+            current_time = time.time()
+        cutoff_time = current_time - (minutes * 60)
+        history = self.performance_history.get(service, [])
+        start = bisect.bisect_right(self._performance_timestamps.get(service, []), cutoff_time)
         
-        for metric in self.performance_history.get(service, []):
-            if metric.get("timestamp", 0) > cutoff_time:
-                recent_metrics.append(metric)
-        
-        return recent_metrics[-20:]  # Last 20 metrics
+        return history[max(start, len(history) - 20):]  # Last 20 metrics
     
-    def optimize_batch_size(self, service: str, current_performance: Dict[str, float]) -> int:
+    def optimize_batch_size(self, service: str, current_performance: PerformanceSnapshot) -> int:
         """Optimize batch size based on current performance."""
         current_batch_size = self.batch_sizes.get(service, self.default_batch_size)
         
-        cpu_usage = current_performance.get("cpu_usage", 0)
-        memory_usage = current_performance.get("memory_usage", 0)
-        response_time = current_performance.get("response_time", 0)
-        throughput = current_performance.get("throughput", 0)
+        cpu_usage = current_performance.cpu_usage
+        memory_usage = current_performance.memory_usage
+        response_time = current_performance.response_time
         
         new_batch_size = current_batch_size
         
@@ -1274,13 +1726,13 @@ class PerformanceOptimizer:
         
         return new_batch_size
     
-    def optimize_parallelism(self, service: str, current_performance: Dict[str, float]) -> int:
+    def optimize_parallelism(self, service: str, current_performance: PerformanceSnapshot) -> int:
         """Optimize parallelism level based on current performance."""
         current_parallelism = self.parallelism_levels.get(service, self.default_parallelism)
         
-        cpu_usage = current_performance.get("cpu_usage", 0)
-        memory_usage = current_performance.get("memory_usage", 0)
-        queue_length = current_performance.get("queue_length", 0)
+        cpu_usage = current_performance.cpu_usage
+        memory_usage = current_performance.memory_usage
+        queue_length = current_performance.queue_length
         
         new_parallelism = current_parallelism
         
@@ -1309,13 +1761,11 @@ class PerformanceOptimizer:
         
         return new_parallelism
     
-    def perform_memory_cleanup(self, service: str, current_performance: Dict[str, float]):
+    def perform_memory_cleanup(self, service: str, current_performance: PerformanceSnapshot):
         """Perform memory cleanup when usage is high."""
-        memory_usage = current_performance.get("memory_usage", 0)
+        memory_usage = current_performance.memory_usage
         
         if memory_usage > self.memory_threshold_high:
-            import gc
-            
             self.logger.info(
                 f"Performing memory cleanup for {service}",
                 service=service,
@@ -1337,127 +1787,158 @@ class PerformanceOptimizer:
     
     def _cleanup_old_metrics(self, service: str, keep_hours: int = 24):
         """Clean up old performance metrics to free memory."""
-        import time
-        
         cutoff_time = time.time() - (keep_hours * 3600)
         
         # Clean performance history
+        self._evict_recent_metrics(service, cutoff_time)
         if service in self.performance_history:
-            old_count = len(self.performance_history[service])
-            self.performance_history[service] = [
-                m for m in self.performance_history[service] 
-                if m.get("timestamp", 0) > cutoff_time
-            ]
-            new_count = len(self.performance_history[service])
+            timestamps = self._performance_timestamps.get(service, [])
+            removed = bisect.bisect_right(timestamps, cutoff_time)
+            del self.performance_history[service][:removed]
+            del timestamps[:removed]
             
-            if old_count > new_count:
+            if removed:
                 self.logger.debug(
                     f"Cleaned up old performance metrics for {service}",
                     service=service,
-                    removed_metrics=old_count - new_count
+                    removed_metrics=removed
                 )
         
         # Clean optimization history
         if service in self.optimization_history:
-            old_count = len(self.optimization_history[service])
-            self.optimization_history[service] = [
-                m for m in self.optimization_history[service] 
-                if m.get("timestamp", 0) > cutoff_time
-            ]
-            new_count = len(self.optimization_history[service])
+            removed = self._drop_entries_before(self.optimization_history[service], cutoff_time)
             
-            if old_count > new_count:
+            if removed:
+                self._optimizations_removed(service, removed)
                 self.logger.debug(
                     f"Cleaned up old optimization history for {service}",
                     service=service,
-                    removed_entries=old_count - new_count
+                    removed_entries=removed
                 )
     
+    @staticmethod
+    def _drop_entries_before(entries: List[Dict], cutoff_time: float) -> int:
+        """
+        Delete entries stamped at or before ``cutoff_time`` in place.
+        
+        Entries are appended in timestamp order, so the stale ones form a
+        prefix: find its end by bisecting on the timestamps and delete it with
+        a single slice deletion, keeping the list object shared with callers.
+        """
+        idx = bisect.bisect_right(entries, cutoff_time, key=_timestamp_of)
+        del entries[:idx]
+        return idx
+    
     def optimize_service(self, service: str) -> Dict[str, Any]:
         """Perform comprehensive optimization for a service."""
-        import time
-        
         with self._lock:
-            if not self.should_optimize(service):
-                return {"optimized": False, "reason": "optimization_not_needed"}
-            
-            # Get current performance metrics
-            current_performance = self._get_current_performance(service)
-            
-            optimization_result = {
-                "service": service,
-                "timestamp": time.time(),
-                "optimized": True,
-                "changes": {}
-            }
-            
-            # Optimize batch size
-            old_batch_size = self.batch_sizes.get(service, self.default_batch_size)
-            new_batch_size = self.optimize_batch_size(service, current_performance)
-            if new_batch_size != old_batch_size:
-                optimization_result["changes"]["batch_size"] = {
-                    "old": old_batch_size,
-                    "new": new_batch_size
-                }
-            
-            # Optimize parallelism
-            old_parallelism = self.parallelism_levels.get(service, self.default_parallelism)
-            new_parallelism = self.optimize_parallelism(service, current_performance)
-            if new_parallelism != old_parallelism:
-                optimization_result["changes"]["parallelism"] = {
-                    "old": old_parallelism,
-                    "new": new_parallelism
-                }
-            
-            # Perform memory cleanup if needed
-            memory_usage = current_performance.get("memory_usage", 0)
-            if memory_usage > self.memory_threshold_high:
-                self.perform_memory_cleanup(service, current_performance)
-                optimization_result["changes"]["memory_cleanup"] = True
-            
-            # Record optimization
-            self.last_optimization[service] = time.time()
-            self.optimization_history[service].append(optimization_result)
-            
-            # Keep only recent optimization history
-            if len(self.optimization_history[service]) > 100:
-                self.optimization_history[service] = self.optimization_history[service][-50:]
-            
-            self.logger.info(
-                f"Service optimization completed: {service}",
-                service=service,
-                changes=optimization_result["changes"],
-                performance_metrics=current_performance
-            )
-            
-            return optimization_result
+            return self._optimize_service_locked(service)
     
-    def _get_current_performance(self, service: str) -> Dict[str, float]:
-        """Get current performance metrics for a service."""
-        # Get system metrics
-        system_metrics = self.load_processor.get_current_load()
+    def optimize_services(self, services: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Optimize several services under a single acquisition of the lock."""
+        with self._lock:
+            return {service: self._optimize_service_locked(service) for service in services}
+    
+    def _optimize_service_locked(self, service: str) -> Dict[str, Any]:
+        """Optimize a service; the caller must hold ``self._lock``."""
+        if not self.should_optimize(service):
+            return {"optimized": False, "reason": "optimization_not_needed"}
         
-        # Get service-specific metrics from performance tracker
-        service_stats = self.performance_tracker.get_service_statistics(service)
+        # Get current performance metrics
+        current_performance = self._get_current_performance(service)
         
-        return {
-            "cpu_usage": system_metrics.get("cpu_percent", 0),
-            "memory_usage": system_metrics.get("memory_percent", 0),
-            "response_time": service_stats.get("avg_response_time", 0),
-            "throughput": service_stats.get("requests_per_minute", 0),
-            "error_rate": service_stats.get("error_rate", 0),
-            "queue_length": service_stats.get("queue_length", 0)
+        optimization_result = {
+            "service": service,
+            "timestamp": time.time(),
+            "optimized": True,
+            "changes": {}
         }
+        
+        # Optimize batch size
+        old_batch_size = self.batch_sizes.get(service, self.default_batch_size)
+        new_batch_size = self.optimize_batch_size(service, current_performance)
+        if new_batch_size != old_batch_size:
+            optimization_result["changes"]["batch_size"] = {
+                "old": old_batch_size,
+                "new": new_batch_size
+            }
+        
+        # Optimize parallelism
+        old_parallelism = self.parallelism_levels.get(service, self.default_parallelism)
+        new_parallelism = self.optimize_parallelism(service, current_performance)
+        if new_parallelism != old_parallelism:
+            optimization_result["changes"]["parallelism"] = {
+                "old": old_parallelism,
+                "new": new_parallelism
+            }
+        
+        # Perform memory cleanup if needed
+        if current_performance.memory_usage > self.memory_threshold_high:
+            self.perform_memory_cleanup(service, current_performance)
+            optimization_result["changes"]["memory_cleanup"] = True
+        
+        # Record optimization
+        self.last_optimization[service] = time.time()
+        history = self.optimization_history[service]
+        history.append(optimization_result)
+        self._total_optimizations += 1
+        self._recent_optimization_times[service].append(optimization_result["timestamp"])
+        
+        # Keep only recent optimization history
+        if len(history) > 100:
+            removed = len(history) - 50
+            del history[:removed]
+            self._optimizations_removed(service, removed)
+        
+        self.logger.info(
+            f"Service optimization completed: {service}",
+            service=service,
+            changes=optimization_result["changes"],
+            performance_metrics=current_performance._asdict()
+        )
+        
+        return optimization_result
+    
+    def _optimizations_removed(self, service: str, removed: int):
+        """Update optimization counters after deleting the oldest ``removed`` entries."""
+        self._total_optimizations -= removed
+        recent = self._recent_optimization_times[service]
+        excess = len(recent) - len(self.optimization_history[service])
+        for _ in range(excess):
+            recent.popleft()
+    
+    def _get_current_performance(self, service: str) -> PerformanceSnapshot:
+        """Get current performance metrics for a service."""
+        # Get system metrics; optimization and recommendations for several
+        # services within system_load_ttl share one psutil reading
+        now = time.monotonic()
+        loaded_at, system_metrics = self._system_load_cache
+        if system_metrics is None or now - loaded_at >= self.system_load_ttl:
+            system_metrics = self.load_processor.get_current_load()
+            self._system_load_cache = (now, system_metrics)
+        
+        # Get service-specific metrics from performance tracker; it reports
+        # response times in milliseconds and error rates in percent, while the
+        # optimizer works in seconds and fractions
+        service_stats = self.performance_tracker.get_api_performance(service)
+        
+        return PerformanceSnapshot(
+            cpu_usage=system_metrics.get("cpu_percent", 0),
+            memory_usage=system_metrics.get("memory_percent", 0),
+            response_time=service_stats.get("average_response_time", 0) / 1000,
+            throughput=service_stats.get("calls_per_minute", 0),
+            error_rate=service_stats.get("error_rate", 0) / 100
+        )
     
     def get_optimization_recommendations(self, service: str) -> List[Dict[str, Any]]:
         """Get optimization recommendations for a service."""
         current_performance = self._get_current_performance(service)
         recommendations = []
         
-        cpu_usage = current_performance.get("cpu_usage", 0)
-        memory_usage = current_performance.get("memory_usage", 0)
-        response_time = current_performance.get("response_time", 0)
-        error_rate = current_performance.get("error_rate", 0)
+        cpu_usage = current_performance.cpu_usage
+        memory_usage = current_performance.memory_usage
+        response_time = current_performance.response_time
+        error_rate = current_performance.error_rate
         
         # CPU recommendations
         if cpu_usage > self.cpu_threshold_high:
@@ -1534,22 +2015,17 @@ class PerformanceOptimizer:
     
     def get_optimization_statistics(self) -> Dict[str, Any]:
         """Get overall optimization statistics."""
-        import time
-        
-        total_optimizations = sum(len(history) for history in self.optimization_history.values())
-        
         recent_optimizations = 0
         cutoff_time = time.time() - 3600  # Last hour
         
-        for service_history in self.optimization_history.values():
-            recent_optimizations += sum(
-                1 for opt in service_history 
-                if opt.get("timestamp", 0) > cutoff_time
-            )
+        for recent in self._recent_optimization_times.values():
+            while recent and recent[0] <= cutoff_time:
+                recent.popleft()
+            recent_optimizations += len(recent)
         
         return {
             "total_services": len(self.batch_sizes),
-            "total_optimizations": total_optimizations,
+            "total_optimizations": self._total_optimizations,
             "recent_optimizations": recent_optimizations,
             "services_with_recent_optimization": len([
                 service for service, last_opt in self.last_optimization.items()
@@ -1569,6 +2045,84 @@ def get_performance_optimizer() -> PerformanceOptimizer:
     return performance_optimizer
 
 
+# Metrics the degradation detector fits trends to, in analysis order
+TREND_METRICS = ("response_time", "throughput", "error_rate", "cpu_usage", "memory_usage")
+
+# Minimum absolute correlation for a trend to be projected in predictive alerts
+PREDICTIVE_CORRELATION_THRESHOLD = 0.6
+
+
+class DegradationRule(NamedTuple):
+    """Threshold rule for one trend metric in degradation detection."""
+    metric: str
+    degradation_type: str
+    threshold_attr: str     # detector attribute holding the change threshold (fraction)
+    direction: int          # +1 flags rising metrics, -1 flags falling ones
+    correlation_gate: float  # minimum correlation in the flagged direction
+    severity_field: str     # "change_percent" (direction-adjusted) or "recent_avg"
+    severity_op: Any        # comparison of severity_field against severity_cut
+    severity_cut: float     # values passing severity_op are errors, the rest warnings
+
+
+DEGRADATION_RULES = (
+    DegradationRule("response_time", "response_time_degradation",
+                    "response_time_degradation_threshold", 1, 0.5, "change_percent", ge, 50),
+    DegradationRule("throughput", "throughput_degradation",
+                    "throughput_degradation_threshold", -1, 0.5, "change_percent", ge, 30),
+    DegradationRule("error_rate", "error_rate_degradation",
+                    "error_rate_degradation_threshold", 1, 0.3, "recent_avg", gt, 0.1),
+    DegradationRule("cpu_usage", "cpu_usage_degradation",
+                    "cpu_degradation_threshold", 1, 0.4, "recent_avg", ge, 80),
+    DegradationRule("memory_usage", "memory_usage_degradation",
+                    "memory_degradation_threshold", 1, 0.4, "recent_avg", ge, 85),
+)
+
+
+class PerformanceWindow:
+    """
+    The last ``window_size`` performance samples of a service.
+    
+    Each trend metric is kept as a SlidingTrend over the samples that
+    reported it, so trend statistics are maintained incrementally as samples
+    arrive and age out instead of being refitted from stored records.
+    """
+    
+    def __init__(self, window_size: int):
+        self.window_size = window_size
+        self.timestamps = RingBuffer(window_size)
+        # Trend values are keyed by sample sequence number, so evicting a
+        # sample evicts exactly the values it contributed
+        self._next_seq = 0
+        self.trends = {name: SlidingTrend(window_size) for name in TREND_METRICS}
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def append(self, timestamp: float, metrics: Dict[str, float]):
+        """Record a sample, evicting the oldest one when the window is full."""
+        if len(self.timestamps) == self.window_size:
+            self._evict_oldest()
+        seq = self._next_seq
+        self._next_seq += 1
+        self.timestamps.append(timestamp)
+        for name, trend in self.trends.items():
+            value = metrics.get(name)
+            if value is not None:
+                trend.push(seq, value)
+    
+    def evict_before(self, cutoff_time: float):
+        """Evict samples recorded at or before ``cutoff_time``."""
+        timestamps = self.timestamps
+        while timestamps and timestamps[0] <= cutoff_time:
+            self._evict_oldest()
+    
+    def _evict_oldest(self):
+        oldest_seq = self._next_seq - len(self.timestamps)
+        self.timestamps.popleft()
+        for trend in self.trends.values():
+            trend.evict_through(oldest_seq)
+
+
 class PerformanceDegradationDetector:
     """
     Performance degradation detection system.
@@ -1578,10 +2132,6 @@ class PerformanceDegradationDetector:
     """
     
     def __init__(self):
-        import threading
-        import time
-        from collections import deque
-        
         # Avoid circular import - initialize logger later
         self.logger = None
         self.performance_tracker = get_performance_tracker()
@@ -1589,14 +2139,24 @@ class PerformanceDegradationDetector:
         self.alert_manager = None
         
         # Performance history storage
-        self.performance_windows = {}  # service -> deque of metrics
+        # Windows and alert histories are created on a service's first use
+        self.performance_windows: Dict[str, PerformanceWindow] = defaultdict(
+            lambda: PerformanceWindow(self.window_size)
+        )
         self.trend_analysis = {}       # service -> trend data
-        self.degradation_alerts = {}   # service -> alert history
+        self.degradation_alerts: Dict[str, Dict[str, float]] = defaultdict(dict)  # service -> alert history
+        
+        # Alerts sent in the last hour, oldest first, as (time, service, alert
+        # key) with a count of the alert keys whose latest alert is among them
+        self._recent_alerts: deque = deque()
+        self._recent_alert_keys = 0
+        self._recent_alerts_pruned_through = 0.0
         
         # Configuration
         self.window_size = 50          # Number of metrics to keep for trend analysis
         self.trend_window_minutes = 30 # Minutes to look back for trend analysis
         self.alert_cooldown = 300      # 5 minutes between similar alerts
+        self.recent_alert_window = 3600  # Seconds an alert counts as recent
         
         # Degradation thresholds
         self.response_time_degradation_threshold = 0.3  # 30% increase
@@ -1605,12 +2165,34 @@ class PerformanceDegradationDetector:
         self.cpu_degradation_threshold = 0.25           # 25% increase
         self.memory_degradation_threshold = 0.2         # 20% increase
         
+        # The thresholds and trend window are fixed once set, so analysis
+        # compares against precomputed percentages and seconds
+        self._trend_window_seconds = self.trend_window_minutes * 60
+        self._degradation_checks = tuple(
+            (rule, getattr(self, rule.threshold_attr) * 100) for rule in DEGRADATION_RULES
+        )
+        
         # Trend detection parameters
         self.min_data_points = 10      # Minimum points needed for trend analysis
         self.trend_significance = 0.05 # Statistical significance level
         
-        # Thread safety
+        # Recorded metrics are queued and applied in batches, flushed once
+        # flush_batch_size are pending or flush_interval seconds have passed
+        self.flush_batch_size = 100
+        self.flush_interval = 0.25
+        self._pending: Dict[str, List[Tuple[float, Dict[str, float]]]] = defaultdict(list)
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        
+        # Thread safety; _lock guards windows and analysis, _pending_cv the
+        # queue. flush() takes _lock before _pending_cv.
         self._lock = threading.Lock()
+        self._pending_cv = threading.Condition(threading.Lock())
+        
+        # Optional background analysis; while it runs, producers only queue
+        # metrics and wake the thread instead of flushing themselves
+        self._analysis_thread = None
+        self._stop_analysis = threading.Event()
         
         # Initialize default services
         self._initialize_services()
@@ -1631,203 +2213,157 @@ class PerformanceDegradationDetector:
         default_services = ["scheduler", "dexscreener", "database", "api_processing"]
         
         for service in default_services:
-            self.performance_windows[service] = deque(maxlen=self.window_size)
+            self.performance_windows[service] = PerformanceWindow(self.window_size)
             self.trend_analysis[service] = {}
             self.degradation_alerts[service] = {}
     
     def record_performance_metric(self, service: str, metrics: Dict[str, float]):
-        """Record a performance metric for trend analysis."""
-        import time
+        """
+        Record a performance metric for trend analysis.
         
+        The metric is queued and applied with others in the next flush, so
+        producers only contend on the queue and trends are analyzed once
+        per batch rather than once per metric.
+        """
+        timestamp = time.time()
+        with self._pending_cv:
+            self._pending[service].append((timestamp, metrics))
+            self._pending_count += 1
+            flush_due = (self._pending_count >= self.flush_batch_size or
+                         time.monotonic() - self._last_flush >= self.flush_interval)
+            in_background = self._analysis_thread is not None
+            # Wake the idle thread for the first queued metric, and again
+            # once the batch is due
+            if in_background and (flush_due or self._pending_count == 1):
+                self._pending_cv.notify()
+        
+        if flush_due and not in_background:
+            self.flush()
+    
+    def flush(self):
+        """Apply queued metrics and analyze each service that received any."""
         with self._lock:
-            if service not in self.performance_windows:
-                self.performance_windows[service] = deque(maxlen=self.window_size)
-                self.trend_analysis[service] = {}
-                self.degradation_alerts[service] = {}
+            with self._pending_cv:
+                pending = self._pending
+                self._pending = defaultdict(list)
+                self._pending_count = 0
+                self._last_flush = time.monotonic()
             
-            # Add timestamp to metrics
-            timestamped_metrics = {
-                **metrics,
-                "timestamp": time.time()
-            }
+            # One clock reading serves every service analyzed in this flush
+            current_time = time.time()
+            for service, samples in pending.items():
+                window = self.performance_windows[service]
+                self.trend_analysis.setdefault(service, {})
+                for timestamp, metrics in samples:
+                    window.append(timestamp, metrics)
+                
+                # Perform degradation analysis if we have enough data
+                if len(window) >= self.min_data_points:
+                    self._analyze_performance_trends(service, current_time)
+    
+    def start_background_analysis(self):
+        """Start flushing and analyzing queued metrics in a background thread."""
+        with self._pending_cv:
+            if self._analysis_thread is not None and self._analysis_thread.is_alive():
+                return
             
-            self.performance_windows[service].append(timestamped_metrics)
+            self._stop_analysis.clear()
+            self._analysis_thread = threading.Thread(
+                target=self._analysis_loop,
+                name="PerformanceDegradationAnalysis",
+                daemon=True
+            )
+            self._analysis_thread.start()
+    
+    def stop_background_analysis(self):
+        """Stop the background analysis thread and flush what it left queued."""
+        with self._pending_cv:
+            thread = self._analysis_thread
+            self._analysis_thread = None
+            self._stop_analysis.set()
+            self._pending_cv.notify()
+        
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=10)
+        self.flush()
+    
+    def _analysis_loop(self):
+        """Flush queued metrics once a batch is due or flush_interval has passed."""
+        while not self._stop_analysis.is_set():
+            with self._pending_cv:
+                if self._pending_count == 0:
+                    # Idle: sleep until the first metric arrives or stop is requested
+                    self._pending_cv.wait()
+                    continue
+                if self._pending_count < self.flush_batch_size:
+                    # Let the batch fill; producers notify early once it is due
+                    self._pending_cv.wait(self.flush_interval)
             
-            # Perform degradation analysis if we have enough data
-            if len(self.performance_windows[service]) >= self.min_data_points:
-                self._analyze_performance_trends(service)
-    
-    def _analyze_performance_trends(self, service: str):
+            if self._stop_analysis.is_set():
+                break
+            
+            try:
+                self.flush()
+            except Exception as e:
+                self._initialize_logger()
+                if self.logger:
+                    self.logger.error(
+                        "Error in performance degradation analysis loop",
+                        extra={"error": str(e)}
+                    )
+    
+    def _analyze_performance_trends(self, service: str, current_time: Optional[float] = None):
         """Analyze performance trends for a service."""
-        import time
-        import statistics
+        if current_time is None:
+            current_time = time.time()
+        cutoff_time = current_time - self._trend_window_seconds
         
-        current_time = time.time()
-        cutoff_time = current_time - (self.trend_window_minutes * 60)
-        
-        # Get recent metrics within the trend window
-        recent_metrics = [
-            m for m in self.performance_windows[service]
-            if m.get("timestamp", 0) > cutoff_time
-        ]
+        # Age samples out of the trend window
+        window = self.performance_windows[service]
+        window.evict_before(cutoff_time)
         
-        if len(recent_metrics) < self.min_data_points:
+        if len(window) < self.min_data_points:
             return
         
         # Calculate trends for key metrics
-        trends = {}
-        
-        # Response time trend
-        response_times = [m.get("response_time", 0) for m in recent_metrics if m.get("response_time") is not None]
-        if len(response_times) >= self.min_data_points:
-            trends["response_time"] = self._calculate_trend(response_times)
-        
-        # Throughput trend
-        throughputs = [m.get("throughput", 0) for m in recent_metrics if m.get("throughput") is not None]
-        if len(throughputs) >= self.min_data_points:
-            trends["throughput"] = self._calculate_trend(throughputs)
-        
-        # Error rate trend
-        error_rates = [m.get("error_rate", 0) for m in recent_metrics if m.get("error_rate") is not None]
-        if len(error_rates) >= self.min_data_points:
-            trends["error_rate"] = self._calculate_trend(error_rates)
-        
-        # CPU usage trend
-        cpu_usages = [m.get("cpu_usage", 0) for m in recent_metrics if m.get("cpu_usage") is not None]
-        if len(cpu_usages) >= self.min_data_points:
-            trends["cpu_usage"] = self._calculate_trend(cpu_usages)
-        
-        # Memory usage trend
-        memory_usages = [m.get("memory_usage", 0) for m in recent_metrics if m.get("memory_usage") is not None]
-        if len(memory_usages) >= self.min_data_points:
-            trends["memory_usage"] = self._calculate_trend(memory_usages)
-        
-        # Store trend analysis
+        trends = {
+            name: trend.snapshot()
+            for name, trend in window.trends.items()
+            if len(trend) >= self.min_data_points
+        }
+        
+        # Store trend analysis, with the health classification derived from
+        # it so status reads do not re-walk the trends
         self.trend_analysis[service] = {
             "timestamp": current_time,
             "trends": trends,
-            "data_points": len(recent_metrics),
-            "window_minutes": self.trend_window_minutes
+            "data_points": len(window),
+            "window_minutes": self.trend_window_minutes,
+            "health": self._classify_trend_health(trends),
+            "strong_trend_metrics": tuple(
+                name for name, trend in trends.items()
+                if abs(trend["correlation"]) >= PREDICTIVE_CORRELATION_THRESHOLD
+            )
         }
         
-        # Check for degradation patterns
-        self._check_degradation_patterns(service, trends, recent_metrics)
+        # Check for degradation patterns; during warmup no metric may have
+        # enough samples yet, leaving nothing to check or forward
+        if trends:
+            self._check_degradation_patterns(service, trends, current_time)
     
-    def _calculate_trend(self, values: List[float]) -> Dict[str, float]:
-        """Calculate trend statistics for a series of values."""
-        import statistics
-        
-        if len(values) < 2:
-            return {"slope": 0, "correlation": 0, "recent_avg": 0, "baseline_avg": 0}
-        
-        # Simple linear regression to calculate slope
-        n = len(values)
-        x_values = list(range(n))
-        
-        # Calculate means
-        x_mean = statistics.mean(x_values)
-        y_mean = statistics.mean(values)
-        
-        # Calculate slope and correlation
-        numerator = sum((x_values[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        x_variance = sum((x - x_mean) ** 2 for x in x_values)
-        y_variance = sum((y - y_mean) ** 2 for y in values)
-        
-        slope = numerator / x_variance if x_variance != 0 else 0
-        
-        correlation = 0
-        if x_variance != 0 and y_variance != 0:
-            correlation = numerator / (x_variance * y_variance) ** 0.5
-        
-        # Calculate recent vs baseline averages
-        split_point = max(1, n // 3)
-        baseline_avg = statistics.mean(values[:split_point])
-        recent_avg = statistics.mean(values[-split_point:])
-        
-        return {
-            "slope": slope,
-            "correlation": correlation,
-            "recent_avg": recent_avg,
-            "baseline_avg": baseline_avg,
-            "change_percent": ((recent_avg - baseline_avg) / baseline_avg * 100) if baseline_avg != 0 else 0
-        }
-    
-    def _check_degradation_patterns(self, service: str, trends: Dict, recent_metrics: List[Dict]):
+    def _check_degradation_patterns(self, service: str, trends: Dict,
+                                    current_time: Optional[float] = None):
         """Check for performance degradation patterns."""
-        import time
-        
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         degradations_detected = []
         
-        # Check response time degradation
-        if "response_time" in trends:
-            rt_trend = trends["response_time"]
-            if (rt_trend["change_percent"] > self.response_time_degradation_threshold * 100 and
-                rt_trend["correlation"] > 0.5):  # Strong positive correlation
-                degradations_detected.append({
-                    "type": "response_time_degradation",
-                    "severity": "warning" if rt_trend["change_percent"] < 50 else "error",
-                    "change_percent": rt_trend["change_percent"],
-                    "correlation": rt_trend["correlation"],
-                    "current_avg": rt_trend["recent_avg"],
-                    "baseline_avg": rt_trend["baseline_avg"]
-                })
-        
-        # Check throughput degradation
-        if "throughput" in trends:
-            tp_trend = trends["throughput"]
-            if (tp_trend["change_percent"] < -self.throughput_degradation_threshold * 100 and
-                tp_trend["correlation"] < -0.5):  # Strong negative correlation
-                degradations_detected.append({
-                    "type": "throughput_degradation",
-                    "severity": "warning" if abs(tp_trend["change_percent"]) < 30 else "error",
-                    "change_percent": tp_trend["change_percent"],
-                    "correlation": tp_trend["correlation"],
-                    "current_avg": tp_trend["recent_avg"],
-                    "baseline_avg": tp_trend["baseline_avg"]
-                })
-        
-        # Check error rate degradation
-        if "error_rate" in trends:
-            er_trend = trends["error_rate"]
-            if (er_trend["change_percent"] > self.error_rate_degradation_threshold * 100 and
-                er_trend["correlation"] > 0.3):
-                degradations_detected.append({
-                    "type": "error_rate_degradation",
-                    "severity": "error" if er_trend["recent_avg"] > 0.1 else "warning",
-                    "change_percent": er_trend["change_percent"],
-                    "correlation": er_trend["correlation"],
-                    "current_avg": er_trend["recent_avg"],
-                    "baseline_avg": er_trend["baseline_avg"]
-                })
-        
-        # Check CPU usage degradation
-        if "cpu_usage" in trends:
-            cpu_trend = trends["cpu_usage"]
-            if (cpu_trend["change_percent"] > self.cpu_degradation_threshold * 100 and
-                cpu_trend["correlation"] > 0.4):
-                degradations_detected.append({
-                    "type": "cpu_usage_degradation",
-                    "severity": "warning" if cpu_trend["recent_avg"] < 80 else "error",
-                    "change_percent": cpu_trend["change_percent"],
-                    "correlation": cpu_trend["correlation"],
-                    "current_avg": cpu_trend["recent_avg"],
-                    "baseline_avg": cpu_trend["baseline_avg"]
-                })
-        
-        # Check memory usage degradation
-        if "memory_usage" in trends:
-            mem_trend = trends["memory_usage"]
-            if (mem_trend["change_percent"] > self.memory_degradation_threshold * 100 and
-                mem_trend["correlation"] > 0.4):
-                degradations_detected.append({
-                    "type": "memory_usage_degradation",
-                    "severity": "warning" if mem_trend["recent_avg"] < 85 else "error",
-                    "change_percent": mem_trend["change_percent"],
-                    "correlation": mem_trend["correlation"],
-                    "current_avg": mem_trend["recent_avg"],
-                    "baseline_avg": mem_trend["baseline_avg"]
-                })
+        for rule, threshold_percent in self._degradation_checks:
+            trend = trends.get(rule.metric)
+            if trend is not None:
+                degradation = self._eval_degradation(rule, threshold_percent, trend)
+                if degradation is not None:
+                    degradations_detected.append(degradation)
         
         # Send alerts for detected degradations
         for degradation in degradations_detected:
@@ -1852,6 +2388,31 @@ class PerformanceDegradationDetector:
                     extra={"service": service, "error": str(e)}
                 )
     
+    @staticmethod
+    def _eval_degradation(rule: DegradationRule, threshold_percent: float,
+                          trend: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """Return the degradation ``trend`` shows under ``rule``, or None."""
+        change_percent = trend["change_percent"]
+        correlation = trend["correlation"]
+        
+        # Falling metrics are compared with signs flipped so every rule
+        # reads as "change and correlation above their gates"
+        direction = rule.direction
+        directed_change = direction * change_percent
+        if directed_change <= threshold_percent or direction * correlation <= rule.correlation_gate:
+            return None
+        
+        recent_avg = trend["recent_avg"]
+        severity_value = directed_change if rule.severity_field == "change_percent" else recent_avg
+        return {
+            "type": rule.degradation_type,
+            "severity": "error" if rule.severity_op(severity_value, rule.severity_cut) else "warning",
+            "change_percent": change_percent,
+            "correlation": correlation,
+            "current_avg": recent_avg,
+            "baseline_avg": trend["baseline_avg"]
+        }
+    
     def _send_degradation_alert(self, service: str, degradation: Dict, current_time: float):
         """Send alert for detected performance degradation."""
         alert_key = f"{service}_{degradation['type']}"
@@ -1893,7 +2454,13 @@ class PerformanceDegradationDetector:
                     **alert_details
                 )
             
-            # Record alert time
+            # Record alert time; the key is newly counted unless its previous
+            # alert is still in the recent window. Prune here as well so the
+            # deque stays bounded when statistics are never read.
+            self._prune_recent_alerts(current_time - self.recent_alert_window)
+            if last_alert_time <= self._recent_alerts_pruned_through:
+                self._recent_alert_keys += 1
+            self._recent_alerts.append((current_time, service, alert_key))
             self.degradation_alerts[service][alert_key] = current_time
             
             self.logger.warning(
@@ -1912,9 +2479,20 @@ class PerformanceDegradationDetector:
                 degradation_type=degradation["type"]
             )
     
+    def _prune_recent_alerts(self, cutoff_time: float) -> int:
+        """Drop alerts at or before ``cutoff_time``; return the alert keys still recent."""
+        recent = self._recent_alerts
+        while recent and recent[0][0] <= cutoff_time:
+            alert_time, service, alert_key = recent.popleft()
+            # A superseded entry was already replaced in the count by its key's later alert
+            if self.degradation_alerts[service].get(alert_key) == alert_time:
+                self._recent_alert_keys -= 1
+        self._recent_alerts_pruned_through = max(self._recent_alerts_pruned_through, cutoff_time)
+        return self._recent_alert_keys
+    
     def get_performance_health_status(self, service: str) -> Dict[str, Any]:
         """Get current performance health status for a service."""
-        import time
+        self.flush()
         
         if service not in self.trend_analysis:
             return {
@@ -1925,12 +2503,33 @@ class PerformanceDegradationDetector:
         
         trend_data = self.trend_analysis[service]
         trends = trend_data.get("trends", {})
+        status, warning_count, error_count = trend_data.get("health") or ("healthy", 0, 0)
+        
+        if status == "critical":
+            message = f"Severe performance degradation detected in {error_count} metrics"
+        elif status == "degraded":
+            message = f"Performance degradation detected in {warning_count} metrics"
+        else:
+            message = "Performance trends are stable"
         
-        # Determine overall health status
+        return {
+            "service": service,
+            "status": status,
+            "message": message,
+            "trends": trends,
+            "data_points": trend_data.get("data_points", 0),
+            "last_analysis": trend_data.get("timestamp", 0),
+            "warning_metrics": warning_count,
+            "error_metrics": error_count
+        }
+    
+    @staticmethod
+    def _classify_trend_health(trends: Dict[str, Dict[str, float]]) -> Tuple[str, int, int]:
+        """Classify trends as (status, warning metric count, error metric count)."""
         warning_count = 0
         error_count = 0
         
-        for metric_name, trend in trends.items():
+        for trend in trends.values():
             change_percent = abs(trend.get("change_percent", 0))
             correlation = abs(trend.get("correlation", 0))
             
@@ -1943,42 +2542,34 @@ class PerformanceDegradationDetector:
         
         if error_count > 0:
             status = "critical"
-            message = f"Severe performance degradation detected in {error_count} metrics"
         elif warning_count > 0:
             status = "degraded"
-            message = f"Performance degradation detected in {warning_count} metrics"
         else:
             status = "healthy"
-            message = "Performance trends are stable"
-        
-        return {
-            "service": service,
-            "status": status,
-            "message": message,
-            "trends": trends,
-            "data_points": trend_data.get("data_points", 0),
-            "last_analysis": trend_data.get("timestamp", 0),
-            "warning_metrics": warning_count,
-            "error_metrics": error_count
-        }
+        return status, warning_count, error_count
     
     def get_predictive_alerts(self, service: str, forecast_minutes: int = 30) -> List[Dict[str, Any]]:
         """Generate predictive alerts based on current trends."""
+        self.flush()
+        
         if service not in self.trend_analysis:
             return []
         
-        trends = self.trend_analysis[service].get("trends", {})
+        trend_data = self.trend_analysis[service]
+        # Only predict from strong trends, picked out during analysis
+        strong_metrics = trend_data.get("strong_trend_metrics", ())
+        if not strong_metrics:
+            return []
+        
+        trends = trend_data["trends"]
         predictive_alerts = []
         
-        for metric_name, trend in trends.items():
+        for metric_name in strong_metrics:
+            trend = trends[metric_name]
             slope = trend.get("slope", 0)
             correlation = trend.get("correlation", 0)
             current_avg = trend.get("recent_avg", 0)
             
-            # Only predict if we have a strong trend
-            if abs(correlation) < 0.6:
-                continue
-            
             # Project future value
             projected_value = current_avg + (slope * forecast_minutes)
             
@@ -2040,29 +2631,25 @@ class PerformanceDegradationDetector:
     
     def get_degradation_statistics(self) -> Dict[str, Any]:
         """Get overall degradation detection statistics."""
-        import time
+        self.flush()
         
         current_time = time.time()
-        total_services = len(self.performance_windows)
-        services_with_data = sum(1 for window in self.performance_windows.values() if len(window) > 0)
         
-        # Count recent alerts
-        recent_alerts = 0
-        cutoff_time = current_time - 3600  # Last hour
-        
-        for service_alerts in self.degradation_alerts.values():
-            recent_alerts += sum(
-                1 for alert_time in service_alerts.values()
-                if alert_time > cutoff_time
+        # The background analysis thread adds services to these dicts, so
+        # read them under the lock
+        with self._lock:
+            total_services = len(self.performance_windows)
+            services_with_data = sum(1 for window in self.performance_windows.values() if len(window) > 0)
+            
+            # Count recent alerts
+            recent_alerts = self._prune_recent_alerts(current_time - self.recent_alert_window)
+            
+            # Count services with concerning trends
+            concerning_services = sum(
+                1 for trend_data in self.trend_analysis.values()
+                if trend_data.get("health", ("healthy",))[0] != "healthy"
             )
         
-        # Count services with concerning trends
-        concerning_services = 0
-        for service in self.trend_analysis:
-            health_status = self.get_performance_health_status(service)
-            if health_status["status"] in ["degraded", "critical"]:
-                concerning_services += 1
-        
         return {
             "total_services": total_services,
             "services_with_data": services_with_data,
@@ -2084,8 +2671,6 @@ def get_performance_degradation_detector() -> PerformanceDegradationDetector:
 
 
 # Simple structured logger implementation
-import logging
-
 class SimpleStructuredLogger:
     """Simple structured logger for compatibility."""
     
@@ -2101,6 +2686,10 @@ class SimpleStructuredLogger:
         """Log scheduler execution."""
         self.logger.info(f"Scheduler execution: {kwargs}")
     
+    def debug(self, message: str, **kwargs):
+        """Log debug message."""
+        self.logger.debug(message, extra=kwargs)
+    
     def info(self, message: str, **kwargs):
         """Log info message."""
         self.logger.info(message, extra=kwargs)
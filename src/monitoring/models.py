@@ -5,10 +5,13 @@ This module defines all the data structures used for monitoring system health,
 tracking performance metrics, and managing alerts.
 """
 
-from dataclasses import dataclass, field
+import heapq
+from dataclasses import dataclass, field, fields
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from decimal import Decimal
 
 
@@ -28,6 +31,12 @@ class AlertLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Alert levels reported by SystemHealth.get_critical_alerts
+_CRITICAL_LEVELS = frozenset({AlertLevel.CRITICAL, AlertLevel.ERROR})
+
+_timestamp_of = attrgetter("timestamp")
+
+
 class CircuitState(str, Enum):
     """Circuit breaker states."""
     CLOSED = "closed"
@@ -35,7 +44,7 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthAlert:
     """Individual health alert with context."""
     level: AlertLevel
@@ -46,7 +55,7 @@ class HealthAlert:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerHealth:
     """Health status for the scheduler component."""
     status: HealthStatus
@@ -62,7 +71,7 @@ class SchedulerHealth:
     last_check: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceHealth:
     """System resource health status."""
     memory_usage_mb: float
@@ -78,7 +87,7 @@ class ResourceHealth:
     last_check: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class APIHealth:
     """External API health status."""
     service_name: str
@@ -109,22 +118,42 @@ class SystemHealth:
 
     def get_all_alerts(self) -> List[HealthAlert]:
         """Get all alerts from all components."""
-        all_alerts = list(self.alerts)
-        all_alerts.extend(self.scheduler.alerts)
-        all_alerts.extend(self.resources.alerts)
-        for api_health in self.apis.values():
-            all_alerts.extend(api_health.alerts)
-        return sorted(all_alerts, key=lambda x: x.timestamp, reverse=True)
+        return sorted(self._iter_alerts(), key=_timestamp_of, reverse=True)
+
+    def get_recent_alerts(
+        self,
+        limit: int = 50,
+        predicate: Optional[Callable[[HealthAlert], bool]] = None
+    ) -> List[HealthAlert]:
+        """Get the ``limit`` most recent alerts from all components, newest first.
+        
+        If ``predicate`` is given, only alerts it accepts are considered.
+        """
+        alerts = self._iter_alerts()
+        if predicate is not None:
+            alerts = filter(predicate, alerts)
+        return heapq.nlargest(limit, alerts, key=_timestamp_of)
 
     def get_critical_alerts(self) -> List[HealthAlert]:
         """Get only critical and error level alerts."""
-        return [
-            alert for alert in self.get_all_alerts()
-            if alert.level in [AlertLevel.CRITICAL, AlertLevel.ERROR]
-        ]
-
-
-@dataclass
+        # Filter before sorting so only the severe alerts are ordered
+        return sorted(
+            (alert for alert in self._iter_alerts() if alert.level in _CRITICAL_LEVELS),
+            key=_timestamp_of,
+            reverse=True
+        )
+
+    def _iter_alerts(self):
+        """Iterate over the alerts of the system and every component."""
+        return chain(
+            self.alerts,
+            self.scheduler.alerts,
+            self.resources.alerts,
+            *(api_health.alerts for api_health in self.apis.values())
+        )
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for system components."""
     component: str
@@ -154,11 +183,15 @@ class PerformanceMetrics:
 
     def get_p95_api_response_time(self) -> float:
         """Calculate 95th percentile API response time."""
+        return self.get_api_response_time_percentiles([95.0])[0]
+
+    def get_api_response_time_percentiles(self, percentiles: List[float]) -> List[float]:
+        """Calculate several API response time percentiles from a single sort."""
         if not self.api_response_times:
-            return 0.0
+            return [0.0] * len(percentiles)
         sorted_times = sorted(self.api_response_times)
-        index = int(0.95 * len(sorted_times))
-        return sorted_times[min(index, len(sorted_times) - 1)]
+        last = len(sorted_times) - 1
+        return [sorted_times[min(int(p / 100 * len(sorted_times)), last)] for p in percentiles]
 
     def get_avg_processing_time(self) -> float:
         """Calculate average processing time."""
@@ -184,6 +217,7 @@ class MonitoringConfig:
     resource_check_interval: int = 60  # seconds
     performance_check_interval: int = 120  # seconds
     alert_cooldown: int = 300  # seconds
+    min_resource_interval: float = 1.0  # seconds between fresh resource samples
     
     # Resource thresholds
     memory_warning_threshold: float = 1400.0  # MB
@@ -206,10 +240,12 @@ class MonitoringConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        return {
-            field.name: getattr(self, field.name)
-            for field in self.__dataclass_fields__.values()
-        }
+        return dict(zip(_MONITORING_CONFIG_FIELDS, _monitoring_config_values(self)))
+
+
+# Field names of MonitoringConfig, and a getter reading all their values at once
+_MONITORING_CONFIG_FIELDS = tuple(f.name for f in fields(MonitoringConfig))
+_monitoring_config_values = attrgetter(*_MONITORING_CONFIG_FIELDS)
 
 
 @dataclass
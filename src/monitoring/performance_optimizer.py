@@ -8,11 +8,24 @@ Provides basic performance optimization including:
 """
 
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+import psutil
+
+from .telegram_notifier import get_telegram_notifier
 
 log = logging.getLogger("performance_optimizer")
 
+# Total system memory does not change while the process runs
+try:
+    _TOTAL_MEMORY_BYTES = psutil.virtual_memory().total
+except Exception:
+    _TOTAL_MEMORY_BYTES = 0
+_TOTAL_MEMORY_MB = _TOTAL_MEMORY_BYTES / (1024 * 1024)
+_TOTAL_MEMORY_GB = _TOTAL_MEMORY_BYTES / (1024 * 1024 * 1024)
+
 
 class SimplePerformanceOptimizer:
     """Simple performance optimizer for basic system monitoring."""
@@ -20,6 +33,23 @@ class SimplePerformanceOptimizer:
     def __init__(self):
         self.optimization_history = []
         
+        # System metrics are reused for metrics_ttl seconds, cached as a
+        # (monotonic time, metrics) pair
+        self.metrics_ttl = 5.0
+        self._metrics_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        
+        # Whether the Telegram notifier is configured; its credentials are
+        # read once when it is created, so the answer is kept after the
+        # first memory alert
+        self._telegram_configured: Optional[bool] = None
+        
+        # The first non-blocking cpu_percent() call has no previous sample to
+        # compare against and reports 0.0; take it now so cycles get real values
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+        
     def run_optimization_cycle(self) -> Dict[str, Any]:
         """Run a simple optimization cycle."""
         try:
@@ -71,15 +101,20 @@ class SimplePerformanceOptimizer:
             }
     
     def _get_basic_metrics(self) -> Dict[str, Any]:
-        """Get basic system metrics."""
+        """Get basic system metrics, reusing a reading taken within metrics_ttl."""
+        now = time.monotonic()
+        cached_at, cached = self._metrics_cache
+        if cached is not None and now - cached_at < self.metrics_ttl:
+            return dict(cached)
+        
         try:
-            import psutil
-            
-            return {
-                "cpu_usage": psutil.cpu_percent(interval=0),
+            metrics = {
+                "cpu_usage": psutil.cpu_percent(interval=None),
                 "memory_mb": psutil.virtual_memory().used / (1024 * 1024),
                 "timestamp": datetime.utcnow().isoformat()
             }
+            self._metrics_cache = (now, metrics)
+            return dict(metrics)
         except Exception as e:
             log.warning(f"Could not get system metrics: {e}")
             return {
@@ -90,17 +125,19 @@ class SimplePerformanceOptimizer:
     
     def _send_memory_alert(self, alert_type: str, memory_mb: float):
         """Send memory usage alert via Telegram."""
+        if self._telegram_configured is False:
+            return
+        
         try:
-            from src.monitoring.telegram_notifier import get_telegram_notifier
-            
             telegram_notifier = get_telegram_notifier()
-            if not telegram_notifier.is_configured():
-                return
+            if self._telegram_configured is None:
+                self._telegram_configured = telegram_notifier.is_configured()
+                if not self._telegram_configured:
+                    return
             
-            # Get total system memory for percentage calculation
-            import psutil
-            total_memory_gb = psutil.virtual_memory().total / (1024 * 1024 * 1024)
-            memory_percent = (memory_mb / (total_memory_gb * 1024)) * 100
+            # Total system memory is read once at import
+            total_memory_gb = _TOTAL_MEMORY_GB
+            memory_percent = memory_mb * 100.0 / _TOTAL_MEMORY_MB
             
             # Send memory alert
             telegram_notifier.send_memory_alert(
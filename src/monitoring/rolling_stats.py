@@ -0,0 +1,338 @@
+"""
+Incremental sliding-window statistics for monitoring histories.
+
+Monitoring code keeps bounded histories of samples and repeatedly asks for
+their average, minimum and maximum. The helpers in this module maintain those
+aggregates as samples are pushed and evicted, so reading them is O(1) instead
+of a rescan of the whole history, and store sample columns in compact typed
+ring buffers instead of per-sample objects. ``SlidingTrend`` does the same
+for a least-squares trend line over a sliding window.
+"""
+
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class RollingStats:
+    """
+    Sum, min and max over the last ``window`` pushed values.
+
+    Min and max are tracked with monotonic deques (the classic sliding-window
+    extremum technique), so every push/evict is O(1) amortized.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._sum = 0.0
+        # (sequence number, value) pairs; values increase / decrease left to right
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    def push(self, value: float) -> None:
+        """Add a value, evicting the oldest one if the window is full."""
+        if len(self._values) == self.window:
+            self.pop_oldest()
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._values.append(value)
+        self._sum += value
+
+        min_q = self._min
+        while min_q and min_q[-1][1] >= value:
+            min_q.pop()
+        min_q.append((seq, value))
+
+        max_q = self._max
+        while max_q and max_q[-1][1] <= value:
+            max_q.pop()
+        max_q.append((seq, value))
+
+    def pop_oldest(self) -> Optional[float]:
+        """Evict the oldest value from the window and return it."""
+        if not self._values:
+            return None
+
+        oldest_seq = self._next_seq - len(self._values)
+        value = self._values.popleft()
+        if self._values:
+            self._sum -= value
+        else:
+            # Reset instead of subtracting so float error cannot accumulate
+            # across an emptied window.
+            self._sum = 0.0
+
+        if self._min and self._min[0][0] == oldest_seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] == oldest_seq:
+            self._max.popleft()
+        return value
+
+    def trim(self, keep: int) -> None:
+        """Evict oldest values until at most ``keep`` remain."""
+        while len(self._values) > keep:
+            self.pop_oldest()
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._min.clear()
+        self._max.clear()
+        self._sum = 0.0
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    def average(self) -> float:
+        return self._sum / len(self._values) if self._values else 0.0
+
+    def minimum(self) -> float:
+        return self._min[0][1] if self._min else 0.0
+
+    def peak(self) -> float:
+        return self._max[0][1] if self._max else 0.0
+
+    def oldest(self) -> float:
+        return self._values[0] if self._values else 0.0
+
+    def newest(self) -> float:
+        return self._values[-1] if self._values else 0.0
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO of numbers stored in a contiguous ``array``.
+
+    Appending to a full buffer overwrites the oldest value, like a deque with
+    ``maxlen``. Supports ``len()``, indexing (including negative indices) and
+    iteration, so it can be bisected directly when its values are sorted.
+
+    With ``scale`` set, values are quantized on the way in and stored as
+    integer multiples of ``scale`` (use an integer ``typecode``), then scaled
+    back to floats on the way out. E.g. ``scale=0.1`` with typecode ``"I"``
+    keeps megabyte readings to 0.1 MB in 4 bytes instead of 8.
+    """
+
+    def __init__(self, capacity: int, typecode: str = "d", scale: Optional[float] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.scale = scale
+        # Divide by the reciprocal on read: 23850 / 10.0 is exactly 2385.0,
+        # whereas 23850 * 0.1 is not
+        self._divisor = 1.0 / scale if scale else None
+        self._data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        value = self._data[(self._start + index) % self.capacity]
+        return value / self._divisor if self._divisor else value
+
+    def __iter__(self) -> Iterator:
+        # Iterate over memoryviews of the one or two physical runs, so no
+        # intermediate list is built
+        view = memoryview(self._data)
+        end = self._start + self._len
+        if end <= self.capacity:
+            runs = (view[self._start:end],)
+        else:
+            runs = (view[self._start:], view[:end - self.capacity])
+
+        divisor = self._divisor
+        for run in runs:
+            if divisor:
+                for value in run:
+                    yield value / divisor
+            else:
+                yield from run
+
+    def _quantize(self, value):
+        return round(value * self._divisor)
+
+    def append(self, value) -> None:
+        """Append a value, overwriting the oldest one when full."""
+        if self._divisor:
+            value = self._quantize(value)
+        if self._len == self.capacity:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._data[(self._start + self._len) % self.capacity] = value
+            self._len += 1
+
+    def popleft(self):
+        """Remove and return the oldest value."""
+        if not self._len:
+            raise IndexError("pop from an empty RingBuffer")
+        value = self._data[self._start]
+        self._start = (self._start + 1) % self.capacity
+        self._len -= 1
+        return value / self._divisor if self._divisor else value
+
+    def clear(self) -> None:
+        self._start = 0
+        self._len = 0
+
+    def slice(self, lo: int, hi: int) -> List:
+        """Return the values at logical positions ``lo:hi`` as a list."""
+        lo = max(lo, 0)
+        hi = min(hi, self._len)
+        if lo >= hi:
+            return []
+        begin = (self._start + lo) % self.capacity
+        end = begin + (hi - lo)
+        if end <= self.capacity:
+            values = self._data[begin:end].tolist()
+        else:
+            values = self._data[begin:].tolist()
+            values.extend(self._data[:end - self.capacity])
+        if self._divisor:
+            divisor = self._divisor
+            return [value / divisor for value in values]
+        return values
+
+    def tail(self, n: int) -> List:
+        """Return the ``n`` most recent values, oldest first."""
+        return self.slice(self._len - n, self._len)
+
+
+class SlidingTrend:
+    """
+    Least-squares trend of the last ``window`` values of a series.
+
+    Values are regressed against their position 0..n-1 in the window. The
+    sums of y, y*y and x*y are updated as values are pushed and evicted
+    (subtract-on-evict), and the sums over x have closed forms, so slope and
+    correlation are O(1) to read. Evicting the oldest value shifts every
+    remaining position down by one, which lowers the x*y sum by the sum of
+    the remaining values.
+
+    Every value carries a numeric ``key`` (a timestamp or sequence number,
+    increasing in push order) so the window can also be trimmed by key.
+    Keys and values are stored in RingBuffers, 8 bytes apiece.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._keys = RingBuffer(window)
+        self._values = RingBuffer(window)
+        self._sum_y = 0.0
+        self._sum_yy = 0.0
+        self._sum_xy = 0.0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, key: float, value: float) -> None:
+        """Add a value, evicting the oldest one if the window is full."""
+        if len(self._values) == self.window:
+            self.pop_oldest()
+        x = len(self._values)
+        self._keys.append(key)
+        self._values.append(value)
+        self._sum_y += value
+        self._sum_yy += value * value
+        self._sum_xy += x * value
+
+    def pop_oldest(self) -> Optional[float]:
+        """Evict the oldest value from the window and return it."""
+        if not self._values:
+            return None
+
+        self._keys.popleft()
+        value = self._values.popleft()
+        if not self._values:
+            self.clear()
+            return value
+
+        self._evictions += 1
+        if self._evictions >= self.window:
+            # Resum from the values once per window's worth of evictions so
+            # float error from the subtractions cannot build up
+            self._resync()
+        else:
+            self._sum_y -= value
+            self._sum_yy -= value * value
+            self._sum_xy -= self._sum_y
+        return value
+
+    def evict_through(self, key: float) -> None:
+        """Evict values whose key is at or before ``key``."""
+        keys = self._keys
+        while keys and keys[0] <= key:
+            self.pop_oldest()
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._values.clear()
+        self._sum_y = 0.0
+        self._sum_yy = 0.0
+        self._sum_xy = 0.0
+        self._evictions = 0
+
+    def _resync(self) -> None:
+        values = self._values
+        self._sum_y = sum(values)
+        self._sum_yy = sum(value * value for value in values)
+        self._sum_xy = sum(x * value for x, value in enumerate(values))
+        self._evictions = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Slope, correlation, and baseline (first third) vs recent (last
+        third) averages of the window.
+        """
+        n = len(self._values)
+        if n < 2:
+            return {"slope": 0, "correlation": 0, "recent_avg": 0, "baseline_avg": 0}
+
+        sum_x = n * (n - 1) / 2
+        sum_y = self._sum_y
+        # Centered sums of squares and cross products; for x = 0..n-1 the x
+        # one is n(n^2 - 1)/12
+        x_variance = n * (n * n - 1) / 12
+        numerator = self._sum_xy - sum_x * sum_y / n
+        y_variance = self._sum_yy - sum_y * sum_y / n
+
+        slope = numerator / x_variance
+
+        correlation = 0
+        # A constant series leaves only rounding noise in y_variance
+        if y_variance > 1e-12 * self._sum_yy:
+            correlation = max(-1.0, min(1.0, numerator / (x_variance * y_variance) ** 0.5))
+
+        split_point = max(1, n // 3)
+        baseline_avg = sum(self._values.slice(0, split_point)) / split_point
+        recent_avg = sum(self._values.tail(split_point)) / split_point
+
+        return {
+            "slope": slope,
+            "correlation": correlation,
+            "recent_avg": recent_avg,
+            "baseline_avg": baseline_avg,
+            "change_percent": ((recent_avg - baseline_avg) / baseline_avg * 100) if baseline_avg != 0 else 0
+        }
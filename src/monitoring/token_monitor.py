@@ -404,7 +404,7 @@ class TokenProcessingMonitor:
         # Calculate trends if we have history
         trend_analysis = {}
         if len(self.metrics_history) >= 2:
-            prev_metrics = list(self.metrics_history)[-2]
+            prev_metrics = self.metrics_history[-2]
             
             trend_analysis = {
                 "monitoring_trend": current_metrics.monitoring_count - prev_metrics.monitoring_count,
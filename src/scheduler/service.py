@@ -15,6 +15,7 @@ from src.core.config import get_config
 from src.scheduler.notarb_tasks import update_notarb_pools_file
 from src.scheduler.tasks import (
     archive_once,
+    cleanup_performance_data_once,
     monitor_token_processing_once,
     optimize_performance_once,
     send_system_health_summary_once,
@@ -93,6 +94,13 @@ def init_scheduler(app: FastAPI) -> Optional[AsyncIOScheduler]:
         id="performance_optimizer",
         max_instances=1,
     )
+    scheduler.add_job(
+        cleanup_performance_data_once,
+        IntervalTrigger(hours=1),
+        id="performance_data_cleanup",
+        max_instances=1,
+        coalesce=True,
+    )
     scheduler.add_job(
         update_notarb_pools_file,
         IntervalTrigger(seconds=60),
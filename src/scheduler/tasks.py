@@ -438,10 +438,44 @@ def optimize_performance_once() -> None:
                 }
             )
         
+        # Per-service tuning: sample each service's performance, then adjust
+        # the batch size and parallelism of those whose recent samples call
+        # for it, all under one acquisition of the optimizer's lock
+        from src.monitoring.metrics import get_performance_optimizer as get_service_optimizer
+        
+        service_optimizer = get_service_optimizer()
+        services = service_optimizer.record_current_performance()
+        service_results = service_optimizer.optimize_services(services)
+        optimized_services = [service for service, result in service_results.items() if result.get("optimized")]
+        if optimized_services:
+            log.info(
+                "service_optimizations_applied",
+                extra={
+                    "services": optimized_services,
+                    "changes": {service: service_results[service]["changes"] for service in optimized_services}
+                }
+            )
+        
     except Exception as e:
         log.error(f"Error in performance optimization: {e}", exc_info=True)
 
 
+def cleanup_performance_data_once(max_age_hours: float = 24) -> None:
+    """Drop performance tracker samples older than max_age_hours."""
+    try:
+        from src.monitoring.metrics import get_performance_tracker
+        
+        cleaned_count = get_performance_tracker().cleanup_old_data(max_age_hours)
+        if cleaned_count:
+            log.info(
+                "performance_data_cleaned",
+                extra={"cleaned_count": cleaned_count, "max_age_hours": max_age_hours}
+            )
+        
+    except Exception as e:
+        log.error(f"Error cleaning performance data: {e}", exc_info=True)
+
+
 async def monitor_spam_once() -> None:
     """Monitor spam levels for top tokens."""
     try:
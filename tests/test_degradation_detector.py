@@ -0,0 +1,248 @@
+"""
+Tests for Performance Degradation Detector functionality.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.monitoring.metrics import (
+    DEGRADATION_RULES,
+    TREND_METRICS,
+    PerformanceDegradationDetector,
+    PerformanceWindow,
+)
+
+
+class TestPerformanceWindow:
+    """Test per-service sample windows."""
+
+    def test_metrics_missing_from_samples(self):
+        """Test that each trend only holds the samples that reported it."""
+        window = PerformanceWindow(window_size=4)
+        for i in range(6):
+            metrics = {"response_time": float(i)}
+            if i % 2 == 0:
+                metrics["cpu_usage"] = 10.0 * i
+            window.append(float(i), metrics)
+
+        assert len(window) == 4
+        assert len(window.trends["response_time"]) == 4
+        # Samples 2..5 are kept; of those only 2 and 4 reported CPU usage
+        assert len(window.trends["cpu_usage"]) == 2
+        assert len(window.trends["throughput"]) == 0
+
+    def test_evict_before(self):
+        """Test aging samples out by timestamp."""
+        window = PerformanceWindow(window_size=10)
+        for i in range(5):
+            window.append(100.0 + i, {"error_rate": 0.01 * i})
+
+        window.evict_before(102.0)
+        assert list(window.timestamps) == [103.0, 104.0]
+        assert window.trends["error_rate"].snapshot()["baseline_avg"] == pytest.approx(0.03)
+
+
+class TestPerformanceDegradationDetector:
+    """Test Performance Degradation Detector functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = PerformanceDegradationDetector()
+
+    def test_trend_analysis_after_min_data_points(self):
+        """Test that trends are analyzed once enough samples are recorded."""
+        self.detector.flush_interval = 3600
+        with patch.object(self.detector, "_check_degradation_patterns") as check:
+            for i in range(12):
+                self.detector.record_performance_metric("database", {
+                    "response_time": 1.0 + 0.1 * i,
+                    "cpu_usage": 40.0
+                })
+            self.detector.flush()
+
+        analysis = self.detector.trend_analysis["database"]
+        assert analysis["data_points"] == 12
+        assert set(analysis["trends"]) == {"response_time", "cpu_usage"}
+        assert analysis["trends"]["response_time"]["slope"] == pytest.approx(0.1)
+        assert analysis["trends"]["response_time"]["correlation"] == pytest.approx(1.0)
+        assert analysis["trends"]["cpu_usage"]["correlation"] == 0
+        assert check.call_count == 1
+
+    def test_records_batched_until_flush(self):
+        """Test that recorded metrics are applied in batches."""
+        self.detector.flush_interval = 3600
+        self.detector.flush_batch_size = 20
+
+        for _ in range(19):
+            self.detector.record_performance_metric("scheduler", {"cpu_usage": 50.0})
+        assert len(self.detector.performance_windows["scheduler"]) == 0
+
+        self.detector.record_performance_metric("scheduler", {"cpu_usage": 50.0})
+        assert len(self.detector.performance_windows["scheduler"]) == 20
+
+        self.detector.record_performance_metric("new_service", {"cpu_usage": 50.0})
+        status = self.detector.get_performance_health_status("new_service")
+        assert len(self.detector.performance_windows["new_service"]) == 1
+        assert status["status"] == "healthy"
+
+    def test_health_status_stored_with_analysis(self):
+        """Test that health is classified once per analysis and reused."""
+        self.detector.flush_interval = 3600
+        with patch.object(self.detector, "_check_degradation_patterns"):
+            for i in range(12):
+                self.detector.record_performance_metric("database", {"response_time": 1.0 + i})
+            self.detector.flush()
+
+        assert self.detector.trend_analysis["database"]["health"] == ("critical", 0, 1)
+        with patch.object(self.detector, "_classify_trend_health") as classify:
+            status = self.detector.get_performance_health_status("database")
+            stats = self.detector.get_degradation_statistics()
+        classify.assert_not_called()
+        assert status["status"] == "critical"
+        assert status["error_metrics"] == 1
+        assert stats["services_with_concerning_trends"] == 1
+
+    def test_degradation_rules(self):
+        """Test threshold, correlation gate and severity for each rule."""
+        def trend(change_percent, correlation, recent_avg):
+            return {"change_percent": change_percent, "correlation": correlation,
+                    "recent_avg": recent_avg, "baseline_avg": 1.0}
+
+        trends = {
+            "response_time": trend(60.0, 0.9, 2.0),   # error: change >= 50%
+            "throughput": trend(-25.0, -0.8, 75.0),   # warning: drop < 30%
+            "error_rate": trend(15.0, 0.2, 0.5),      # below correlation gate
+            "cpu_usage": trend(30.0, 0.5, 70.0),      # warning: usage < 80%
+            "memory_usage": trend(20.0, 0.9, 90.0),   # not above 20% threshold
+        }
+        with patch.object(self.detector, "_send_degradation_alert") as send:
+            self.detector._check_degradation_patterns("database", trends, 1000.0)
+
+        detected = {call.args[1]["type"]: call.args[1]["severity"] for call in send.call_args_list}
+        assert detected == {
+            "response_time_degradation": "error",
+            "throughput_degradation": "warning",
+            "cpu_usage_degradation": "warning",
+        }
+        assert all(call.args[2] == 1000.0 for call in send.call_args_list)
+
+    def test_sparse_metrics_skip_pattern_check(self):
+        """Test that no pattern check runs until a metric has enough samples."""
+        self.detector.flush_interval = 3600
+        with patch.object(self.detector, "_check_degradation_patterns") as check:
+            for i in range(12):
+                metric = TREND_METRICS[i % len(TREND_METRICS)]
+                self.detector.record_performance_metric("database", {metric: 1.0})
+            self.detector.flush()
+
+        assert self.detector.trend_analysis["database"]["data_points"] == 12
+        assert self.detector.trend_analysis["database"]["trends"] == {}
+        check.assert_not_called()
+
+    def test_recent_alert_count(self):
+        """Test that recent alerts count each alert key's latest alert in the last hour."""
+        self.detector.alert_manager = MagicMock()
+        self.detector.logger = MagicMock()
+        degradation = {"type": "cpu_usage_degradation", "severity": "warning", "change_percent": 30.0,
+                       "correlation": 0.5, "current_avg": 70.0, "baseline_avg": 50.0}
+        now = time.time()
+
+        self.detector._send_degradation_alert("database", degradation, now - 5000)
+        self.detector._send_degradation_alert("database", degradation, now - 3000)
+        self.detector._send_degradation_alert("database", degradation, now - 1000)
+        self.detector._send_degradation_alert("scheduler", degradation, now - 2000)
+        assert self.detector.get_degradation_statistics()["recent_alerts"] == 2
+
+        self.detector._send_degradation_alert("database", degradation, now - 500)
+        assert self.detector.get_degradation_statistics()["recent_alerts"] == 2
+        self.detector._send_degradation_alert("api_processing", degradation, now)
+        assert self.detector.get_degradation_statistics()["recent_alerts"] == 3
+
+    def test_recent_alerts_pruned_when_sending(self):
+        """Test that sending an alert drops alerts older than the recent window."""
+        self.detector.alert_manager = MagicMock()
+        self.detector.logger = MagicMock()
+        degradation = {"type": "cpu_usage_degradation", "severity": "warning", "change_percent": 30.0,
+                       "correlation": 0.5, "current_avg": 70.0, "baseline_avg": 50.0}
+        now = time.time()
+
+        for i in range(5):
+            self.detector._send_degradation_alert(f"service_{i}", degradation, now - 10000 + i)
+        self.detector._send_degradation_alert("database", degradation, now)
+
+        assert [entry[1] for entry in self.detector._recent_alerts] == ["database"]
+        assert self.detector.get_degradation_statistics()["recent_alerts"] == 1
+
+    def test_background_analysis(self):
+        """Test that the background thread flushes metrics producers only queue."""
+        self.detector.flush_interval = 0.01
+        self.detector.flush_batch_size = 5
+        self.detector.start_background_analysis()
+        try:
+            flush = self.detector.flush
+            flushing_threads = []
+
+            def recording_flush():
+                flushing_threads.append(threading.current_thread())
+                flush()
+
+            with patch.object(self.detector, "flush", side_effect=recording_flush):
+                for _ in range(5):
+                    self.detector.record_performance_metric("scheduler", {"cpu_usage": 50.0})
+                deadline = time.monotonic() + 5
+                while len(self.detector.performance_windows["scheduler"]) < 5 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+            # Producers never flush on their own thread while it runs
+            assert threading.current_thread() not in flushing_threads
+            assert len(self.detector.performance_windows["scheduler"]) == 5
+        finally:
+            self.detector.stop_background_analysis()
+
+        assert self.detector._analysis_thread is None
+        self.detector.record_performance_metric("scheduler", {"cpu_usage": 50.0})
+        self.detector.flush()
+        assert len(self.detector.performance_windows["scheduler"]) == 6
+
+    def test_predictive_alerts_from_strong_trends(self):
+        """Test that only strongly correlated trends are projected."""
+        self.detector.flush_interval = 3600
+        with patch.object(self.detector, "_check_degradation_patterns"):
+            for i in range(12):
+                self.detector.record_performance_metric("database", {
+                    "cpu_usage": 60.0 + 2.0 * i,
+                    "memory_usage": 90.0 + (i % 2) * 4.0,
+                })
+            self.detector.flush()
+
+        assert self.detector.trend_analysis["database"]["strong_trend_metrics"] == ("cpu_usage",)
+        alerts = self.detector.get_predictive_alerts("database", forecast_minutes=10)
+        assert [alert["type"] for alert in alerts] == ["predictive_cpu_alert"]
+        assert alerts[0]["projected_value"] == pytest.approx(99.0)
+        assert self.detector.get_predictive_alerts("scheduler") == []
+
+    def test_eval_degradation_throughput_drop(self):
+        """Test a falling-metric rule evaluated on its own."""
+        rule = next(rule for rule in DEGRADATION_RULES if rule.metric == "throughput")
+        trend = {"change_percent": -35.0, "correlation": -0.7, "recent_avg": 65.0, "baseline_avg": 100.0}
+
+        degradation = PerformanceDegradationDetector._eval_degradation(rule, 20.0, trend)
+        assert degradation["severity"] == "error"
+        assert degradation["change_percent"] == -35.0
+        assert PerformanceDegradationDetector._eval_degradation(rule, 40.0, trend) is None
+
+    def test_background_thread_idles_without_metrics(self):
+        """Test that an idle analysis thread waits without a timeout."""
+        self.detector.flush_interval = 0.01
+        with patch.object(self.detector._pending_cv, "wait",
+                          wraps=self.detector._pending_cv.wait) as wait:
+            self.detector.start_background_analysis()
+            try:
+                time.sleep(0.1)
+                assert wait.call_count == 1
+                assert wait.call_args.args == ()
+            finally:
+                self.detector.stop_background_analysis()
@@ -14,6 +14,13 @@ from src.monitoring.models import (
 )
 
 
+def recent_alerts_stub(alerts):
+    """Stand in for SystemHealth.get_recent_alerts over a newest-first alert list."""
+    def get_recent_alerts(limit=50, predicate=None):
+        return [alert for alert in alerts if predicate is None or predicate(alert)][:limit]
+    return get_recent_alerts
+
+
 class TestHealthEndpoints:
     """Test health monitoring endpoints."""
     
@@ -313,7 +320,7 @@ class TestHealthEndpoints:
         )
         
         mock_system_health = MagicMock()
-        mock_system_health.get_all_alerts.return_value = [alert1, alert2]
+        mock_system_health.get_recent_alerts.side_effect = recent_alerts_stub([alert1, alert2])
         
         mock_health_monitor.get_comprehensive_health_async = AsyncMock(return_value=mock_system_health)
         
@@ -354,7 +361,7 @@ class TestHealthEndpoints:
         )
         
         mock_system_health = MagicMock()
-        mock_system_health.get_all_alerts.return_value = [alert1, alert2]
+        mock_system_health.get_recent_alerts.side_effect = recent_alerts_stub([alert1, alert2])
         
         mock_health_monitor.get_comprehensive_health_async = AsyncMock(return_value=mock_system_health)
         
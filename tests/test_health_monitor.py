@@ -281,6 +281,30 @@ class TestHealthMonitor:
         critical_alerts = health.get_critical_alerts()
         assert isinstance(critical_alerts, list)
     
+    @pytest.mark.asyncio
+    async def test_comprehensive_health_shares_timestamp(self):
+        """Test that a health snapshot and its checks share one timestamp."""
+        with patch.object(self.monitor, 'monitor_resource_usage') as mock_resource:
+            with patch('src.scheduler.monitoring.get_scheduler_health_monitor', side_effect=ImportError):
+                from src.monitoring.models import ResourceHealth
+                mock_resource.return_value = ResourceHealth(
+                    memory_usage_mb=512.0,
+                    memory_usage_percent=50.0,
+                    cpu_usage_percent=25.0,
+                    disk_usage_percent=60.0,
+                    database_connections=5,
+                    max_database_connections=20,
+                    open_file_descriptors=100,
+                    max_file_descriptors=1024,
+                    status=HealthStatus.HEALTHY
+                )
+                
+                health = await self.monitor.get_comprehensive_health_async()
+        
+        assert health.scheduler.last_check == health.timestamp
+        assert health.apis["dexscreener"].last_check == health.timestamp
+        assert all(alert.timestamp.replace(tzinfo=None) == health.timestamp for alert in health.scheduler.alerts)
+    
     def test_alert_cooldown(self):
         """Test alert cooldown functionality."""
         alert_key = "test_alert"
@@ -331,3 +331,92 @@ class TestLoadBasedProcessor:
         assert self.processor.current_load_level == "normal"
         assert self.processor.current_processing_factor == 1.0
         assert len(self.processor.disabled_features) == 0
+    
+    def test_reduced_after_minimal_reenables_mid_priority_features(self):
+        """Test that stepping down from minimal disables only the reduced set."""
+        self.processor.adjust_processing_parameters("minimal")
+        assert "api_caching" in self.processor.disabled_features
+        
+        self.processor.adjust_processing_parameters("reduced")
+        assert self.processor.disabled_features == {
+            "detailed_logging", "background_cleanup", "statistics_calculation"
+        }
+    
+    def test_load_history_columns(self):
+        """Test that load history keeps the last 60 assessments column-wise."""
+        for i in range(65):
+            self.processor.load_history.append({
+                "cpu_percent": float(i),
+                "memory_percent": i + 20.0,
+                "load_score": 2.0 * i,
+                "timestamp": float(i)
+            })
+        
+        history = self.processor.load_history
+        assert len(history) == 60
+        assert history[0]["cpu_percent"] == 5.0
+        assert history[-1] == {
+            "cpu_percent": 64.0,
+            "memory_percent": 84.0,
+            "disk_percent": 0.0,
+            "connections": 0,
+            "load_score": 128.0,
+            "timestamp": 64.0
+        }
+        
+        stats = self.processor.get_load_statistics()
+        assert stats["history_size"] == 60
+        assert stats["load_averages"]["cpu_percent"] == pytest.approx(34.5)
+        assert stats["load_peaks"]["load_score"] == 128.0
+        assert stats["load_distribution"] == {"normal": 50, "reduced": 10, "minimal": 0}
+    
+    def test_load_distribution_matches_load_level(self):
+        """Test that load statistics classify samples as determine_load_level does."""
+        # A warning threshold above its critical one makes the check order matter
+        self.processor.update_thresholds(cpu_warning=90.0, cpu_critical=80.0)
+        samples = [(50.0, 30.0), (85.0, 30.0), (95.0, 30.0), (50.0, 80.0), (50.0, 97.0)]
+        for cpu, memory in samples:
+            self.processor.load_history.append({
+                "cpu_percent": cpu, "memory_percent": memory, "load_score": 0.0, "timestamp": 0.0
+            })
+        
+        expected = {"normal": 0, "reduced": 0, "minimal": 0}
+        for cpu, memory in samples:
+            expected[self.processor.determine_load_level({"cpu_percent": cpu, "memory_percent": memory})] += 1
+        assert expected == {"normal": 2, "reduced": 1, "minimal": 2}
+        assert self.processor.get_load_statistics()["load_distribution"] == expected
+    
+    @patch('psutil.cpu_percent', return_value=10.0)
+    @patch('psutil.virtual_memory')
+    @patch('psutil.disk_usage')
+    @patch('psutil.net_connections', return_value=[])
+    def test_disk_usage_cached_between_assessments(self, mock_connections, mock_disk, mock_memory, mock_cpu):
+        """Test that disk usage is read at most once per TTL."""
+        mock_memory.return_value = MagicMock(percent=20.0)
+        mock_disk.return_value = MagicMock(used=300, total=1000)
+        
+        self.processor.assess_system_load()
+        mock_disk.return_value = MagicMock(used=900, total=1000)
+        load_metrics = self.processor.assess_system_load()
+        
+        assert mock_disk.call_count == 1
+        assert load_metrics["disk_percent"] == 30.0
+        
+        self.processor._disk_cache = (0.0, 30.0)
+        assert self.processor.assess_system_load()["disk_percent"] == 90.0
+    
+    def test_disabled_list_reused_until_adjustment(self):
+        """Test that the disabled feature order is cached but every result gets its own list."""
+        first = self.processor.adjust_processing_parameters("reduced")["disabled_features"]
+        cached = self.processor._disabled_list
+        again = self.processor._get_disabled_list()
+        assert again == first and again is not first
+        assert self.processor._disabled_list is cached
+        
+        # Mutating one result's list leaves later results intact
+        first.append("unexpected")
+        assert "unexpected" not in self.processor._get_disabled_list()
+        
+        second = self.processor.adjust_processing_parameters("minimal")["disabled_features"]
+        assert self.processor._disabled_list is not cached
+        assert set(second) == self.processor.disabled_features
@@ -0,0 +1,185 @@
+"""
+Tests for memory usage history analysis in the memory manager and reporter.
+"""
+
+import time
+
+import pytest
+from unittest.mock import patch
+
+from src.monitoring.memory_manager import (
+    IntelligentMemoryManager,
+    MemoryOptimizationResult,
+    MemoryUsageSnapshot,
+)
+from src.monitoring.memory_reporter import MemoryReporter
+
+
+def make_snapshot(timestamp: float, used_mb: float, process_mb: float = 100.0) -> MemoryUsageSnapshot:
+    return MemoryUsageSnapshot(
+        timestamp=timestamp,
+        used_mb=used_mb,
+        available_mb=64000.0 - used_mb,
+        total_mb=64000.0,
+        percent_used=used_mb / 640.0,
+        process_memory_mb=process_mb,
+    )
+
+
+def make_optimization(timestamp: float, recovered_mb: float) -> MemoryOptimizationResult:
+    return MemoryOptimizationResult(
+        before_mb=500.0,
+        after_mb=500.0 - recovered_mb,
+        recovered_mb=recovered_mb,
+        actions_taken=["gc_collect", "reset_dex_broker_stats"],
+        success=True,
+        timestamp=timestamp,
+    )
+
+
+class TestMemoryReporterAnalysis:
+    """Test usage and optimization analysis over recorded history."""
+
+    def setup_method(self):
+        """Set up a manager with synthetic history and a reporter over it."""
+        self.manager = IntelligentMemoryManager()
+        with patch("src.monitoring.memory_reporter.get_memory_manager", return_value=self.manager):
+            self.reporter = MemoryReporter()
+
+        self.now = 1_700_000_000.0
+        # One sample every 30 seconds for the last 20 minutes, rising steadily
+        for i in range(40):
+            self.manager.record_snapshot(make_snapshot(self.now - (39 - i) * 30, 2000.0 + i * 10))
+
+    def test_snapshot_percentages(self):
+        """Test derived percentage on snapshots."""
+        snapshot = make_snapshot(self.now, 16000.0)
+        assert snapshot.used_percent == pytest.approx(25.0)
+
+    def test_whole_history_uses_running_aggregates(self):
+        """Test a period covering the whole history."""
+        analysis = self.reporter._analyze_usage_history(self.now - 3600, self.now)
+
+        assert analysis["samples"] == 40
+        assert analysis["average_mb"] == pytest.approx(2195.0)
+        assert analysis["min_mb"] == 2000.0
+        assert analysis["peak_mb"] == 2390.0
+        assert analysis["trend"] == "increasing"
+
+    def test_minute_buckets_match_samples(self):
+        """Test that bucketed analysis agrees with the raw samples it covers."""
+        start = self.now - 600
+        analysis = self.reporter._analyze_usage_history(start, self.now)
+
+        # Buckets are selected by the minute they start in
+        first_minute = start - start % 60
+        expected = [
+            2000.0 + i * 10
+            for i in range(40)
+            if self.now - (39 - i) * 30 >= (first_minute if first_minute >= start else first_minute + 60)
+        ]
+        assert analysis["samples"] == len(expected)
+        assert analysis["average_mb"] == pytest.approx(sum(expected) / len(expected))
+        assert analysis["peak_mb"] == max(expected)
+        assert analysis["min_mb"] == min(expected)
+        assert analysis["trend"] == "increasing"
+
+    def test_sub_minute_period_uses_raw_samples(self):
+        """Test a period shorter than a bucket."""
+        analysis = self.reporter._analyze_usage_history(self.now - 45, self.now)
+
+        assert analysis["samples"] == 2
+        assert analysis["average_mb"] == pytest.approx(2385.0)
+        assert analysis["trend"] == "insufficient_data"
+
+    def test_empty_period(self):
+        """Test a period with no samples."""
+        analysis = self.reporter._analyze_usage_history(self.now + 10, self.now + 20)
+        assert analysis["samples"] == 0
+        assert analysis["trend"] == "unknown"
+
+    def test_trend_classification(self):
+        """Test trend classification from the fitted slope."""
+        timestamps = [float(i * 60) for i in range(10)]
+        assert self.reporter._calculate_trend(timestamps, [1000.0 - i * 20 for i in range(10)]) == "decreasing"
+        assert self.reporter._calculate_trend(timestamps, [1000.0 + (i % 2) for i in range(10)]) == "stable"
+        assert self.reporter._calculate_trend(timestamps[:2], [1.0, 2.0]) == "insufficient_data"
+        assert self.reporter._calculate_trend([5.0] * 5, [1.0] * 5) == "insufficient_data"
+
+    def test_trim_keeps_columns_consistent(self):
+        """Test that trimming keeps columns, aggregates and buckets in step."""
+        self.manager._trim_usage_history(5)
+
+        assert len(self.manager.usage_history) == 5
+        assert self.manager.usage_stats.count == 5
+        assert self.manager.usage_stats.minimum() == 2350.0
+        assert self.manager.usage_minute_buckets[0].minute <= self.manager.usage_timestamps[0]
+
+    def test_recent_usage_trend(self):
+        """Test the last-5 usage trend in memory statistics."""
+        with patch.object(self.manager, "get_current_memory_snapshot", return_value=make_snapshot(self.now, 2400.0)):
+            usage_trend = self.manager.get_memory_statistics()["usage_trend"]
+
+        assert usage_trend["average_mb"] == pytest.approx(2370.0)
+        assert usage_trend["min_mb"] == 2350.0
+        assert usage_trend["max_mb"] == 2390.0
+        assert usage_trend["trend_direction"] == "increasing"
+
+    def test_optimization_aggregates(self):
+        """Test running optimization aggregates against partial periods."""
+        for i, recovered in enumerate([5.0, -2.0, 40.0, 12.0]):
+            self.manager.record_optimization(make_optimization(self.now - (3 - i) * 600, recovered))
+
+        whole = self.reporter._analyze_optimization_history(self.now - 3600, self.now)
+        assert whole["count"] == 4
+        assert whole["total_recovered_mb"] == pytest.approx(57.0)
+        assert whole["most_effective"].startswith("40.0MB recovered")
+
+        partial = self.reporter._analyze_optimization_history(self.now - 700, self.now)
+        assert partial["count"] == 2
+        assert partial["total_recovered_mb"] == pytest.approx(52.0)
+
+        result = self.manager.optimization_history[2]
+        assert partial["history"][0] == result.to_report_entry()
+        assert partial["history"][0]["actions_count"] == 2
+
+        # Serialized forms are fresh per call, so editing one leaves the result intact
+        serialized = result.to_dict()
+        serialized["actions"].append("edited")
+        partial["history"][0]["success"] = False
+        assert result.to_dict()["actions"] == ["gc_collect", "reset_dex_broker_stats"]
+        assert result.actions_taken == ["gc_collect", "reset_dex_broker_stats"]
+        assert result.to_report_entry()["success"] is True
+
+        self.manager._trim_optimization_history(1)
+        assert self.manager.optimization_recovered_mb == pytest.approx(12.0)
+        assert self.manager.best_optimization.recovered_mb == 12.0
+
+
+class TestMemoryReportCache:
+    """Test report caching."""
+
+    def test_report_reused_until_history_changes(self):
+        """Test that a cached report is reused until a new sample arrives."""
+        manager = IntelligentMemoryManager()
+        with patch("src.monitoring.memory_reporter.get_memory_manager", return_value=manager):
+            reporter = MemoryReporter()
+
+        first = reporter.generate_report(1.0)
+        assert reporter.generate_report(1.0) is first
+
+        manager.record_snapshot(make_snapshot(time.time(), 1000.0))
+        assert reporter.generate_report(1.0) is not first
+
+    def test_unchanged_log_skip_expires(self):
+        """Test that an unchanged report is only skipped within the cache TTL."""
+        manager = IntelligentMemoryManager()
+        with patch("src.monitoring.memory_reporter.get_memory_manager", return_value=manager):
+            reporter = MemoryReporter(cache_ttl_seconds=30.0)
+
+        with patch("src.monitoring.memory_reporter.time.monotonic", return_value=1000.0):
+            assert reporter.log_memory_report(1.0) is True
+            assert reporter.log_memory_report(1.0) is False
+
+        with patch("src.monitoring.memory_reporter.time.monotonic", return_value=1031.0):
+            assert reporter.log_memory_report(1.0) is True
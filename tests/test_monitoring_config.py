@@ -4,6 +4,7 @@ Tests for monitoring configuration system.
 
 import pytest
 import os
+from dataclasses import asdict, fields
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
@@ -68,6 +69,20 @@ class TestMonitoringSettings:
             )
 
 
+class TestMonitoringConfigModel:
+    """Test the MonitoringConfig dataclass."""
+    
+    def test_to_dict_matches_fields(self):
+        """Test that to_dict exports every field with its current value."""
+        config = MonitoringConfig(cpu_warning_threshold=55.0, alert_cooldown=60)
+        exported = config.to_dict()
+        
+        assert list(exported) == [f.name for f in fields(MonitoringConfig)]
+        assert exported == asdict(config)
+        assert exported["cpu_warning_threshold"] == 55.0
+        assert exported["alert_cooldown"] == 60
+
+
 class TestConfigurationManager:
     """Test ConfigurationManager class."""
     
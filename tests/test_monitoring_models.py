@@ -35,6 +35,19 @@ class TestHealthModels:
         assert alert.correlation_id is None
         assert alert.context == {}
     
+    def test_health_alert_has_slots(self):
+        """Test that alerts are slotted rather than carrying an instance dict."""
+        alert = HealthAlert(
+            level=AlertLevel.INFO,
+            message="Test alert",
+            component="test.component",
+            timestamp=datetime.utcnow()
+        )
+        
+        assert not hasattr(alert, "__dict__")
+        with pytest.raises(AttributeError):
+            alert.unknown_field = True
+    
     def test_scheduler_health_defaults(self):
         """Test SchedulerHealth model with defaults."""
         health = SchedulerHealth(
@@ -149,6 +162,49 @@ class TestHealthModels:
         critical_alerts = system_health.get_critical_alerts()
         assert len(critical_alerts) == 1
         assert critical_alerts[0].level == AlertLevel.CRITICAL
+    
+    def test_system_health_recent_alerts(self):
+        """Test alert ordering across components, bounded and filtered."""
+        base = datetime(2024, 1, 1)
+        levels = [AlertLevel.INFO, AlertLevel.ERROR, AlertLevel.WARNING, AlertLevel.CRITICAL]
+        
+        def alerts(component, minutes):
+            return [
+                HealthAlert(level=levels[minute % 4], message=f"{component} {minute}",
+                            component=component, timestamp=base + timedelta(minutes=minute))
+                for minute in minutes
+            ]
+        
+        scheduler_health = SchedulerHealth(
+            status=HealthStatus.DEGRADED, hot_group_last_run=None, cold_group_last_run=None,
+            hot_group_processing_time=0.0, cold_group_processing_time=0.0,
+            tokens_processed_per_minute=0.0, error_rate=0.0, active_jobs=0, failed_jobs_last_hour=0,
+            alerts=alerts("scheduler", [0, 5, 9])
+        )
+        resource_health = ResourceHealth(
+            memory_usage_mb=0.0, memory_usage_percent=0.0, cpu_usage_percent=0.0, disk_usage_percent=0.0,
+            database_connections=0, max_database_connections=0, open_file_descriptors=0,
+            max_file_descriptors=0, status=HealthStatus.HEALTHY, alerts=alerts("resources", [2, 7])
+        )
+        api_health = APIHealth(
+            service_name="dexscreener", status=HealthStatus.HEALTHY, average_response_time=0.0,
+            p95_response_time=0.0, error_rate=0.0, circuit_breaker_state=CircuitState.CLOSED,
+            cache_hit_rate=0.0, requests_per_minute=0.0, last_successful_call=None,
+            consecutive_failures=0, alerts=alerts("dexscreener", [1, 3, 6])
+        )
+        system_health = SystemHealth(
+            overall_status=HealthStatus.DEGRADED, scheduler=scheduler_health, resources=resource_health,
+            apis={"dexscreener": api_health}, uptime_seconds=0.0, last_restart=None,
+            alerts=alerts("system", [4, 8])
+        )
+        
+        all_alerts = system_health.get_all_alerts()
+        assert [alert.timestamp.minute for alert in all_alerts] == list(range(9, -1, -1))
+        assert system_health.get_recent_alerts(limit=3) == all_alerts[:3]
+        assert system_health.get_recent_alerts(limit=100) == all_alerts
+        resource_alerts = system_health.get_recent_alerts(limit=1, predicate=lambda alert: alert.component == "resources")
+        assert [alert.timestamp.minute for alert in resource_alerts] == [7]
+        assert [alert.timestamp.minute for alert in system_health.get_critical_alerts()] == [9, 7, 5, 3, 1]
 
 
 class TestPerformanceModels:
@@ -172,6 +228,21 @@ class TestPerformanceModels:
         avg_processing = metrics.get_avg_processing_time()
         assert avg_processing == 37.5
     
+    def test_api_response_time_percentiles(self):
+        """Test percentile selection against a full sort."""
+        times = [float((i * 37) % 101) for i in range(101)]
+        metrics = PerformanceMetrics(component="test", timestamp=datetime.utcnow(), api_response_times=times)
+        
+        sorted_times = sorted(times)
+        assert metrics.get_p95_api_response_time() == sorted_times[95]
+        assert metrics.get_api_response_time_percentiles([50, 95, 99, 100]) == [
+            sorted_times[50], sorted_times[95], sorted_times[99], sorted_times[100]
+        ]
+        
+        empty = PerformanceMetrics(component="test", timestamp=datetime.utcnow())
+        assert empty.get_p95_api_response_time() == 0.0
+        assert empty.get_api_response_time_percentiles([50, 95]) == [0.0, 0.0]
+    
     def test_performance_alert_creation(self):
         """Test PerformanceAlert creation."""
         alert = PerformanceAlert(
@@ -223,6 +294,60 @@ class TestMetricsCollector:
         assert health.status == HealthStatus.HEALTHY
         assert len(health.alerts) == 0
     
+    @patch('src.monitoring.metrics.psutil')
+    def test_slow_metrics_cached(self, mock_psutil):
+        """Test that disk usage and descriptor counts are reused within the TTL."""
+        mock_psutil.virtual_memory.return_value = MagicMock(used=512 * 1024 * 1024, percent=50.0)
+        mock_psutil.cpu_percent.return_value = 25.0
+        mock_psutil.disk_usage.return_value = MagicMock(used=50, total=100)
+        mock_process = MagicMock()
+        mock_process.num_fds.return_value = 100
+        mock_psutil.Process.return_value = mock_process
+        
+        collector = MetricsCollector(MonitoringConfig(min_resource_interval=0.0))
+        collector.collect_resource_metrics()
+        
+        mock_psutil.disk_usage.return_value = MagicMock(used=90, total=100)
+        mock_process.num_fds.return_value = 200
+        health = collector.collect_resource_metrics()
+        
+        assert mock_psutil.disk_usage.call_count == 1
+        assert health.disk_usage_percent == 50.0
+        assert health.open_file_descriptors == 100
+        
+        # Expire the caches
+        collector._disk_cache = (0.0, health.disk_usage_percent)
+        collector._fds_cache = (0.0, health.open_file_descriptors)
+        health = collector.collect_resource_metrics()
+        
+        assert health.disk_usage_percent == 90.0
+        assert health.open_file_descriptors == 200
+        assert mock_psutil.Process.call_count == 1
+    
+    @patch('src.monitoring.metrics.psutil')
+    def test_resource_polls_rate_limited(self, mock_psutil):
+        """Test that polls within the minimum interval reuse the last result."""
+        mock_psutil.virtual_memory.return_value = MagicMock(used=512 * 1024 * 1024, percent=50.0)
+        mock_psutil.cpu_percent.return_value = 25.0
+        mock_psutil.disk_usage.return_value = MagicMock(used=50, total=100)
+        
+        collector = MetricsCollector(MonitoringConfig(min_resource_interval=60.0))
+        first = collector.collect_resource_metrics()
+        
+        second = collector.collect_resource_metrics()
+        assert second == first
+        assert mock_psutil.virtual_memory.call_count == 1
+        
+        # Each caller gets its own alert list, so edits stay out of the cache
+        second.alerts.append(MagicMock())
+        assert collector.collect_resource_metrics() == first
+        assert collector.collect_resource_metrics().alerts is not first.alerts
+        
+        collector._last_resource = (0.0, first)
+        with patch('src.monitoring.metrics.time.monotonic', return_value=1_000_000.0):
+            assert collector.collect_resource_metrics() is not first
+        assert mock_psutil.virtual_memory.call_count == 2
+    
     @patch('src.monitoring.metrics.psutil')
     def test_resource_alerts_generation(self, mock_psutil):
         """Test resource alert generation."""
@@ -255,6 +380,13 @@ class TestMetricsCollector:
         alert_levels = [alert.level for alert in health.alerts]
         assert AlertLevel.WARNING in alert_levels
         assert AlertLevel.CRITICAL in alert_levels
+        
+        messages = {alert.component: alert.message for alert in health.alerts}
+        assert messages == {
+            "system.memory": "Memory usage high: 1500.0MB (threshold: 1400.0MB)",
+            "system.cpu": "CPU usage critical: 85.0% (threshold: 80.0%)",
+            "system.disk": "Disk usage high: 85.0% (threshold: 80.0%)",
+        }
 
 
 class TestPerformanceAnalyzer:
@@ -280,6 +412,14 @@ class TestPerformanceAnalyzer:
         trend, slope = analyzer.analyze_trends("test2", "response_time")
         assert trend == "decreasing"
         assert slope < 0
+        
+        # Only the last 5 points count
+        for value in [500, 0, 10, 20, 30, 40]:
+            analyzer.add_metric("test3", "response_time", value)
+        
+        trend, slope = analyzer.analyze_trends("test3", "response_time")
+        assert trend == "increasing"
+        assert slope == pytest.approx(10.0)
     
     def test_performance_issue_detection(self):
         """Test performance issue detection."""
@@ -335,5 +475,13 @@ class TestUtilityFunctions:
         statuses = [HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.CRITICAL]
         assert aggregate_health_status(statuses) == HealthStatus.CRITICAL
         
+        # Unknown without degraded or critical
+        statuses = [HealthStatus.HEALTHY, HealthStatus.UNKNOWN]
+        assert aggregate_health_status(statuses) == HealthStatus.UNKNOWN
+        
+        # Degraded outranks unknown
+        statuses = [HealthStatus.UNKNOWN, HealthStatus.DEGRADED]
+        assert aggregate_health_status(statuses) == HealthStatus.DEGRADED
+        
         # Empty list
         assert aggregate_health_status([]) == HealthStatus.UNKNOWN
\ No newline at end of file
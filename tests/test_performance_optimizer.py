@@ -0,0 +1,227 @@
+"""
+Tests for Performance Optimizer functionality.
+"""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.monitoring.metrics import PerformanceOptimizer, PerformanceSnapshot
+from src.monitoring.performance_optimizer import SimplePerformanceOptimizer
+
+
+class TestPerformanceOptimizer:
+    """Test Performance Optimizer functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.optimizer = PerformanceOptimizer()
+        self.now = time.time()
+
+    def add_metric(self, service, age, response_time=1.0, cpu_usage=50.0, memory_usage=50.0):
+        self.optimizer.record_performance_metrics(service, {
+            "timestamp": self.now - age,
+            "response_time": response_time,
+            "cpu_usage": cpu_usage,
+            "memory_usage": memory_usage
+        })
+
+    def test_recent_averages_follow_recorded_metrics(self):
+        """Test that recent averages track each recorded metric."""
+        for age in (40, 30, 20):
+            self.add_metric("scheduler", age, cpu_usage=90.0)
+
+        averages = self.optimizer._get_recent_performance_averages("scheduler", self.now)
+        assert averages == pytest.approx((1.0, 90.0, 50.0))
+
+        self.add_metric("scheduler", 10, cpu_usage=10.0)
+        averages = self.optimizer._get_recent_performance_averages("scheduler", self.now)
+        assert averages == pytest.approx((1.0, 70.0, 50.0))
+        assert len(self.optimizer.performance_history["scheduler"]) == 4
+
+    def test_recent_averages_match_last_metrics(self):
+        """Test that only the most recent metrics are averaged."""
+        for i in range(30):
+            self.add_metric("database", 60 - i, response_time=float(i))
+
+        expected = sum(range(10, 30)) / 20
+        assert self.optimizer._get_recent_performance_averages("database", self.now)[0] == pytest.approx(expected)
+        assert self.optimizer._get_recent_performance_averages("unknown", self.now) is None
+
+    def test_recent_averages_expire_with_window(self):
+        """Test that cached averages are recomputed once metrics age out."""
+        self.add_metric("scheduler", 290, cpu_usage=90.0)
+        self.add_metric("scheduler", 10, cpu_usage=10.0)
+
+        assert self.optimizer._get_recent_performance_averages("scheduler", self.now)[1] == pytest.approx(50.0)
+
+        later = self.now + 20
+        assert self.optimizer._get_recent_performance_averages("scheduler", later)[1] == pytest.approx(10.0)
+
+    def test_should_optimize_uses_recent_averages(self):
+        """Test optimization trigger from recent averages."""
+        assert not self.optimizer.should_optimize("scheduler")
+
+        self.add_metric("scheduler", 10, response_time=9.0)
+        assert self.optimizer.should_optimize("scheduler")
+
+    def test_cleanup_old_metrics_in_place(self):
+        """Test that cleanup deletes the stale prefix and its running sums."""
+        history = self.optimizer.performance_history["scheduler"]
+        self.add_metric("scheduler", 120, cpu_usage=90.0)
+        self.add_metric("scheduler", 60, cpu_usage=10.0)
+
+        self.optimizer._initialize_logger()
+        self.optimizer._cleanup_old_metrics("scheduler", keep_hours=90 / 3600)
+
+        assert self.optimizer.performance_history["scheduler"] is history
+        assert len(history) == 1
+        assert self.optimizer._get_recent_performance_averages("scheduler", self.now)[1] == pytest.approx(10.0)
+
+    def test_recent_metrics_bisect_window(self):
+        """Test that recent metrics are the last 20 inside the time window."""
+        for age in (900, 600, 200, 100):
+            self.add_metric("dexscreener", age)
+
+        recent = self.optimizer._get_recent_performance_metrics("dexscreener", current_time=self.now)
+        assert [self.now - m["timestamp"] for m in recent] == pytest.approx([200, 100])
+
+        for i in range(30):
+            self.add_metric("dexscreener", 50 - i)
+        recent = self.optimizer._get_recent_performance_metrics("dexscreener", current_time=self.now)
+        assert len(recent) == 20
+        assert recent[-1]["timestamp"] == pytest.approx(self.now + 29)
+
+    def test_optimize_from_snapshot(self):
+        """Test batch size and parallelism adjustment from a performance snapshot."""
+        self.optimizer._initialize_logger()
+
+        stressed = PerformanceSnapshot(cpu_usage=95.0, memory_usage=50.0)
+        assert self.optimizer.optimize_batch_size("database", stressed) == 80
+        assert self.optimizer.optimize_parallelism("database", stressed) == 2
+
+        idle = PerformanceSnapshot(cpu_usage=10.0, memory_usage=20.0, response_time=0.5, queue_length=4)
+        assert self.optimizer.optimize_batch_size("database", idle) == 96
+        assert self.optimizer.optimize_parallelism("database", idle) == 3
+
+    def test_record_current_performance(self):
+        """Test that current readings are recorded as samples for should_optimize."""
+        load = {"cpu_percent": 95.0, "memory_percent": 40.0}
+        api_stats = {"average_response_time": 1500.0, "calls_per_minute": 12, "error_rate": 10.0}
+        with patch.object(self.optimizer.load_processor, "get_current_load", return_value=load), \
+                patch.object(self.optimizer.performance_tracker, "get_api_performance", return_value=api_stats):
+            services = self.optimizer.record_current_performance()
+
+        assert services == ["scheduler", "dexscreener", "database", "api_processing"]
+        sample = self.optimizer.performance_history["dexscreener"][-1]
+        assert sample["response_time"] == pytest.approx(1.5)
+        assert sample["throughput"] == 12
+        assert sample["error_rate"] == pytest.approx(0.1)
+        assert self.optimizer.should_optimize("dexscreener")
+
+    def test_optimize_services_batch(self):
+        """Test optimizing several services in one call."""
+        results = self.optimizer.optimize_services(["scheduler", "database"])
+
+        assert set(results) == {"scheduler", "database"}
+        assert all(result == {"optimized": False, "reason": "optimization_not_needed"}
+                   for result in results.values())
+
+    def test_system_load_shared_within_ttl(self):
+        """Test that performance snapshots reuse a recent system load reading."""
+        load = {"cpu_percent": 30.0, "memory_percent": 40.0}
+        with patch.object(self.optimizer.load_processor, "get_current_load", return_value=load) as get_load, \
+                patch.object(self.optimizer.performance_tracker, "get_api_performance",
+                             return_value={"average_response_time": 200.0}):
+            first = self.optimizer._get_current_performance("scheduler")
+            second = self.optimizer._get_current_performance("database")
+            assert get_load.call_count == 1
+
+            self.optimizer._system_load_cache = (0.0, load)
+            self.optimizer._get_current_performance("scheduler")
+            assert get_load.call_count == 2
+
+        assert first == PerformanceSnapshot(cpu_usage=30.0, memory_usage=40.0, response_time=0.2)
+        assert second.cpu_usage == 30.0
+
+    def test_optimization_counters(self):
+        """Test that optimization statistics follow history additions and deletions."""
+        self.optimizer._initialize_logger()
+
+        def optimize(service, count, at=None):
+            with patch.object(self.optimizer, "should_optimize", return_value=True), \
+                    patch.object(self.optimizer, "_get_current_performance",
+                                 return_value=PerformanceSnapshot(cpu_usage=50.0, memory_usage=50.0)), \
+                    patch("src.monitoring.metrics.time.time", return_value=at or time.time()):
+                for _ in range(count):
+                    self.optimizer.optimize_service(service)
+
+        optimize("scheduler", 10, at=self.now - 7200)
+        optimize("scheduler", 20)
+        optimize("database", 1)
+        stats = self.optimizer.get_optimization_statistics()
+        assert stats["total_optimizations"] == 31
+        assert stats["recent_optimizations"] == 21
+
+        self.optimizer._cleanup_old_metrics("scheduler", keep_hours=1)
+        assert len(self.optimizer.optimization_history["scheduler"]) == 20
+        assert self.optimizer.get_optimization_statistics()["total_optimizations"] == 21
+
+        # Truncation past 100 entries keeps the newest 50
+        optimize("scheduler", 81)
+        assert len(self.optimizer.optimization_history["scheduler"]) == 50
+        stats = self.optimizer.get_optimization_statistics()
+        assert stats["total_optimizations"] == 51
+        assert stats["recent_optimizations"] == 51
+
+
+class TestSimplePerformanceOptimizer:
+    """Test the simple optimizer's system metrics sampling."""
+
+    def test_basic_metrics_cached_within_ttl(self):
+        """Test that system metrics are sampled once per TTL."""
+        optimizer = SimplePerformanceOptimizer()
+        memory = MagicMock(used=2048 * 1024 * 1024)
+        with patch("psutil.virtual_memory", return_value=memory) as virtual_memory, \
+                patch("psutil.cpu_percent", return_value=35.0) as cpu_percent:
+            first = optimizer._get_basic_metrics()
+            first["cpu_usage"] = 0
+            second = optimizer._get_basic_metrics()
+            assert virtual_memory.call_count == 1
+            assert cpu_percent.call_count == 1
+
+            optimizer._metrics_cache = (time.monotonic() - optimizer.metrics_ttl, optimizer._metrics_cache[1])
+            optimizer._get_basic_metrics()
+            assert virtual_memory.call_count == 2
+
+        assert second["cpu_usage"] == 35.0
+        assert second["memory_mb"] == pytest.approx(2048.0)
+
+    def test_memory_alert_uses_total_memory_constant(self):
+        """Test memory alert percentages against the total read at import."""
+        optimizer = SimplePerformanceOptimizer()
+        notifier = MagicMock()
+        with patch("src.monitoring.performance_optimizer.get_telegram_notifier", return_value=notifier), \
+                patch("src.monitoring.performance_optimizer._TOTAL_MEMORY_MB", 16384.0), \
+                patch("src.monitoring.performance_optimizer._TOTAL_MEMORY_GB", 16.0), \
+                patch("psutil.virtual_memory") as virtual_memory:
+            optimizer._send_memory_alert("warning", 8192.0)
+
+        virtual_memory.assert_not_called()
+        kwargs = notifier.send_memory_alert.call_args.kwargs
+        assert kwargs["total_memory_gb"] == 16.0
+        assert kwargs["usage_percent"] == pytest.approx(50.0)
+
+    def test_memory_alert_skipped_when_telegram_unconfigured(self):
+        """Test that an unconfigured notifier is looked up only once."""
+        optimizer = SimplePerformanceOptimizer()
+        notifier = MagicMock()
+        notifier.is_configured.return_value = False
+        with patch("src.monitoring.performance_optimizer.get_telegram_notifier",
+                   return_value=notifier) as get_notifier:
+            optimizer._send_memory_alert("critical", 13000.0)
+            optimizer._send_memory_alert("critical", 13000.0)
+
+        assert get_notifier.call_count == 1
+        notifier.send_memory_alert.assert_not_called()
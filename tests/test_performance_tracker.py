@@ -39,9 +39,10 @@ class TestPerformanceTracker:
         assert call["endpoint"] == "/pairs"
         assert call["error"] is None
         
-        # Verify stats were updated
-        assert "dexscreener" in self.tracker._api_stats
-        stats = self.tracker._api_stats["dexscreener"]
+        # Verify stats are computed on read
+        assert self.tracker._api_dirty["dexscreener"] is True
+        stats = self.tracker.get_api_performance("dexscreener")
+        assert self.tracker._api_dirty["dexscreener"] is False
         assert stats["total_calls"] == 1
         assert stats["success_rate"] == 100.0
         assert stats["average_response_time"] == 150.0
@@ -55,7 +56,7 @@ class TestPerformanceTracker:
         assert call["success"] is False
         assert call["error"] == "Timeout"
         
-        stats = self.tracker._api_stats["dexscreener"]
+        stats = self.tracker.get_api_performance("dexscreener")
         assert stats["success_rate"] == 0.0
         assert stats["error_rate"] == 100.0
     
@@ -74,9 +75,9 @@ class TestPerformanceTracker:
         assert execution["error_count"] == 1
         assert execution["success_rate"] == 0.8
         
-        # Verify stats were updated
-        assert "hot" in self.tracker._scheduler_stats
-        stats = self.tracker._scheduler_stats["hot"]
+        # Verify stats are computed on read
+        assert "hot" not in self.tracker._scheduler_stats
+        stats = self.tracker.get_scheduler_performance("hot")
         assert stats["total_executions"] == 1
         assert stats["average_processing_time"] == 30.0
         assert stats["overall_success_rate"] == 80.0
@@ -106,6 +107,10 @@ class TestPerformanceTracker:
         # Test edge cases
         assert self.tracker._calculate_percentile([], 50) == 0.0
         assert self.tracker._calculate_percentile([5], 50) == 5
+        
+        # Several percentiles from one sort
+        assert self.tracker._calculate_percentiles(values[::-1], (50, 95, 99)) == [5.5, 9.5, pytest.approx(9.9)]
+        assert self.tracker._calculate_percentiles([], (95, 99)) == [0.0, 0.0]
     
     def test_api_performance_statistics(self):
         """Test API performance statistics calculation."""
@@ -151,6 +156,36 @@ class TestPerformanceTracker:
         assert stats["min_processing_time"] == 25.0
         assert stats["max_processing_time"] == 60.0
     
+    def test_api_percentiles_computed_once_per_change(self):
+        """Test that repeated reads reuse percentiles until a new call is recorded."""
+        for i in range(20):
+            self.tracker.record_api_call("cached_api", float(i), True)
+        
+        with patch.object(self.tracker, "_calculate_percentiles", wraps=self.tracker._calculate_percentiles) as percentiles:
+            first = self.tracker.get_api_performance("cached_api")
+            self.tracker.get_api_performance("cached_api")
+            assert percentiles.call_count == 1
+            
+            self.tracker.record_api_call("cached_api", 100.0, True)
+            second = self.tracker.get_api_performance("cached_api")
+            assert percentiles.call_count == 2
+        
+        assert first["p95_response_time"] == pytest.approx(18.5)
+        assert second["p99_response_time"] == pytest.approx(19.0 + (100.0 - 19.0) * 0.79)
+    
+    def test_scheduler_hourly_window(self):
+        """Test that only executions from the last hour count towards hourly rates."""
+        for timestamp in (1_000.0, 2_000.0, 5_000.0, 5_500.0):
+            with patch('time.time', return_value=timestamp):
+                self.tracker.record_scheduler_execution("windowed", 10.0, 60, 60, 0)
+        
+        with patch('time.time', return_value=5_600.0):
+            stats = self.tracker.get_scheduler_performance("windowed")
+        
+        assert stats["total_executions"] == 4
+        assert stats["executions_per_hour"] == 3
+        assert stats["tokens_per_minute"] == 3.0  # 180 tokens / 60
+    
     def test_system_performance_statistics(self):
         """Test system performance statistics calculation."""
         # Record multiple system metrics
@@ -174,6 +209,24 @@ class TestPerformanceTracker:
         assert stats["peak_connections"] == 6
         assert stats["metrics_collected"] == 4
     
+    def test_system_performance_recent_window(self):
+        """Test that system statistics cover only the last hour when it has samples."""
+        for timestamp, cpu in ((1_000.0, 90.0), (5_000.0, 20.0), (5_500.0, 30.0)):
+            with patch('time.time', return_value=timestamp):
+                self.tracker.record_system_metrics(cpu, 50.0, 40.0, 5)
+        
+        with patch('time.time', return_value=5_600.0):
+            stats = self.tracker.get_system_performance()
+        assert stats["recent_metrics_count"] == 2
+        assert stats["average_cpu_percent"] == 25.0
+        assert stats["peak_cpu_percent"] == 30.0
+        
+        # Without recent samples, all samples are used
+        with patch('time.time', return_value=20_000.0):
+            stats = self.tracker.get_system_performance()
+        assert stats["recent_metrics_count"] == 3
+        assert stats["peak_cpu_percent"] == 90.0
+    
     def test_performance_trend_analysis(self):
         """Test performance trend analysis."""
         # Record API calls with improving trend
@@ -269,6 +322,13 @@ class TestPerformanceTracker:
         assert len(self.tracker._api_calls["old_api"]) == 1
         assert len(self.tracker._scheduler_executions["old_group"]) == 1
         assert len(self.tracker._system_metrics) == 1
+        
+        # Running aggregates only cover the surviving call
+        with patch('time.time', return_value=2000):
+            stats = self.tracker.get_api_performance("old_api")
+        assert stats["total_calls"] == 1
+        assert stats["min_response_time"] == 150.0
+        assert stats["calls_per_hour"] == 1
     
     def test_global_performance_tracker(self):
         """Test global performance tracker function."""
@@ -294,3 +354,37 @@ class TestPerformanceTracker:
         calls = list(small_tracker._api_calls["test_api"])
         response_times = [call["response_time"] for call in calls]
         assert response_times == [105.0, 106.0, 107.0, 108.0, 109.0]
+    
+    def test_running_api_stats_match_history(self):
+        """Test that running API aggregates track evictions from the history."""
+        small_tracker = PerformanceTracker(max_history_size=5)
+        
+        with patch('time.time', return_value=10_000):
+            for i in range(5):
+                small_tracker.record_api_call("test_api", 100.0, False)
+        
+        with patch('time.time', return_value=13_590):
+            for i in range(3):
+                small_tracker.record_api_call("test_api", 200.0 + i, True)
+            stats = small_tracker.get_api_performance("test_api")
+        
+        # History holds two failed 100ms calls and three successful ones
+        assert stats["total_calls"] == 5
+        assert stats["success_rate"] == 60.0
+        assert stats["min_response_time"] == 100.0
+        assert stats["max_response_time"] == 202.0
+        assert stats["average_response_time"] == pytest.approx((200 + 603 + 2 * 1000) / 5)
+        assert stats["calls_per_minute"] == 3
+        # The failed calls are still within the hour
+        assert stats["calls_per_hour"] == 5
+        
+        with patch('time.time', return_value=13_651):
+            small_tracker.record_api_call("test_api", 300.0, True)
+            stats = small_tracker.get_api_performance("test_api")
+        
+        assert stats["min_response_time"] == 100.0
+        assert stats["success_rate"] == 80.0
+        assert stats["calls_per_minute"] == 1
+        assert stats["calls_per_hour"] == 4
+        assert stats["recent_success_rate"] == 100.0
+        assert stats["recent_avg_response_time"] == pytest.approx((603 + 300) / 4)
@@ -0,0 +1,221 @@
+"""
+Tests for incremental sliding-window statistics.
+"""
+
+import bisect
+import random
+import statistics
+from collections import deque
+
+import pytest
+
+from src.monitoring.rolling_stats import RingBuffer, RollingStats, SlidingTrend
+
+
+class TestRollingStats:
+    """Test RollingStats aggregates against a brute-force rescan."""
+
+    def test_empty_window(self):
+        """Test aggregates of an empty window."""
+        stats = RollingStats(window=5)
+        assert stats.count == 0
+        assert stats.average() == 0.0
+        assert stats.minimum() == 0.0
+        assert stats.peak() == 0.0
+        assert stats.pop_oldest() is None
+
+    def test_invalid_window(self):
+        """Test that a non-positive window is rejected."""
+        with pytest.raises(ValueError):
+            RollingStats(window=0)
+
+    def test_window_eviction(self):
+        """Test that values older than the window are evicted."""
+        stats = RollingStats(window=3)
+        for value in [5.0, 1.0, 9.0, 4.0]:
+            stats.push(value)
+
+        assert stats.count == 3
+        assert stats.total == pytest.approx(14.0)
+        assert stats.minimum() == 1.0
+        assert stats.peak() == 9.0
+
+        stats.push(2.0)  # evicts 1.0
+        assert stats.minimum() == 2.0
+        assert stats.peak() == 9.0
+
+        stats.push(3.0)  # evicts 9.0
+        assert stats.peak() == 4.0
+        assert stats.average() == pytest.approx(3.0)
+
+    def test_trim_and_clear(self):
+        """Test trimming to a smaller size and clearing."""
+        stats = RollingStats(window=10)
+        for value in range(10):
+            stats.push(float(value))
+
+        stats.trim(4)
+        assert stats.count == 4
+        assert stats.minimum() == 6.0
+        assert stats.peak() == 9.0
+        assert stats.average() == pytest.approx(7.5)
+
+        stats.clear()
+        assert stats.count == 0
+        stats.push(3.0)
+        assert stats.minimum() == stats.peak() == 3.0
+
+    def test_matches_rescan(self):
+        """Test aggregates against a full rescan over a random stream."""
+        rng = random.Random(42)
+        window = 7
+        stats = RollingStats(window=window)
+        values = []
+
+        for _ in range(200):
+            value = rng.uniform(0, 1000)
+            values.append(value)
+            stats.push(value)
+
+            expected = values[-window:]
+            assert stats.count == len(expected)
+            assert stats.average() == pytest.approx(sum(expected) / len(expected))
+            assert stats.minimum() == min(expected)
+            assert stats.peak() == max(expected)
+
+
+class TestRingBuffer:
+    """Test RingBuffer against a bounded deque."""
+
+    def test_wraparound_matches_deque(self):
+        """Test append, popleft, indexing and slicing across wraparound."""
+        ring = RingBuffer(5)
+        reference = deque(maxlen=5)
+
+        for value in range(13):
+            ring.append(float(value))
+            reference.append(float(value))
+            if value % 4 == 3:
+                assert ring.popleft() == reference.popleft()
+
+            assert len(ring) == len(reference)
+            assert list(ring) == list(reference)
+            assert ring[-1] == reference[-1]
+            assert ring[0] == reference[0]
+            assert ring.slice(1, 3) == list(reference)[1:3]
+            assert ring.tail(2) == list(reference)[-2:]
+
+    def test_bisect_on_sorted_values(self):
+        """Test that a sorted buffer can be bisected directly."""
+        ring = RingBuffer(4)
+        for value in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+            ring.append(value)
+
+        assert bisect.bisect_left(ring, 4.0) == 1
+        assert bisect.bisect_right(ring, 5.5) == 3
+
+    def test_empty_buffer(self):
+        """Test empty buffer behaviour."""
+        ring = RingBuffer(3)
+        assert len(ring) == 0
+        assert ring.slice(0, 3) == []
+        with pytest.raises(IndexError):
+            ring[0]
+        with pytest.raises(IndexError):
+            ring.popleft()
+
+    def test_quantized_values(self):
+        """Test that scaled buffers round values to the scale step."""
+        ring = RingBuffer(3, "I", scale=0.1)
+        for value in [2000.04, 2385.0, 6553.6, 123456.78]:
+            ring.append(value)
+
+        assert list(ring) == [2385.0, 6553.6, 123456.8]
+        assert ring.tail(1) == [123456.8]
+        assert ring[-3] == 2385.0
+        assert ring.popleft() == 2385.0
+
+
+def reference_trend(values):
+    """Two-pass least-squares trend, as the degradation detector used to compute it."""
+    n = len(values)
+    x_mean = (n - 1) / 2
+    y_mean = sum(values) / n
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in enumerate(values))
+    x_variance = sum((x - x_mean) ** 2 for x in range(n))
+    y_variance = sum((y - y_mean) ** 2 for y in values)
+    split_point = max(1, n // 3)
+    return {
+        "slope": numerator / x_variance,
+        "correlation": numerator / (x_variance * y_variance) ** 0.5 if y_variance else 0,
+        "baseline_avg": sum(values[:split_point]) / split_point,
+        "recent_avg": sum(values[-split_point:]) / split_point,
+    }
+
+
+class TestSlidingTrend:
+    """Test SlidingTrend against a two-pass refit of the window."""
+
+    def test_short_window(self):
+        """Test the snapshot of fewer than two values."""
+        trend = SlidingTrend(window=5)
+        trend.push(0, 3.0)
+        assert trend.snapshot() == {"slope": 0, "correlation": 0, "recent_avg": 0, "baseline_avg": 0}
+
+    def test_constant_series_has_no_correlation(self):
+        """Test that rounding noise on a flat series does not read as a trend."""
+        trend = SlidingTrend(window=10)
+        for i in range(25):
+            trend.push(i, 0.1)
+
+        snapshot = trend.snapshot()
+        assert snapshot["correlation"] == 0
+        assert snapshot["slope"] == pytest.approx(0.0, abs=1e-12)
+        assert snapshot["change_percent"] == pytest.approx(0.0, abs=1e-9)
+
+    def test_evict_through_key(self):
+        """Test trimming the window by key."""
+        trend = SlidingTrend(window=10)
+        for i in range(6):
+            trend.push(float(i), 2.0 * i)
+
+        trend.evict_through(2.0)
+        assert len(trend) == 3
+        assert trend.snapshot()["slope"] == pytest.approx(2.0)
+        assert trend.snapshot()["baseline_avg"] == pytest.approx(6.0)
+
+    def test_matches_refit(self):
+        """Test incremental statistics against a refit after every push."""
+        rng = random.Random(7)
+        trend = SlidingTrend(window=50)
+        window = deque(maxlen=50)
+        for i in range(400):
+            value = 100.0 + i * 0.5 + rng.uniform(-20.0, 20.0)
+            trend.push(i, value)
+            window.append(value)
+            if i % 3 == 0 and len(window) > 20:
+                trend.pop_oldest()
+                window.popleft()
+            if len(window) < 2:
+                continue
+
+            expected = reference_trend(list(window))
+            snapshot = trend.snapshot()
+            for key, value in expected.items():
+                assert snapshot[key] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+    def test_pearson_correlation(self):
+        """Test slope and correlation against the standard library's fits."""
+        rng = random.Random(11)
+        trend = SlidingTrend(window=30)
+        values = []
+        for i in range(30):
+            value = 5.0 - i * 0.2 + rng.gauss(0.0, 1.5)
+            trend.push(i, value)
+            values.append(value)
+
+        snapshot = trend.snapshot()
+        keys = list(range(30))
+        assert snapshot["correlation"] == pytest.approx(statistics.correlation(keys, values), rel=1e-9)
+        assert snapshot["slope"] == pytest.approx(statistics.linear_regression(keys, values).slope, rel=1e-9)
+        assert -1.0 < snapshot["correlation"] < 0.0
@@ -76,6 +76,7 @@ def test_init_scheduler_pipeline_v2_uses_system_jobs_and_starts_worker():
     assert "token_processing_monitor" in job_ids
     assert "health_summary" in job_ids
     assert "performance_optimizer" in job_ids
+    assert "performance_data_cleanup" in job_ids
     assert "notarb_pools_updater" in job_ids
 
     assert "hot_updater" not in job_ids